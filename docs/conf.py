@@ -94,6 +94,8 @@ rst_epilog = """
 
 .. |AttributeError| replace:: :exc:`.AttributeError`
 
+.. |AutoShapeSpec| replace:: :class:`.AutoShapeSpec`
+
 .. |Axis| replace:: :class:`.Axis`
 
 .. |AxisTitle| replace:: :class:`.AxisTitle`
@@ -168,6 +170,8 @@ rst_epilog = """
 
 .. |Connector| replace:: :class:`.Connector`
 
+.. |ConnectorSpec| replace:: :class:`.ConnectorSpec`
+
 .. |CoreProperties| replace:: :class:`.CoreProperties`
 
 .. |DataLabel| replace:: :class:`.DataLabel`
@@ -276,6 +280,8 @@ rst_epilog = """
 
 .. |Picture| replace:: :class:`.Picture`
 
+.. |PictureSpec| replace:: :class:`.PictureSpec`
+
 .. |PieSeries| replace:: :class:`.PieSeries`
 
 .. |_PlaceholderFormat| replace:: :class:`._PlaceholderFormat`
@@ -298,6 +304,8 @@ rst_epilog = """
 
 .. |RadarSeries| replace:: :class:`.RadarSeries`
 
+.. |ReadOnlyPackageError| replace:: :class:`.ReadOnlyPackageError`
+
 .. |_Relationship| replace:: :class:`._Relationship`
 
 .. |_Relationships| replace:: :class:`_Relationships`
@@ -320,6 +328,10 @@ rst_epilog = """
 
 .. |ShapeCollection| replace:: :class:`.ShapeCollection`
 
+.. |ShapeIdAllocator| replace:: :class:`.ShapeIdAllocator`
+
+.. |ShapeSpatialIndex| replace:: :class:`.ShapeSpatialIndex`
+
 .. |Slide| replace:: :class:`.Slide`
 
 .. |Slides| replace:: :class:`.Slides`
@@ -346,6 +358,8 @@ rst_epilog = """
 
 .. |TextFrame| replace:: :class:`.TextFrame`
 
+.. |TextboxSpec| replace:: :class:`.TextboxSpec`
+
 .. |TickLabels| replace:: :class:`.TickLabels`
 
 .. |True| replace:: :class:`True`
@@ -0,0 +1,67 @@
+"""Benchmark adding many auto shapes to one slide.
+
+Adds `n_shapes` rectangles (2,000 by default) to a new slide three ways: one at a time with
+`add_shape()`, which searches every shape id on the slide for each new shape; one at a time with
+turbo-add enabled; and in a single `add_shapes()` call. Then adds `n_bulk` rectangles (100,000
+by default) with `add_shapes()` alone, since adding that many one at a time would take hours.
+Run from the repository root:
+
+    python lab/benchmarks/bench_add_shapes.py [n_shapes [n_bulk]]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.shapes.shapetree import AutoShapeSpec, SlideShapes
+from pptx.util import Emu
+
+
+def specs(n_shapes: int) -> list[AutoShapeSpec]:
+    return [
+        AutoShapeSpec(MSO_SHAPE.RECTANGLE, Emu(n * 100), Emu(n * 100), Emu(91440), Emu(91440))
+        for n in range(n_shapes)
+    ]
+
+
+def add_singly(shapes: SlideShapes, n_shapes: int):
+    for spec in specs(n_shapes):
+        shapes.add_shape(*spec)
+
+
+def add_singly_turbo(shapes: SlideShapes, n_shapes: int):
+    shapes.turbo_add_enabled = True
+    add_singly(shapes, n_shapes)
+
+
+def add_in_bulk(shapes: SlideShapes, n_shapes: int):
+    shapes.add_shapes(specs(n_shapes))
+
+
+def seconds_to_add(add: Callable[[SlideShapes, int], None], n_shapes: int) -> float:
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    start = time.perf_counter()
+    add(shapes, n_shapes)
+    return time.perf_counter() - start
+
+
+def main():
+    n_shapes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_bulk = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    for label, add in (
+        ("add_shape()", add_singly),
+        ("add_shape() turbo", add_singly_turbo),
+        ("add_shapes()", add_in_bulk),
+    ):
+        print("%-20s %7d shapes  %7.2f s" % (label, n_shapes, seconds_to_add(add, n_shapes)))
+    bulk_seconds = seconds_to_add(add_in_bulk, n_bulk)
+    print("%-20s %7d shapes  %7.2f s" % ("add_shapes()", n_bulk, bulk_seconds))
+
+
+if __name__ == "__main__":
+    main()
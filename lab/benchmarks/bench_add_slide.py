@@ -0,0 +1,47 @@
+"""Benchmark adding slides that clone the placeholders of their slide layout.
+
+Adds `n_slides` slides (1,000 by default) based on the "Title and Content" layout of the default
+template, each followed by `n_shapes` text boxes (50 by default), and then clones the layout
+placeholders onto each slide again. Cloning a placeholder searches the names already used on the
+slide for a unique name, so the second round of cloning shows the cost of that search on a slide
+holding many shapes. Run from the repository root:
+
+    python lab/benchmarks/bench_add_slide.py [n_slides [n_shapes]]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from pptx import Presentation
+from pptx.util import Emu
+
+
+def main():
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_shapes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    prs = Presentation()
+    slide_layout = prs.slide_layouts[1]
+
+    start = time.perf_counter()
+    slides = [prs.slides.add_slide(slide_layout) for _ in range(n_slides)]
+    add_slide_seconds = time.perf_counter() - start
+
+    for slide in slides:
+        for n in range(n_shapes):
+            slide.shapes.add_textbox(Emu(n), Emu(n), Emu(100), Emu(100))
+
+    start = time.perf_counter()
+    for slide in slides:
+        slide.shapes.clone_layout_placeholders(slide_layout)
+    clone_seconds = time.perf_counter() - start
+
+    print(
+        "add_slide(): %.0f slides/s; cloning placeholders onto slides of %d shapes: %.0f slides/s"
+        % (n_slides / add_slide_seconds, n_shapes, n_slides / clone_seconds)
+    )
+
+
+if __name__ == "__main__":
+    main()
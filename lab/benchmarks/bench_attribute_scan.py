@@ -0,0 +1,75 @@
+"""Benchmark reading enumeration and simple-type attributes across a whole deck.
+
+Builds a deck of 50 slides by default, each with 40 auto shapes of varying preset geometry that
+each hold a run of text with a language and font attributes, saves it and loads it back. It then
+times a scan that reads every shape's preset geometry (`MSO_AUTO_SHAPE_TYPE`), position and size
+(`ST_Coordinate` and `ST_PositiveCoordinate`) and every run's language (`MSO_LANGUAGE_ID`), bold
+(`XsdBoolean`) and size (`ST_TextFontSize`), all through the `xmlchemy` attribute properties.
+Run from the repository root:
+
+    python lab/benchmarks/bench_attribute_scan.py [n_slides]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import timeit
+
+from pptx import Presentation
+from pptx.enum.lang import MSO_LANGUAGE_ID
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches, Pt
+
+SHAPES_PER_SLIDE = 40
+AUTO_SHAPE_TYPES = [t for t in MSO_SHAPE if t.xml_value][::7]
+LANGUAGES = [MSO_LANGUAGE_ID.ENGLISH_US, MSO_LANGUAGE_ID.GERMAN, MSO_LANGUAGE_ID.JAPANESE]
+
+
+def build_deck(n_slides: int) -> bytes:
+    prs = Presentation()
+    for slide_idx in range(n_slides):
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        for shape_idx in range(SHAPES_PER_SLIDE):
+            n = slide_idx * SHAPES_PER_SLIDE + shape_idx
+            shape = shapes.add_shape(
+                AUTO_SHAPE_TYPES[n % len(AUTO_SHAPE_TYPES)],
+                Inches(shape_idx % 8),
+                Inches(shape_idx // 8),
+                Inches(1),
+                Inches(1),
+            )
+            font = shape.text_frame.paragraphs[0].add_run().font
+            font.language_id = LANGUAGES[n % len(LANGUAGES)]
+            font.bold = True
+            font.size = Pt(12 + n % 4)
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def scan(sp_lst: list, rPr_lst: list):
+    for sp in sp_lst:
+        sp.prst
+        xfrm = sp.spPr.xfrm
+        xfrm.x, xfrm.y, xfrm.cx, xfrm.cy
+    for rPr in rPr_lst:
+        rPr.lang, rPr.b, rPr.sz
+
+
+def main():
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    prs = Presentation(io.BytesIO(build_deck(n_slides)))
+    sp_lst = [shape._element for slide in prs.slides for shape in slide.shapes]
+    rPr_lst = [rPr for sp in sp_lst for rPr in sp.xpath(".//a:rPr")]
+
+    elapsed = min(timeit.repeat(lambda: scan(sp_lst, rPr_lst), number=5, repeat=3)) / 5
+    n_reads = len(sp_lst) * 5 + len(rPr_lst) * 3
+    print(
+        "%d shapes, %d attribute reads: %.1f ms per scan, %.2f us per read"
+        % (len(sp_lst), n_reads, elapsed * 1e3, elapsed / n_reads * 1e6)
+    )
+
+
+if __name__ == "__main__":
+    main()
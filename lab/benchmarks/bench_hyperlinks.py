@@ -0,0 +1,66 @@
+"""Benchmark adding many hyperlinks to a single slide.
+
+Each hyperlinked run gets an external relationship from the slide part, so a slide with many
+links exercises rId allocation and the lookup of an existing relationship to the same URL. Adds
+20,000 links by default, one run each, with every tenth URL a repeat of an earlier one. The
+relationships alone are also timed by relating a fresh slide part to the same URLs directly,
+without the runs and their XML. Run from the repository root:
+
+    python lab/benchmarks/bench_hyperlinks.py [n_links]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.util import Inches
+
+
+def url(n: int) -> str:
+    url_n = n // 2 if n % 10 == 9 else n
+    return "https://example.com/page/%d" % url_n
+
+
+def add_links(n_links: int) -> tuple[float, int]:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(8), Inches(5)).text_frame
+    paragraph = text_frame.paragraphs[0]
+
+    start = time.perf_counter()
+    for n in range(n_links):
+        run = paragraph.add_run()
+        run.text = "link %d " % n
+        run.hyperlink.address = url(n)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, len(slide.part.rels)
+
+
+def add_rels(n_links: int) -> tuple[float, int]:
+    prs = Presentation()
+    slide_part = prs.slides.add_slide(prs.slide_layouts[6]).part
+
+    start = time.perf_counter()
+    for n in range(n_links):
+        slide_part.relate_to(url(n), RT.HYPERLINK, is_external=True)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, len(slide_part.rels)
+
+
+def main():
+    n_links = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for label, add in (("runs", add_links), ("rels only", add_rels)):
+        elapsed, n_rels = add(n_links)
+        print(
+            "%-9s  %d links  %7.3fs  (%.1f us/link, %d relationships)"
+            % (label, n_links, elapsed, elapsed / n_links * 1e6, n_rels)
+        )
+
+
+if __name__ == "__main__":
+    main()
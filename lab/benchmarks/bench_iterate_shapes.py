@@ -0,0 +1,77 @@
+"""Benchmark visiting every shape, paragraph, run and font of a deck more than once.
+
+Builds a deck of `n_slides` slides (100 by default), each holding `n_shapes` text boxes (50 by
+default) of three paragraphs of two runs each, then makes `n_passes` passes (3 by default) over
+every shape, reading the text frame, paragraphs, runs and run fonts of each, the way a tool that
+inspects a deck in several steps would. The passes are timed once as they are and once within a
+`proxy_identity_map()` block, where each proxy object is created only on the first pass. Run from
+the repository root:
+
+    python lab/benchmarks/bench_iterate_shapes.py [n_slides [n_shapes [n_passes]]]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING, Callable
+
+from pptx import Presentation
+from pptx.shapes.shapetree import TextboxSpec
+from pptx.util import Emu, proxy_identity_map
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation as PresentationObj
+
+
+def build_deck(n_slides: int, n_shapes: int) -> PresentationObj:
+    prs = Presentation()
+    for _ in range(n_slides):
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        shapes.add_shapes(
+            [TextboxSpec(Emu(n), Emu(n), Emu(100), Emu(100)) for n in range(n_shapes)]
+        )
+        for shape in shapes:
+            text_frame = shape.text_frame
+            text_frame.text = "foo\nbar\nbaz"
+            for paragraph in text_frame.paragraphs:
+                paragraph.add_run().text = " and more"
+    return prs
+
+
+def visit_all(prs: PresentationObj, n_passes: int):
+    for _ in range(n_passes):
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                for paragraph in shape.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.bold
+
+
+def visit_all_identity_mapped(prs: PresentationObj, n_passes: int):
+    with proxy_identity_map():
+        visit_all(prs, n_passes)
+
+
+def seconds(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    n_shapes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    n_passes = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    prs = build_deck(n_slides, n_shapes)
+
+    print("%d slides of %d shapes, %d passes" % (n_slides, n_shapes, n_passes))
+    print("  new proxies on every access   %8.3f s" % seconds(lambda: visit_all(prs, n_passes)))
+    print(
+        "  within proxy_identity_map()   %8.3f s"
+        % seconds(lambda: visit_all_identity_mapped(prs, n_passes))
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Micro-benchmark the generated properties of a few hot custom element classes.
+
+Times reading and writing child-element and attribute properties generated by the `xmlchemy`
+descriptors on `CT_Shape`, `CT_TextParagraph` and `CT_TableCell`, along with `qn()` itself,
+which those properties and the `BaseOxmlElement` helpers call on their hot paths. Each operation
+is repeated 200,000 times by default. Run from the repository root:
+
+    python lab/benchmarks/bench_oxml_properties.py [n_reps]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import Any, Callable, cast
+
+from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.table import CT_TableCell
+from pptx.oxml.text import CT_TextParagraph
+from pptx.util import Emu
+
+
+def operations() -> list[tuple[str, Callable[[], Any]]]:
+    sp = CT_Shape.new_autoshape_sp(2, "Rectangle 1", "rect", 0, 0, 914400, 914400)
+    p = cast(CT_TextParagraph, sp.get_or_add_txBody().p_lst[0])
+    pPr = p.get_or_add_pPr()
+    p.add_r().text = "foobar"
+    tc = CT_TableCell.new()
+    tcPr = tc.get_or_add_tcPr()
+
+    def set_algn():
+        pPr.algn = PP_PARAGRAPH_ALIGNMENT.CENTER
+
+    def set_marL():
+        tcPr.marL = Emu(45720)
+
+    def set_gridSpan():
+        tc.gridSpan = 2
+
+    return [
+        ("qn('a:p')", lambda: qn("a:p")),
+        ("CT_Shape.spPr", lambda: sp.spPr),
+        ("CT_Shape.txBody", lambda: sp.txBody),
+        ("CT_Shape.prst", lambda: sp.prst),
+        ("CT_Shape.is_autoshape", lambda: sp.is_autoshape),
+        ("CT_TextParagraph.pPr", lambda: p.pPr),
+        ("CT_TextParagraph.r_lst", lambda: p.r_lst),
+        ("CT_TextParagraph.algn get", lambda: pPr.algn),
+        ("CT_TextParagraph.algn set", set_algn),
+        ("CT_TableCell.tcPr", lambda: tc.tcPr),
+        ("CT_TableCell.marL get", lambda: tc.marL),
+        ("CT_TableCell.marL set", set_marL),
+        ("CT_TableCell.gridSpan set", set_gridSpan),
+        ("CT_TableCell.get_or_add_txBody", lambda: tc.get_or_add_txBody()),
+    ]
+
+
+def main():
+    n_reps = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for label, operation in operations():
+        elapsed = min(timeit.repeat(operation, number=n_reps, repeat=3))
+        print("%-30s %7.3f us" % (label, elapsed / n_reps * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark `Presentation.save()` with and without a pool of compression workers.
+
+Builds a 1,000-slide deck, each slide with a title, a text box and a table, then times saving
+it serially and with `workers=N` for a few values of N. Run from the repository root:
+
+    python lab/benchmarks/bench_save_workers.py [n_slides]
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import time
+
+from pptx import Presentation
+from pptx.util import Inches
+
+
+def build_deck(n_slides: int):
+    prs = Presentation()
+    layout = prs.slide_layouts[5]
+    for n in range(n_slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = "Slide %d" % (n + 1)
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(1))
+        textbox.text_frame.text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+        table = slide.shapes.add_table(8, 6, Inches(1), Inches(3), Inches(8), Inches(3)).table
+        for r in range(8):
+            for c in range(6):
+                table.cell(r, c).text = "r%dc%d" % (r, c)
+    return prs
+
+
+def time_save(prs, workers: int | None, repeat: int = 3) -> tuple[float, bytes]:
+    best = float("inf")
+    blob = b""
+    for _ in range(repeat):
+        stream = io.BytesIO()
+        start = time.perf_counter()
+        prs.save(stream, workers=workers)
+        best = min(best, time.perf_counter() - start)
+        blob = stream.getvalue()
+    return best, blob
+
+
+def main():
+    n_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print("building %d-slide deck ..." % n_slides)
+    prs = build_deck(n_slides)
+
+    serial, serial_blob = time_save(prs, None)
+    print("workers=None  %7.3fs  (%d bytes)" % (serial, len(serial_blob)))
+    for workers in (2, 4, 8):
+        if workers > (os.cpu_count() or 1) * 2:
+            break
+        elapsed, blob = time_save(prs, workers)
+        print(
+            "workers=%-4d  %7.3fs  (%d bytes)  speed-up x%.2f"
+            % (workers, elapsed, len(blob), serial / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark looking up shapes by position, shape id and name on a slide holding many shapes.
+
+Adds `n_shapes` text boxes (2,000 by default) to a slide, then times visiting every shape by
+position with `shapes[i]`, and finding every shape by id and by name, both with `shapes.by_id`
+and `shapes.by_name` and with the loop over the collection those replace. Run from the
+repository root:
+
+    python lab/benchmarks/bench_shape_lookup.py [n_shapes]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from pptx import Presentation
+from pptx.shapes.shapetree import SlideShapes, TextboxSpec
+from pptx.util import Emu
+
+
+def by_position(shapes: SlideShapes):
+    for idx in range(len(shapes)):
+        shapes[idx]
+
+
+def by_id_loop(shapes: SlideShapes, shape_ids: list[int]):
+    for shape_id in shape_ids:
+        next(shape for shape in shapes if shape.shape_id == shape_id)
+
+
+def by_id_map(shapes: SlideShapes, shape_ids: list[int]):
+    for shape_id in shape_ids:
+        shapes.by_id[shape_id]
+
+
+def by_name_map(shapes: SlideShapes, names: list[str]):
+    for name in names:
+        shapes.by_name[name]
+
+
+def seconds(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n_shapes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    shapes.add_shapes([TextboxSpec(Emu(n), Emu(n), Emu(100), Emu(100)) for n in range(n_shapes)])
+    shape_ids = [shape.shape_id for shape in shapes]
+    names = [shape.name for shape in shapes]
+    # -- looping over the collection for every shape is quadratic, so time a sample of them --
+    sample = shape_ids[:: max(1, n_shapes // 100)]
+
+    print("%d shapes" % n_shapes)
+    print("  shapes[i] for every shape     %8.3f s" % seconds(lambda: by_position(shapes)))
+    print("  by_id for every shape         %8.3f s" % seconds(lambda: by_id_map(shapes, shape_ids)))
+    print("  by_name for every shape       %8.3f s" % seconds(lambda: by_name_map(shapes, names)))
+    loop_seconds = seconds(lambda: by_id_loop(shapes, sample)) * len(shape_ids) / len(sample)
+    print("  loop by id for every shape    %8.3f s (estimated)" % loop_seconds)
+
+
+if __name__ == "__main__":
+    main()
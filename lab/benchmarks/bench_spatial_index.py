@@ -0,0 +1,93 @@
+"""Benchmark finding overlapping shapes and hit-testing on a slide holding many shapes.
+
+Adds `n_shapes` small rectangles (2,000 by default) at random positions on a slide, then times
+finding every pair of overlapping shapes with a pairwise loop over `left`, `top`, `width` and
+`height` and with `shapes.spatial_index.overlapping_pairs()`. Also times 1,000 `shapes_at()` hit
+tests, and finding the overlapping pairs again after moving 100 of the shapes, which re-records
+only the shapes moved. The pairwise loop is quadratic, so it is timed on a sample of the shapes
+and scaled up. Run from the repository root:
+
+    python lab/benchmarks/bench_spatial_index.py [n_shapes]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import TYPE_CHECKING, Callable
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.shapes.shapetree import AutoShapeSpec
+from pptx.util import Emu
+
+if TYPE_CHECKING:
+    from pptx.shapes.base import BaseShape
+
+SLIDE_SIZE = 9144000
+SHAPE_SIZE = 91440
+
+
+def pairwise_overlaps(shapes: list[BaseShape]) -> int:
+    count = 0
+    for i, a in enumerate(shapes):
+        for b in shapes[i + 1 :]:
+            if (
+                a.left < b.left + b.width
+                and b.left < a.left + a.width
+                and a.top < b.top + b.height
+                and b.top < a.top + a.height
+            ):
+                count += 1
+    return count
+
+
+def seconds(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n_shapes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(42)
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    shapes.add_shapes(
+        [
+            AutoShapeSpec(
+                MSO_SHAPE.RECTANGLE,
+                Emu(rng.randrange(SLIDE_SIZE)),
+                Emu(rng.randrange(SLIDE_SIZE)),
+                Emu(SHAPE_SIZE),
+                Emu(SHAPE_SIZE),
+            )
+            for _ in range(n_shapes)
+        ]
+    )
+    spatial_index = shapes.spatial_index
+    all_shapes = list(shapes)
+    sample = all_shapes[:200]
+    points = [(Emu(rng.randrange(SLIDE_SIZE)), Emu(rng.randrange(SLIDE_SIZE))) for _ in range(1000)]
+
+    def hit_test():
+        for x, y in points:
+            spatial_index.shapes_at(x, y)
+
+    def move_and_query():
+        for shape in all_shapes[:100]:
+            shape.left = Emu(rng.randrange(SLIDE_SIZE))
+        spatial_index.overlapping_pairs()
+
+    loop_seconds = seconds(lambda: pairwise_overlaps(sample)) * (n_shapes / len(sample)) ** 2
+    print("%d shapes" % n_shapes)
+    print("  pairwise loop                 %8.3f s (estimated)" % loop_seconds)
+    print("  overlapping_pairs(), first    %8.3f s" % seconds(spatial_index.overlapping_pairs))
+    print("  overlapping_pairs(), again    %8.3f s" % seconds(spatial_index.overlapping_pairs))
+    print("  1000 shapes_at() hit tests    %8.3f s" % seconds(hit_test))
+    print("  move 100, overlapping_pairs() %8.3f s" % seconds(move_and_query))
+
+
+if __name__ == "__main__":
+    main()
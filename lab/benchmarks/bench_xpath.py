@@ -0,0 +1,60 @@
+"""Benchmark `BaseOxmlElement.xpath()` with and without its cache of compiled expressions.
+
+Builds a slide with 200 shapes by default and evaluates a few of the expressions used on hot
+paths: whole-tree ones like those behind `max_shape_id` and placeholder naming, and small
+per-shape ones like those behind placeholder lookups. Each is timed through the cached
+`BaseOxmlElement.xpath()` and through plain lxml `_Element.xpath()`, which compiles the
+expression on every call. Run from the repository root:
+
+    python lab/benchmarks/bench_xpath.py [n_shapes]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from lxml import etree
+
+from pptx import Presentation
+from pptx.oxml.ns import _nsmap  # pyright: ignore[reportPrivateUsage]
+from pptx.oxml.xmlchemy import xpath_cache_info
+from pptx.util import Inches
+
+EXPRESSIONS = (
+    ("spTree", "//@id"),
+    ("spTree", "//p:cNvPr/@name"),
+    ("spTree", "./p:sp[p:nvSpPr/p:nvPr/p:ph]"),
+    ("sp", "./p:nvSpPr/p:nvPr/p:ph"),
+    ("sp", "./p:spPr/a:prstGeom/@prst"),
+)
+
+
+def main():
+    n_shapes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    for n in range(n_shapes):
+        shapes.add_shape(1, Inches(n % 10), Inches(1), Inches(1), Inches(1))
+    elements = {"spTree": shapes._spTree, "sp": shapes._spTree[-1]}  # pyright: ignore
+
+    for context, expr in EXPRESSIONS:
+        elm = elements[context]
+        number = 20000 if context == "sp" else 200
+        cached = min(timeit.repeat(lambda: elm.xpath(expr), number=number, repeat=3))
+        uncached = min(
+            timeit.repeat(
+                lambda: etree._Element.xpath(elm, expr, namespaces=_nsmap),  # pyright: ignore
+                number=number,
+                repeat=3,
+            )
+        )
+        print(
+            "%-6s %-32s compiled %8.2f us  uncompiled %8.2f us  (%.1fx)"
+            % (context, expr, cached / number * 1e6, uncached / number * 1e6, uncached / cached)
+        )
+    print(xpath_cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ import sys
 from typing import TYPE_CHECKING
 
 import pptx.exc as exceptions
-from pptx.api import Presentation
+from pptx.api import Presentation, peek
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import PartFactory
 from pptx.parts.chart import ChartPart
@@ -30,7 +30,7 @@ __version__ = "1.0.4+PPTAgent"
 sys.modules["pptx.exceptions"] = exceptions
 del sys
 
-__all__ = ["Presentation"]
+__all__ = ["Presentation", "peek"]
 
 content_type_to_part_class_map: dict[str, type[Part]] = {
     CT.PML_PRESENTATION_MAIN: PresentationPart,
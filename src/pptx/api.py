@@ -1,4 +1,4 @@
-"""Directly exposed API classes, Presentation for now.
+"""Directly exposed API classes and functions, Presentation and peek().
 
 Provides some syntactic sugar for interacting with the pptx.presentation.Package graph and also
 provides some insulation so not so many classes in the other modules need to be named as internal
@@ -8,35 +8,98 @@ provides some insulation so not so many classes in the other modules need to be
 from __future__ import annotations
 
 import os
-from typing import IO, TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.serialized import PackageReader
 from pptx.package import Package
+from pptx.summary import read_summary
 
 if TYPE_CHECKING:
     from pptx import presentation
+    from pptx.opc.serialized import PkgFile
     from pptx.parts.presentation import PresentationPart
+    from pptx.summary import PresentationSummary
 
 
-def Presentation(pptx: str | IO[bytes] | None = None) -> presentation.Presentation:
+def Presentation(
+    pptx: PkgFile | None = None,
+    *,
+    lazy: bool = False,
+    read_only: bool = False,
+    slides: Iterable[int] | None = None,
+) -> presentation.Presentation:
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    *pptx* can also be the package itself as ``bytes``, a ``memoryview`` or an
+    ``mmap.mmap``. The package is read in place, without first being copied
+    into a file-like object.
+
+    When *lazy* is |True|, the package file is held open and binary parts such
+    as images and video are only read from it when they are needed. Parts and
+    their relationships are likewise only loaded when first reached, so
+    opening a large presentation to read a little of it is quick. The
+    presentation should then be closed by calling its
+    :meth:`~pptx.presentation.Presentation.close` method or by using it as a
+    context manager.
+
+    When *read_only* is |True|, the presentation is read lazily in the same
+    way and can not be saved. Any change that would add, remove or rename a
+    part raises |ReadOnlyPackageError|, so none of the bookkeeping needed only
+    to change a presentation is done. A read-only presentation can be read
+    from more than one thread at a time.
+
+    When *slides* is provided, only the slides at those (zero-based)
+    positions are loaded, like ``slides=range(10, 20)``, along with the
+    layouts, masters, images and other parts they use. The presentation is
+    read lazily and contains only those slides, in their original order, so
+    opening it takes time and memory in proportion to the slides requested.
+    Unless opened read-only, it can be saved as a smaller presentation
+    holding just those slides.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    if read_only:
+        package = Package.open(pptx, read_only=True)
+    elif lazy or slides is not None:
+        package = Package.open(pptx, lazy=True)
+    else:
+        package = Package.open(pptx)
+    presentation_part = package.main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
-        raise ValueError(tmpl % (pptx, presentation_part.content_type))
+        file_desc = pptx if isinstance(pptx, str) else "<%s>" % type(pptx).__name__
+        raise ValueError(tmpl % (file_desc, presentation_part.content_type))
+
+    if slides is not None:
+        presentation_part.retain_slides(slides)
 
     return presentation_part.presentation
 
 
+def peek(pptx: PkgFile) -> PresentationSummary:
+    """
+    Return a |PresentationSummary| of the presentation in *pptx*, which can be
+    anything accepted by :func:`Presentation`.
+
+    The summary holds the core properties, slide count and the title text of
+    each slide. Only the few package items needed for these are read, and no
+    parts or other objects of a loaded presentation are constructed, so this
+    is much quicker than opening the presentation, especially a large one.
+    """
+    package_reader = PackageReader(pptx, lazy=True)
+    try:
+        return read_summary(package_reader)
+    finally:
+        package_reader.close()
+
+
 def _default_pptx_path() -> str:
     """Return the path to the built-in default .pptx package."""
     _thisdir = os.path.split(__file__)[0]
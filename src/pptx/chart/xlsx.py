@@ -5,8 +5,6 @@ from __future__ import annotations
 import io
 from contextlib import contextmanager
 
-from xlsxwriter import Workbook
-
 
 class _BaseWorkbookWriter(object):
     """Base class for workbook writers, providing shared members."""
@@ -31,6 +29,9 @@ class _BaseWorkbookWriter(object):
         stream object (such as an `io.BytesIO` instance) is expected as
         *xlsx_file*.
         """
+        # -- XlsxWriter is imported on first use, it is slow to import --
+        from xlsxwriter import Workbook
+
         workbook = Workbook(xlsx_file, {"in_memory": True})
         worksheet = workbook.add_worksheet()
         yield workbook, worksheet
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from xml.sax.saxutils import escape
 
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.oxml import parse_xml
@@ -113,7 +112,7 @@ class _BaseSeriesXmlWriter(object):
         """
         The XML-escaped name for this series.
         """
-        return escape(self._series.name)
+        return _escape(self._series.name)
 
     def numRef_xml(self, wksht_ref, number_format, values):
         """
@@ -1513,7 +1512,7 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
                 '                <c:pt idx="{cat_idx}">\n'
                 "                  <c:v>{cat_label}</c:v>\n"
                 "                </c:pt>\n"
-            ).format(**{"cat_idx": idx, "cat_label": escape(str(category.label))})
+            ).format(**{"cat_idx": idx, "cat_label": _escape(str(category.label))})
         return xml
 
     @property
@@ -1547,7 +1546,7 @@ class _CategorySeriesXmlWriter(_BaseSeriesXmlWriter):
                     '                  <c:pt idx="%d">\n'
                     "                    <c:v>%s</c:v>\n"
                     "                  </c:pt>\n"
-                ) % (idx, escape("%s" % name))
+                ) % (idx, _escape("%s" % name))
             return xml
 
         xml = ""
@@ -1838,3 +1837,14 @@ class _XySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         ser._insert_tx(xml_writer.tx)
         ser._insert_xVal(xml_writer.xVal)
         ser._insert_yVal(xml_writer.yVal)
+
+
+def _escape(text: str) -> str:
+    """Return `text` with "&", "<" and ">" escaped for use as XML character data.
+
+    `xml.sax.saxutils` is imported on first use because it imports `urllib.request`, which is slow
+    to import and not otherwise needed by `import pptx`.
+    """
+    from xml.sax.saxutils import escape
+
+    return escape(text)
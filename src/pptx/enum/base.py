@@ -47,6 +47,9 @@ class BaseXmlEnum(int, enum.Enum):
 
     xml_value: str | None
 
+    # -- `xml_value -> member` and `value -> xml_value` maps, built by `_xml_codec()` --
+    _xml_codec_maps: tuple[dict[str, Any], dict[int, str]]
+
     def __new__(cls, ms_api_value: int, xml_value: str | None, docstr: str):
         self = int.__new__(cls, ms_api_value)
         self._value_ = ms_api_value
@@ -75,11 +78,7 @@ class BaseXmlEnum(int, enum.Enum):
 
         """
         # -- the empty string never maps to a member --
-        member = (
-            next((member for member in cls if member.xml_value == xml_value), None)
-            if xml_value
-            else None
-        )
+        member = cls._xml_codec()[0].get(xml_value) if xml_value else None
 
         if member is None:
             raise ValueError(f"{cls.__name__} has no XML mapping for {repr(xml_value)}")
@@ -89,13 +88,15 @@ class BaseXmlEnum(int, enum.Enum):
     @classmethod
     def to_xml(cls: Type[_T], value: int | _T) -> str:
         """XML value of this enum member, generally an XML attribute value."""
+        xml_value = cls._xml_codec()[1].get(value)
+        if xml_value is not None:
+            return xml_value
+
         # -- presence of multi-arg `__new__()` method fools type-checker, but getting a
-        # -- member by its value using EnumCls(val) works as usual.
+        # -- member by its value using EnumCls(val) works as usual. This raises `ValueError` when
+        # -- `value` is not a member value at all.
         member = cls(value)
-        xml_value = member.xml_value
-        if not xml_value:
-            raise ValueError(f"{cls.__name__}.{member.name} has no XML representation")
-        return xml_value
+        raise ValueError(f"{cls.__name__}.{member.name} has no XML representation")
 
     @classmethod
     def validate(cls: Type[_T], value: _T):
@@ -103,6 +104,31 @@ class BaseXmlEnum(int, enum.Enum):
         if value not in cls:
             raise ValueError(f"{value} not a member of {cls.__name__} enumeration")
 
+    @classmethod
+    def _xml_codec(cls) -> tuple[dict[str, Any], dict[int, str]]:
+        """Pair of `xml_value -> member` and `value -> xml_value` maps for this enumeration.
+
+        The maps are built on first use and cached on the enumeration class, so `from_xml()` and
+        `to_xml()` are a dict lookup rather than a scan of every member. Members without an XML
+        representation appear in neither map. Where more than one member has the same
+        `xml_value`, the first one defined is the one `from_xml()` produces.
+        """
+        try:
+            return cls.__dict__["_xml_codec_maps"]
+        except KeyError:
+            pass
+
+        member_by_xml_value: dict[str, Any] = {}
+        xml_value_by_value: dict[int, str] = {}
+        for member in cls:
+            if not member.xml_value:
+                continue
+            member_by_xml_value.setdefault(member.xml_value, member)
+            xml_value_by_value[member.value] = member.xml_value
+
+        cls._xml_codec_maps = (member_by_xml_value, xml_value_by_value)
+        return cls._xml_codec_maps
+
 
 class DocsPageFormatter(object):
     """Formats a reStructuredText documention page (string) for an enumeration."""
@@ -21,3 +21,9 @@ class InvalidXmlError(PythonPptxError):
     Raised when a value is encountered in the XML that is not valid according
     to the schema.
     """
+
+
+class ReadOnlyPackageError(PythonPptxError):
+    """
+    Raised on an attempt to change or save a presentation opened read-only.
+    """
@@ -7,8 +7,25 @@ presentations to and from a .pptx file.
 from __future__ import annotations
 
 import collections
-from typing import IO, TYPE_CHECKING, DefaultDict, Iterator, Mapping, Set, cast
-
+import os
+import posixpath
+import shutil
+import sys
+import tempfile
+import threading
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    DefaultDict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Set,
+    cast,
+)
+
+from pptx.exc import ReadOnlyPackageError
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.oxml import CT_Relationships, serialize_part_xml
@@ -22,10 +39,16 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from pptx.opc.oxml import CT_Relationship, CT_Types
+    from pptx.opc.serialized import CompressionPolicy, PkgFile
     from pptx.oxml.xmlchemy import BaseOxmlElement
     from pptx.package import Package
     from pptx.parts.presentation import PresentationPart
 
+# -- serializes the on-demand loading of parts, relationships and part XML in a lazily read
+# -- package, so objects loaded on first access are only ever loaded once, even when that first
+# -- access happens on more than one thread at a time.
+_load_lock = threading.RLock()
+
 
 class _RelatableMixin:
     """Provide relationship methods required by both the package and each part."""
@@ -44,11 +67,14 @@ class _RelatableMixin:
         If such a relationship already exists, its rId is returned. Otherwise the relationship is
         added and its new rId returned.
         """
+        self._raise_if_read_only()
         if isinstance(target, str):
             assert is_external
             return self._rels.get_or_add_ext_rel(reltype, target)
 
-        return self._rels.get_or_add(reltype, target)
+        rId = self._rels.get_or_add(reltype, target)
+        self._part_related(target)
+        return rId
 
     def related_part(self, rId: str) -> Part:
         """Return related |Part| subtype identified by `rId`."""
@@ -58,6 +84,18 @@ class _RelatableMixin:
         """Return URL contained in target ref of relationship identified by `rId`."""
         return self._rels[rId].target_ref
 
+    def _part_related(self, part: Part) -> None:
+        """Note that a relationship to `part` was just added."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `._part_related()`" % type(self).__name__
+        )
+
+    def _raise_if_read_only(self) -> None:
+        """Raise |ReadOnlyPackageError| when the package was opened read-only."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `._raise_if_read_only()`" % type(self).__name__
+        )
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """|_Relationships| object containing relationships from this part to others."""
@@ -70,20 +108,61 @@ class OpcPackage(_RelatableMixin):
     """Main API class for |python-opc|.
 
     A new instance is constructed by calling the :meth:`open` classmethod with a path to a package
-    file or file-like object containing a package (.pptx file).
+    file or file-like object containing a package (.pptx file), or with the bytes of a package
+    already in memory.
+
+    When opened with `lazy=True`, the package file is held open and the blob of each binary part
+    is only read from it when needed. Parts and their relationships are likewise only loaded once
+    a relationship to them is first followed. Such a package should be closed using :meth:`close`
+    (or by using it as a context manager) once it is no longer needed.
+
+    When opened with `read_only=True`, the package is read lazily as above and can never be
+    changed or saved. Any attempt to add or remove a relationship, rename or replace a part, or
+    save the package raises |ReadOnlyPackageError|, so the bookkeeping only needed to write the
+    package, like the partname index and rId allocation, is never built. Loading on demand is
+    thread-safe, so a read-only package can be read from more than one thread at a time.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: PkgFile, lazy: bool = False, read_only: bool = False):
         self._pkg_file = pkg_file
+        self._lazy = lazy or read_only
+        self._read_only = read_only
+        self._package_reader: PackageReader | None = None
+        self._partname_index: _PartnameIndex | None = None
+
+    def __enter__(self) -> Self:
+        """Enable use as a context-manager that closes the package file on exit."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the package file on exit from context."""
+        self.close()
 
     @classmethod
-    def open(cls, pkg_file: str | IO[bytes]) -> Self:
+    def open(cls, pkg_file: PkgFile, lazy: bool = False, read_only: bool = False) -> Self:
         """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+        return cls(pkg_file, lazy, read_only)._load()
+
+    def close(self) -> None:
+        """Release the package file when it was opened with `lazy=True`.
+
+        The blobs of parts that were not yet read are no longer available after closing, so
+        the package can no longer be saved. Has no effect on a package that was read in full
+        when opened, and closing more than once is harmless.
+        """
+        if self._package_reader is not None:
+            self._package_reader.close()
 
     def drop_rel(self, rId: str) -> None:
         """Remove relationship identified by `rId`."""
+        self._raise_if_read_only()
         self._rels.pop(rId)
+        self._parts_dropped()
+
+    @property
+    def is_read_only(self) -> bool:
+        """True when this package was opened with `read_only=True` and cannot be changed."""
+        return self._read_only
 
     def iter_parts(self) -> Iterator[Part]:
         """Generate exactly one reference to each part in the package."""
@@ -137,28 +216,100 @@ class OpcPackage(_RelatableMixin):
         to be used to insert the integer portion of the partname. Example:
         '/ppt/slides/slide%d.xml'
         """
+        self._raise_if_read_only()
         # --- expected next partname is tmpl % n where n is one greater than the number
         # --- of existing partnames that match tmpl. Speed up finding the next one
         # --- (maybe) by searching from the end downward rather than from 1 upward.
         prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = {p.partname for p in self.iter_parts() if p.partname.startswith(prefix)}
+        partnames = self._partnames.partnames_with_stem(prefix)
         for n in range(len(partnames) + 1, 0, -1):
             candidate_partname = tmpl % n
             if candidate_partname not in partnames:
                 return PackURI(candidate_partname)
         raise Exception("ProgrammingError: ran out of candidate_partnames")  # pragma: no cover
 
-    def save(self, pkg_file: str | IO[bytes]) -> None:
+    def save(
+        self,
+        pkg_file: str | IO[bytes],
+        workers: int | None = None,
+        compression: CompressionPolicy | None = None,
+    ) -> None:
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object. When `workers` is
+        greater than 1, parts are serialized and compressed by that many threads. `compression`
+        is an optional |CompressionPolicy| determining how each part is compressed.
+
+        A package opened with `lazy=True` can be saved over its own file, by path or through a
+        file object open on it. Opening that file object in a truncating mode like `"wb"`
+        discards the parts not yet read however, so saving then raises `zipfile.BadZipFile`.
+        """
+        self._raise_if_read_only()
+        parts = tuple(self.iter_parts())
+        if not self._saves_over_source(pkg_file):
+            PackageWriter.write(pkg_file, self._rels, parts, workers, compression)
+            return
+
+        # -- a package still reading from its file cannot write over it in place, so write to a
+        # -- temporary file alongside it and swap that in once complete. This includes a file
+        # -- object open on the source file, which is left untouched.
+        pkg_path = cast(str, self._pkg_file)
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(os.path.abspath(pkg_path))
+        )
+        os.close(fd)
+        try:
+            PackageWriter.write(tmp_path, self._rels, parts, workers, compression)
+            shutil.copymode(pkg_path, tmp_path)
+            os.replace(tmp_path, pkg_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _part_related(self, part: Part) -> None:
+        """Add `part` to the partname index, when one has been built."""
+        if self._partname_index is not None:
+            self._partname_index.add(part)
+
+    def _raise_if_read_only(self) -> None:
+        """Raise |ReadOnlyPackageError| when this package was opened read-only."""
+        if self._read_only:
+            raise ReadOnlyPackageError("package was opened read-only and cannot be changed")
+
+    def _part_renamed(self, part: Part, old_partname: PackURI) -> None:
+        """Update the partname index, when one has been built, for `part` renamed."""
+        if self._partname_index is not None:
+            self._partname_index.rename(part, old_partname)
+
+    def _parts_dropped(self) -> None:
+        """Discard the partname index after a relationship was removed.
+
+        Whether the target part is still in the package depends on whether any other
+        relationship refers to it, which only a walk of the relationship graph can determine.
+        The index is rebuilt by such a walk when next needed.
+        """
+        self._partname_index = None
+
+    @property
+    def _partnames(self) -> _PartnameIndex:
+        """|_PartnameIndex| of the parts in this package.
+
+        The index is built by a walk of the relationship graph on first use and from then on kept
+        current as relationships are added and parts are renamed, so allocating a partname for
+        each of many new parts doesn't need a walk of all parts each time.
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        if self._partname_index is None:
+            self._partname_index = _PartnameIndex(self.iter_parts())
+        return self._partname_index
 
     def _load(self) -> Self:
         """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, cast("Package", self))
+        package_reader = PackageReader(self._pkg_file, self._lazy)
+        pkg_xml_rels, parts = _PackageLoader.load(package_reader, cast("Package", self))
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        # -- a lazy reader must outlive loading; parts read their blobs from it on demand --
+        if package_reader.is_lazy:
+            self._package_reader = package_reader
         return self
 
     @lazyproperty
@@ -166,19 +317,36 @@ class OpcPackage(_RelatableMixin):
         """|Relationships| object containing relationships of this package."""
         return _Relationships(PACKAGE_URI.baseURI)
 
+    def _saves_over_source(self, pkg_file: str | IO[bytes]) -> bool:
+        """True when `pkg_file` is the file this package holds open for reading.
+
+        `pkg_file` can be a path or a file object, which is the source file when its file
+        descriptor refers to the same file on disk.
+        """
+        src_file = self._pkg_file
+        if self._package_reader is None or not isinstance(src_file, str):
+            return False
+        if isinstance(pkg_file, str):
+            return os.path.isfile(pkg_file) and os.path.samefile(pkg_file, src_file)
+        try:
+            return os.path.samestat(os.fstat(pkg_file.fileno()), os.stat(src_file))
+        except (AttributeError, OSError, ValueError):
+            # -- io.UnsupportedOperation, raised by an in-memory stream, is an OSError --
+            return False
+
 
 class _PackageLoader:
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file: str | IO[bytes], package: Package):
-        self._pkg_file = pkg_file
+    def __init__(self, package_reader: PackageReader, package: Package):
+        self._package_reader = package_reader
         self._package = package
 
     @classmethod
     def load(
-        cls, pkg_file: str | IO[bytes], package: Package
-    ) -> tuple[CT_Relationships, dict[PackURI, Part]]:
-        """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
+        cls, package_reader: PackageReader, package: Package
+    ) -> tuple[CT_Relationships, Mapping[PackURI, Part]]:
+        """Return (pkg_xml_rels, parts) pair resulting from loading `package_reader`.
 
         The returned `parts` value is a {partname: part} mapping with each part in the package
         included and constructed complete with its relationships to other parts in the package.
@@ -187,10 +355,21 @@ class _PackageLoader:
         package relationships. It is the caller's responsibility (the package object) to load
         those relationships into its |_Relationships| object.
         """
-        return cls(pkg_file, package)._load()
+        return cls(package_reader, package)._load()
+
+    def _load(self) -> tuple[CT_Relationships, Mapping[PackURI, Part]]:
+        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file.
+
+        When the package is read lazily, only the package relationships are loaded here; each
+        part is loaded when a relationship to it is first followed.
+        """
+        package_reader = self._package_reader
+        if package_reader.is_lazy:
+            parts_on_demand = _PartsOnDemand(
+                package_reader, self._package, self._content_types, self._xml_rels_for
+            )
+            return self._xml_rels_for(PACKAGE_URI), parts_on_demand
 
-    def _load(self) -> tuple[CT_Relationships, dict[PackURI, Part]]:
-        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
         parts, xml_rels = self._parts, self._xml_rels
 
         for partname, part in parts.items():
@@ -206,11 +385,6 @@ class _PackageLoader:
         """
         return _ContentTypeMap.from_xml(self._package_reader[CONTENT_TYPES_URI])
 
-    @lazyproperty
-    def _package_reader(self) -> PackageReader:
-        """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
-
     @lazyproperty
     def _parts(self) -> dict[PackURI, Part]:
         """dict {partname: Part} populated with parts loading from package.
@@ -278,6 +452,66 @@ class _PackageLoader:
         )
 
 
+class _PartsOnDemand(Mapping[PackURI, "Part"]):
+    """The {partname: part} mapping of a lazily-read package, loading each part on first lookup.
+
+    Relationships are resolved against this mapping as the package is loaded. A part is
+    constructed the first time its partname is looked up, and its own relationships are loaded
+    only when first accessed in turn, so parts that are never reached by following relationships
+    are never loaded. Iteration covers only the parts loaded so far.
+    """
+
+    def __init__(
+        self,
+        package_reader: PackageReader,
+        package: Package,
+        content_types: _ContentTypeMap,
+        xml_rels_for: Callable[[PackURI], CT_Relationships],
+    ):
+        self._package_reader = package_reader
+        self._package = package
+        self._content_types = content_types
+        self._xml_rels_for = xml_rels_for
+        self._parts: dict[PackURI, Part] = {}
+
+    def __contains__(self, partname: object) -> bool:
+        """True when `partname` is a part in the package, whether loaded yet or not."""
+        return partname in self._parts or (
+            partname != PACKAGE_URI and partname in self._package_reader
+        )
+
+    def __getitem__(self, partname: PackURI) -> Part:
+        """The part having `partname`, loaded when this is the first lookup of it."""
+        part = self._parts.get(partname)
+        if part is not None:
+            return part
+
+        with _load_lock:
+            part = self._parts.get(partname)
+            if part is not None:
+                return part
+            if partname not in self:
+                raise KeyError(partname)
+
+            part = PartFactory(
+                partname,
+                self._content_types[partname],
+                self._package,
+                package_reader=self._package_reader,
+            )
+            part.load_rels_on_demand(lambda: self._xml_rels_for(partname), self)
+            self._parts[partname] = part
+            return part
+
+    def __iter__(self) -> Iterator[PackURI]:
+        """Generate the partname of each part loaded so far."""
+        return iter(self._parts)
+
+    def __len__(self) -> int:
+        """Count of parts loaded so far."""
+        return len(self._parts)
+
+
 class Part(_RelatableMixin):
     """Base class for package parts.
 
@@ -293,6 +527,7 @@ class Part(_RelatableMixin):
         self._partname = partname
         self._content_type = content_type
         self._package = package
+        self._blob_src: tuple[PackageReader, PackURI] | None = None
         self._blob = blob
 
     @classmethod
@@ -304,6 +539,19 @@ class Part(_RelatableMixin):
         """
         return cls(partname, content_type, package, blob)
 
+    @classmethod
+    def load_on_demand(
+        cls, partname: PackURI, content_type: str, package: Package, package_reader: PackageReader
+    ) -> Self:
+        """Return `cls` instance that reads its blob from `package_reader` only when needed.
+
+        The blob is not retained by the part; `package_reader` keeps a bounded cache of recently
+        read blobs. Subtypes that must process their blob at load time override this.
+        """
+        part = cls.load(partname, content_type, package, cast(bytes, None))
+        part._blob_src = (package_reader, partname)
+        return part
+
     @property
     def blob(self) -> bytes:
         """Contents of this package part as a sequence of bytes.
@@ -320,14 +568,38 @@ class Part(_RelatableMixin):
         In particular, the |XmlPart| subclass uses its `self._element` to serialize a blob on
         demand. This works fine for binary parts though.
         """
+        self._raise_if_read_only()
         self._blob = blob
 
+    @property
+    def _blob(self) -> bytes | None:
+        """Bytes of this part, read from the source package when the part was loaded on demand."""
+        if self._blob_src is not None:
+            package_reader, src_partname = self._blob_src
+            return package_reader[src_partname]
+        return self._blob_bytes
+
+    @_blob.setter
+    def _blob(self, blob: bytes | None):
+        self._blob_bytes = blob
+        self._blob_src = None
+
     @lazyproperty
     def content_type(self) -> str:
         """Content-type (MIME-type) of this part."""
         return self._content_type
 
-    def load_rels_from_xml(self, xml_rels: CT_Relationships, parts: dict[PackURI, Part]) -> None:
+    @property
+    def unmodified_source(self) -> tuple[PackageReader, PackURI] | None:
+        """(package_reader, partname) pair locating this part in the package it was loaded from.
+
+        Only available while the part is unchanged since loading, and only for a package opened
+        with `lazy=True`. |None| for a part that is new or has been (or may have been) changed.
+        This allows an unchanged part to be copied directly from its source on save.
+        """
+        return self._blob_src
+
+    def load_rels_from_xml(self, xml_rels: CT_Relationships, parts: Mapping[PackURI, Part]) -> None:
         """load _Relationships for this part from `xml_rels`.
 
         Part references are resolved using the `parts` dict that maps each partname to the loaded
@@ -336,6 +608,16 @@ class Part(_RelatableMixin):
         """
         self._rels.load_from_xml(self._partname.baseURI, xml_rels, parts)
 
+    def load_rels_on_demand(
+        self, load_xml_rels: Callable[[], CT_Relationships], parts: Mapping[PackURI, Part]
+    ) -> None:
+        """Load _Relationships for this part from `load_xml_rels()` when they are first needed.
+
+        Like :meth:`load_rels_from_xml`, but the rels XML is only read, and the parts it refers to
+        only looked up in `parts`, on first access to a relationship of this part.
+        """
+        self._rels.load_from_xml_on_demand(self._partname.baseURI, load_xml_rels, parts)
+
     @lazyproperty
     def package(self) -> Package:
         """Package this part belongs to."""
@@ -352,7 +634,11 @@ class Part(_RelatableMixin):
             raise TypeError(  # pragma: no cover
                 "partname must be instance of PackURI, got '%s'" % type(partname).__name__
             )
+        self._raise_if_read_only()
+        old_partname = self._partname
         self._partname = partname
+        if self._package is not None:
+            self._package._part_renamed(self, old_partname)
 
     @lazyproperty
     def rels(self) -> _Relationships:
@@ -373,6 +659,15 @@ class Part(_RelatableMixin):
             file.seek(0)
         return file.read()
 
+    def _part_related(self, part: Part) -> None:
+        """Note that a relationship from this part to `part` was just added."""
+        self._package._part_related(part)
+
+    def _raise_if_read_only(self) -> None:
+        """Raise |ReadOnlyPackageError| when the package of this part was opened read-only."""
+        if self._package is not None:
+            self._package._raise_if_read_only()
+
     @lazyproperty
     def _rels(self) -> _Relationships:
         """Relationships from this part to others."""
@@ -390,19 +685,44 @@ class XmlPart(Part):
         self, partname: PackURI, content_type: str, package: Package, element: BaseOxmlElement
     ):
         super(XmlPart, self).__init__(partname, content_type, package)
-        self._element = element
+        self._xml_element = element
 
     @classmethod
     def load(cls, partname: PackURI, content_type: str, package: Package, blob: bytes):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(
-            partname, content_type, package, element=cast("BaseOxmlElement", parse_xml(blob))
-        )
+        """Return instance of `cls` that parses its XML from `blob` when it is first needed.
+
+        Until then the part holds `blob` as-is and hands it back unchanged as its `.blob`, so a
+        part that is never looked at costs no parsing, on load or on save.
+        """
+        part = cls(partname, content_type, package, element=cast("BaseOxmlElement", None))
+        part._blob = blob
+        return part
 
     @property
     def blob(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """bytes XML serialization of this part."""
-        return serialize_part_xml(self._element)
+        """bytes XML serialization of this part.
+
+        The XML as it was loaded when it has not yet been parsed.
+        """
+        if self._xml_element is None:
+            return cast(bytes, self._blob)
+        return serialize_part_xml(self._xml_element)
+
+    @property
+    def _element(self) -> BaseOxmlElement:
+        """Root element of the XML of this part, parsed on first access.
+
+        There is no telling what a caller does with the element once it is handed out, so from
+        then on the part is no longer taken to be unchanged since it was loaded.
+        """
+        if self._xml_element is None:
+            with _load_lock:
+                if self._xml_element is None:
+                    self._xml_element = cast(
+                        "BaseOxmlElement", parse_xml(cast(bytes, self._blob))
+                    )
+                    self._blob = None
+        return self._xml_element
 
     # -- XmlPart cannot set its blob, which is why pyright complains --
 
@@ -412,8 +732,10 @@ class XmlPart(Part):
         Relationships with a reference count of 0 are implicit relationships. Note that only XML
         parts can drop relationships.
         """
+        self._raise_if_read_only()
         if self._rel_ref_count(rId) < 2:
             self._rels.pop(rId)
+            self._package._parts_dropped()
 
     @property
     def part(self):
@@ -439,9 +761,18 @@ class PartFactory:
 
     part_type_for: dict[str, type[Part]] = {}
 
-    def __new__(cls, partname: PackURI, content_type: str, package: Package, blob: bytes) -> Part:
+    def __new__(
+        cls,
+        partname: PackURI,
+        content_type: str,
+        package: Package,
+        blob: bytes | None = None,
+        package_reader: PackageReader | None = None,
+    ) -> Part:
         PartClass = cls._part_cls_for(content_type)
-        return PartClass.load(partname, content_type, package, blob)
+        if package_reader is not None:
+            return PartClass.load_on_demand(partname, content_type, package, package_reader)
+        return PartClass.load(partname, content_type, package, cast(bytes, blob))
 
     @classmethod
     def _part_cls_for(cls, content_type: str) -> type[Part]:
@@ -490,6 +821,74 @@ class _ContentTypeMap:
         return cls(overrides, defaults)
 
 
+class _PartnameIndex:
+    """Index of the partnames used by a set of parts, grouped by stem.
+
+    The stem of a partname is the partname with its extension and any trailing index digits
+    removed, like "/ppt/slides/slide" for "/ppt/slides/slide21.xml". That is also the prefix of a
+    partname template like "/ppt/slides/slide%d.xml", so the partnames that could collide with a
+    new one made from a template are found without visiting any other part.
+    """
+
+    def __init__(self, parts: Iterable[Part] = ()):
+        self._parts: dict[str, Part] = {}
+        self._partnames: DefaultDict[str, Set[str]] = collections.defaultdict(set)
+        self._idxs: DefaultDict[str, collections.Counter[int]] = collections.defaultdict(
+            collections.Counter
+        )
+        # -- lowest index in each stem that may be unused; no index below it is free --
+        self._free_idx_floors: dict[str, int] = {}
+        for part in parts:
+            self.add(part)
+
+    def add(self, part: Part) -> None:
+        """Add the partname of `part` to the index; adding the same part again has no effect."""
+        partname = part.partname
+        if self._parts.get(partname) is part:
+            return
+        self._parts[partname] = part
+        stem, idx = self._stem_and_idx(partname)
+        self._partnames[stem].add(partname)
+        if idx is not None:
+            self._idxs[stem][idx] += 1
+
+    def first_available_idx(self, stem: str) -> int:
+        """Return the lowest index from 1 not used by a partname having `stem`."""
+        idxs = self._idxs[stem]
+        idx = self._free_idx_floors.get(stem, 1)
+        while idx in idxs:
+            idx += 1
+        self._free_idx_floors[stem] = idx
+        return idx
+
+    def partnames_with_stem(self, stem: str) -> Set[str]:
+        """Return the set of indexed partnames having `stem`, like "/ppt/slides/slide"."""
+        return self._partnames[stem]
+
+    def rename(self, part: Part, old_partname: str) -> None:
+        """Re-index `part` under its new partname when it was indexed under `old_partname`."""
+        if self._parts.get(old_partname) is not part:
+            return
+        del self._parts[old_partname]
+        stem, idx = self._stem_and_idx(old_partname)
+        self._partnames[stem].discard(old_partname)
+        if idx is not None:
+            idxs = self._idxs[stem]
+            idxs[idx] -= 1
+            if idxs[idx] == 0:
+                del idxs[idx]
+                self._free_idx_floors[stem] = min(self._free_idx_floors.get(stem, 1), idx)
+        self.add(part)
+
+    @staticmethod
+    def _stem_and_idx(partname: str) -> tuple[str, int | None]:
+        """Return (stem, idx) pair for `partname`, like ("/ppt/slides/slide", 21)."""
+        root = posixpath.splitext(partname)[0]
+        stem = root.rstrip("0123456789")
+        digits = root[len(stem) :]
+        return stem, int(digits) if digits else None
+
+
 class _Relationships(Mapping[str, "_Relationship"]):
     """Collection of |_Relationship| instances having `dict` semantics.
 
@@ -499,10 +898,18 @@ class _Relationships(Mapping[str, "_Relationship"]):
     Iterating this collection has normal mapping semantics, generating the keys (rIds) of the
     mapping. `rels.keys()`, `rels.values()`, and `rels.items() can be used as they would be for a
     `dict`.
+
+    Relationships are also indexed by reltype and by (reltype, target) so finding a part by
+    relationship type or an existing relationship to the same target doesn't involve visiting
+    every relationship. These indexes are built on first use and kept current as relationships
+    are added and removed.
     """
 
     def __init__(self, base_uri: str):
         self._base_uri = base_uri
+        self._xml_rels_src: (
+            tuple[str, Callable[[], CT_Relationships], Mapping[PackURI, Part]] | None
+        ) = None
 
     def __contains__(self, rId: object) -> bool:
         """Implement 'in' operation, like `"rId7" in relationships`."""
@@ -548,25 +955,34 @@ class _Relationships(Mapping[str, "_Relationship"]):
         )
 
     def load_from_xml(
-        self, base_uri: str, xml_rels: CT_Relationships, parts: dict[PackURI, Part]
+        self, base_uri: str, xml_rels: CT_Relationships, parts: Mapping[PackURI, Part]
     ) -> None:
         """Replace any relationships in this collection with those from `xml_rels`."""
-
-        def iter_valid_rels():
-            """Filter out broken relationships such as those pointing to NULL."""
-            for rel_elm in xml_rels.relationship_lst:
-                # --- Occasionally a PowerPoint plugin or other client will "remove"
-                # --- a relationship simply by "voiding" its Target value, like making
-                # --- it "/ppt/slides/NULL". Skip any relationships linking to a
-                # --- partname that is not present in the package.
-                if rel_elm.targetMode == RTM.INTERNAL:
-                    partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
-                    if partname not in parts:
-                        continue
-                yield _Relationship.from_xml(base_uri, rel_elm, parts)
-
+        self._xml_rels_src = None
         self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._rels.update(
+            (rel.rId, rel) for rel in self._iter_valid_rels(base_uri, xml_rels, parts)
+        )
+        # -- indexes are rebuilt from the loaded relationships when next needed --
+        self.__dict__.pop("_rels_by_reltype", None)
+        self.__dict__.pop("_rIds_by_target", None)
+
+    def load_from_xml_on_demand(
+        self,
+        base_uri: str,
+        load_xml_rels: Callable[[], CT_Relationships],
+        parts: Mapping[PackURI, Part],
+    ) -> None:
+        """Replace any relationships in this collection with those from `load_xml_rels()`.
+
+        `load_xml_rels` is not called until the relationships are first accessed, so neither the
+        rels XML nor the parts it refers to are loaded for a part whose relationships are never
+        followed.
+        """
+        self._xml_rels_src = (base_uri, load_xml_rels, parts)
+        self.__dict__.pop("_rels", None)
+        self.__dict__.pop("_rels_by_reltype", None)
+        self.__dict__.pop("_rIds_by_target", None)
 
     def part_with_reltype(self, reltype: str) -> Part:
         """Return target part of relationship with matching `reltype`.
@@ -589,7 +1005,15 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
         The caller is responsible for ensuring it is no longer required.
         """
-        return self._rels.pop(rId)
+        rels_by_reltype, rIds_by_target = self._rels_by_reltype, self._rIds_by_target
+        rel = self._rels.pop(rId)
+        rels_by_reltype[rel.reltype].remove(rel)
+        target_key = self._target_key(rel)
+        rIds = rIds_by_target[target_key]
+        rIds.remove(rId)
+        if not rIds:
+            del rIds_by_target[target_key]
+        return rel
 
     @property
     def xml(self):
@@ -619,14 +1043,19 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
     def _add_relationship(self, reltype: str, target: Part | str, is_external: bool = False) -> str:
         """Return str rId of |_Relationship| newly added to spec."""
+        # -- make sure indexes are built before the new relationship is added --
+        rels_by_reltype, rIds_by_target = self._rels_by_reltype, self._rIds_by_target
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = _Relationship(
             self._base_uri,
             rId,
             reltype,
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+        self._rels[rId] = rel
+        rels_by_reltype[reltype].append(rel)
+        rIds_by_target[(reltype, target, is_external)].append(rId)
         return rId
 
     def _get_matching(
@@ -636,14 +1065,8 @@ class _Relationships(Mapping[str, "_Relationship"]):
 
         Returns `None` on no matching relationship
         """
-        for rel in self._rels_by_reltype[reltype]:
-            if rel.is_external != is_external:
-                continue
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target == target:
-                return rel.rId
-
-        return None
+        rIds = self._rIds_by_target.get((reltype, target, is_external))
+        return rIds[0] if rIds else None
 
     @property
     def _next_rId(self) -> str:
@@ -663,19 +1086,74 @@ class _Relationships(Mapping[str, "_Relationship"]):
             "ProgrammingError: Impossible to have more distinct rIds than relationships"
         )
 
+    @staticmethod
+    def _iter_valid_rels(
+        base_uri: str, xml_rels: CT_Relationships, parts: Mapping[PackURI, Part]
+    ) -> Iterator[_Relationship]:
+        """Generate a |_Relationship| for each relationship in `xml_rels`.
+
+        Filters out broken relationships such as those pointing to NULL.
+        """
+        for rel_elm in xml_rels.relationship_lst:
+            # --- Occasionally a PowerPoint plugin or other client will "remove"
+            # --- a relationship simply by "voiding" its Target value, like making
+            # --- it "/ppt/slides/NULL". Skip any relationships linking to a
+            # --- partname that is not present in the package.
+            if rel_elm.targetMode == RTM.INTERNAL:
+                partname = PackURI.from_rel_ref(base_uri, rel_elm.target_ref)
+                if partname not in parts:
+                    continue
+            yield _Relationship.from_xml(base_uri, rel_elm, parts)
+
     @lazyproperty
     def _rels(self) -> dict[str, _Relationship]:
-        """dict {rId: _Relationship} containing relationships of this collection."""
-        return {}
+        """dict {rId: _Relationship} containing relationships of this collection.
 
-    @property
-    def _rels_by_reltype(self) -> dict[str, list[_Relationship]]:
+        Loaded from the package on first access when this collection was loaded on demand.
+        """
+        if self._xml_rels_src is None and "_rels" not in self.__dict__:
+            return {}
+
+        with _load_lock:
+            # -- another thread may have loaded them while this one waited --
+            rels = self.__dict__.get("_rels")
+            if rels is not None:
+                return rels
+            if self._xml_rels_src is None:
+                return {}
+            base_uri, load_xml_rels, parts = self._xml_rels_src
+            rels = self.__dict__["_rels"] = {
+                rel.rId: rel for rel in self._iter_valid_rels(base_uri, load_xml_rels(), parts)
+            }
+            self._xml_rels_src = None
+            return rels
+
+    @lazyproperty
+    def _rels_by_reltype(self) -> DefaultDict[str, list[_Relationship]]:
         """defaultdict {reltype: [rels]} for all relationships in collection."""
         D: DefaultDict[str, list[_Relationship]] = collections.defaultdict(list)
         for rel in self.values():
             D[rel.reltype].append(rel)
         return D
 
+    @lazyproperty
+    def _rIds_by_target(self) -> DefaultDict[tuple[str, Part | str, bool], list[str]]:
+        """defaultdict {(reltype, target, is_external): [rIds]} for relationships in collection.
+
+        The target is the target part of an internal relationship and the target ref (URL) of
+        an external one. rIds are in the order their relationships were added.
+        """
+        D: DefaultDict[tuple[str, Part | str, bool], list[str]] = collections.defaultdict(list)
+        for rId, rel in self._rels.items():
+            D[self._target_key(rel)].append(rId)
+        return D
+
+    @staticmethod
+    def _target_key(rel: _Relationship) -> tuple[str, Part | str, bool]:
+        """Return the (reltype, target, is_external) key of `rel` in `._rIds_by_target`."""
+        is_external = rel.is_external
+        return (rel.reltype, rel.target_ref if is_external else rel.target_part, is_external)
+
 
 class _Relationship:
     """Value object describing link from a part or package to another part."""
@@ -689,7 +1167,7 @@ class _Relationship:
 
     @classmethod
     def from_xml(
-        cls, base_uri: str, rel: CT_Relationship, parts: dict[PackURI, Part]
+        cls, base_uri: str, rel: CT_Relationship, parts: Mapping[PackURI, Part]
     ) -> _Relationship:
         """Return |_Relationship| object based on CT_Relationship element `rel`."""
         target = (
@@ -697,7 +1175,10 @@ class _Relationship:
             if rel.targetMode == RTM.EXTERNAL
             else parts[PackURI.from_rel_ref(base_uri, rel.target_ref)]
         )
-        return cls(base_uri, rel.rId, rel.reltype, rel.targetMode, target)
+        # -- the few distinct reltypes and target-modes are each shared by all relationships --
+        return cls(
+            base_uri, rel.rId, sys.intern(rel.reltype), sys.intern(rel.targetMode), target
+        )
 
     @lazyproperty
     def is_external(self) -> bool:
@@ -2,32 +2,120 @@
 
 from __future__ import annotations
 
+import collections
+import hashlib
+import io
+import mmap
 import os
 import posixpath
+import struct
+import threading
+import time
 import zipfile
-from typing import IO, TYPE_CHECKING, Any, Container, Sequence
+import zlib
+from typing import IO, TYPE_CHECKING, Any, Container, Mapping, Sequence, Union, cast
 
 from pptx.exc import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.oxml import CT_Types, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.shared import CaseInsensitiveDict
-from pptx.opc.spec import default_content_types
+from pptx.opc.spec import compressed_content_types, default_content_types
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from typing_extensions import Self
+
     from pptx.opc.package import Part, _Relationships  # pyright: ignore[reportPrivateUsage]
 
+# -- a package can be read from a path, a file-like object, or bytes already in memory --
+PkgFile = Union[str, IO[bytes], bytes, bytearray, memoryview, mmap.mmap]
+
+
+class CompressionPolicy:
+    """Decides how each member of a saved zip package is compressed, by its content type.
+
+    `levels` maps a content type to a deflate level from 0 to 9, or to |None| to store members
+    of that type without compression. A key like `"video/*"` matches any content type of that
+    major type; an exact content type takes precedence over such a wildcard. Members of any other
+    content type, including the package's own `.rels` and `[Content_Types].xml` items, are
+    deflated at `default_level`.
+
+    When `store_only` is True, every member is stored without compression. This is the fastest
+    to write and to read back, at the cost of a larger file, and suits intermediate files read
+    only by other processing steps.
+    """
+
+    def __init__(
+        self,
+        levels: Mapping[str, int | None] | None = None,
+        default_level: int = zlib.Z_DEFAULT_COMPRESSION,
+        store_only: bool = False,
+    ):
+        self._levels = dict(levels or {})
+        self._default_level = default_level
+        self._store_only = store_only
+
+    @classmethod
+    def store_compressed_media(
+        cls,
+        levels: Mapping[str, int | None] | None = None,
+        default_level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> CompressionPolicy:
+        """Return a policy that stores already-compressed media without deflating it again.
+
+        JPEG, PNG and GIF images, audio, video and embedded Office documents are stored; other
+        members are deflated. Entries in `levels` override these defaults.
+        """
+        stored_levels: dict[str, int | None] = dict.fromkeys(compressed_content_types)
+        stored_levels.update(levels or {})
+        return cls(stored_levels, default_level)
+
+    def compression_for(self, content_type: str | None) -> tuple[int, int | None]:
+        """Return (compress_type, compress_level) pair for a member of `content_type`.
+
+        `compress_type` is `zipfile.ZIP_STORED` or `zipfile.ZIP_DEFLATED`; `compress_level` is
+        |None| for a stored member.
+        """
+        if self._store_only:
+            return zipfile.ZIP_STORED, None
+
+        levels = self._levels
+        if content_type is not None:
+            for key in (content_type, "%s/*" % content_type.partition("/")[0]):
+                if key in levels:
+                    level = levels[key]
+                    if level is None:
+                        return zipfile.ZIP_STORED, None
+                    return zipfile.ZIP_DEFLATED, level
+
+        return zipfile.ZIP_DEFLATED, self._default_level
+
+    def keeps(self, info: zipfile.ZipInfo) -> bool:
+        """True when a member compressed as described by `info` can be copied unchanged.
+
+        Copying a compressed member as-is is always cheapest, so this is only False when a
+        store-only policy would have to inflate a compressed member.
+        """
+        return not self._store_only or info.compress_type == zipfile.ZIP_STORED
+
 
 class PackageReader(Container[bytes]):
     """Provides access to package-parts of an OPC package with dict semantics.
 
     The package may be in zip-format (a .pptx file) or expanded into a directory structure,
-    perhaps by unzipping a .pptx file.
+    perhaps by unzipping a .pptx file. A zip-format package can also be provided as `bytes`,
+    `memoryview` or `mmap.mmap`, in which case it is read in place rather than copied.
+
+    When `lazy` is True, a zip package is held open and each member is only inflated when it is
+    requested. The reader must then be closed by calling :meth:`close` when no longer needed.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    def __init__(self, pkg_file: PkgFile, lazy: bool = False):
         self._pkg_file = pkg_file
+        self._lazy = lazy
 
     def __contains__(self, pack_uri: object) -> bool:
         """Return True when part identified by `pack_uri` is present in package."""
@@ -37,6 +125,28 @@ class PackageReader(Container[bytes]):
         """Return bytes for part corresponding to `pack_uri`."""
         return self._blob_reader[pack_uri]
 
+    def compressed_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip-info, compressed-bytes) pair for the archive member `pack_uri`.
+
+        This allows the member to be copied to another zip archive without being inflated and
+        then compressed again. Returns |None| when the package does not offer such access, as
+        when it was read in full on open or is a directory.
+        """
+        return self._blob_reader.compressed_member(pack_uri)
+
+    def close(self) -> None:
+        """Release the package file, if it is held open.
+
+        Has no effect when the package has already been read in full or was never read.
+        """
+        if "_blob_reader" in self.__dict__:
+            self._blob_reader.close()
+
+    @property
+    def is_lazy(self) -> bool:
+        """True when part blobs are read from the package on demand rather than all at once."""
+        return self._lazy
+
     def rels_xml_for(self, partname: PackURI) -> bytes | None:
         """Return optional rels item XML for `partname`.
 
@@ -49,7 +159,7 @@ class PackageReader(Container[bytes]):
     @lazyproperty
     def _blob_reader(self) -> _PhysPkgReader:
         """|_PhysPkgReader| subtype providing read access to the package file."""
-        return _PhysPkgReader.factory(self._pkg_file)
+        return _PhysPkgReader.factory(self._pkg_file, self._lazy)
 
 
 class PackageWriter:
@@ -57,30 +167,51 @@ class PackageWriter:
 
     `pkg_file` can be either a path to a zip file (a string) or a file-like object. `pkg_rels` is
     the |_Relationships| object containing relationships for the package. `parts` is a sequence of
-    |Part| subtype instance to be written to the package.
+    |Part| subtype instance to be written to the package. When `pkg_file` is the path of an
+    existing directory, the package is written expanded into that directory instead.
+
+    When `workers` is greater than 1, parts of a zip package are serialized and compressed by
+    that many threads while earlier parts are being written. The package is the same either way;
+    members are always written in `parts` order. `compression` is an optional
+    |CompressionPolicy| that determines how each member of a zip package is compressed; all are
+    deflated at the default level otherwise.
 
     Its single API classmethod is :meth:`write`. This class is not intended to be instantiated.
     """
 
-    def __init__(self, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]):
+    def __init__(
+        self,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        workers: int | None = None,
+        compression: CompressionPolicy | None = None,
+    ):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._workers = workers
+        self._compression = compression
 
     @classmethod
     def write(
-        cls, pkg_file: str | IO[bytes], pkg_rels: _Relationships, parts: Sequence[Part]
+        cls,
+        pkg_file: str | IO[bytes],
+        pkg_rels: _Relationships,
+        parts: Sequence[Part],
+        workers: int | None = None,
+        compression: CompressionPolicy | None = None,
     ) -> None:
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream based on
         the content type of each part, and a .rels file for each part that has relationships.
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, workers, compression)._write()
 
     def _write(self) -> None:
         """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
+        with _PhysPkgWriter.factory(self._pkg_file, self._compression) as phys_writer:
             self._write_content_types_stream(phys_writer)
             self._write_pkg_rels(phys_writer)
             self._write_parts(phys_writer)
@@ -99,13 +230,80 @@ class PackageWriter:
     def _write_parts(self, phys_writer: _PhysPkgWriter) -> None:
         """Write blob of each part in `parts` to the package.
 
-        A rels item for each part is also written when the part has relationships.
+        A part unchanged since it was loaded is copied from its source package as-is, still
+        compressed, when both packages allow it. A rels item for each part is also written when
+        the part has relationships.
         """
+        workers = self._workers
+        if workers is not None and workers > 1 and isinstance(phys_writer, _ZipPkgWriter):
+            self._write_parts_concurrently(phys_writer, workers)
+            return
+
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
+            compressed_member = self._compressed_member_for(part)
+            if compressed_member is None:
+                phys_writer.write(part.partname, part.blob, part.content_type)
+            else:
+                phys_writer.write_compressed(part.partname, *compressed_member)
             if part._rels:  # pyright: ignore[reportPrivateUsage]
                 phys_writer.write(part.partname.rels_uri, part.rels.xml)
 
+    def _compressed_member_for(self, part: Part) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """Return (zip-info, compressed-bytes) of `part` in its source package, when available.
+
+        Returns |None| when the part is new or has changed since it was loaded, when its source
+        package does not offer access to compressed members, or when the compression policy
+        does not allow the member to be copied as it is.
+        """
+        unmodified_source = part.unmodified_source
+        if unmodified_source is None:
+            return None
+        package_reader, src_partname = unmodified_source
+        compressed_member = package_reader.compressed_member(src_partname)
+        compression = self._compression
+        if compressed_member is None or compression is None:
+            return compressed_member
+        return compressed_member if compression.keeps(compressed_member[0]) else None
+
+    def _write_parts_concurrently(self, phys_writer: _ZipPkgWriter, workers: int) -> None:
+        """Write each part in `parts` (and its rels item) using `workers` threads.
+
+        Serializing and compressing a part is independent of any other part, and zlib releases
+        the GIL while it works, so that is done by a thread pool. The compressed members are then
+        appended to the archive in order by this thread. Only a bounded number of parts are in
+        flight at any one time so memory use stays flat however large the package.
+        """
+
+        # -- imported here because `concurrent.futures` is slow to import and only a save with
+        # -- more than one worker needs it --
+        from concurrent.futures import ThreadPoolExecutor
+
+        def compress(part: Part) -> list[tuple[PackURI, zipfile.ZipInfo, bytes]]:
+            partname = part.partname
+            compressed_member = self._compressed_member_for(part)
+            if compressed_member is None:
+                compressed_member = phys_writer.compress(partname, part.blob, part.content_type)
+            members = [(partname, *compressed_member)]
+            if part._rels:  # pyright: ignore[reportPrivateUsage]
+                rels_uri = partname.rels_uri
+                members.append((rels_uri, *phys_writer.compress(rels_uri, part.rels.xml)))
+            return members
+
+        def write(future: Future[list[tuple[PackURI, zipfile.ZipInfo, bytes]]]) -> None:
+            for pack_uri, info, data in future.result():
+                phys_writer.write_compressed(pack_uri, info, data)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight: collections.deque[Future[list[tuple[PackURI, zipfile.ZipInfo, bytes]]]] = (
+                collections.deque()
+            )
+            for part in self._parts:
+                in_flight.append(executor.submit(compress, part))
+                if len(in_flight) > 2 * workers:
+                    write(in_flight.popleft())
+            while in_flight:
+                write(in_flight.popleft())
+
     def _write_pkg_rels(self, phys_writer: _PhysPkgWriter) -> None:
         """Write the XML rels item for `pkg_rels` ('/_rels/.rels') to the package."""
         phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels.xml)
@@ -127,22 +325,46 @@ class _PhysPkgReader(Container[PackURI]):
         )
 
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _PhysPkgReader:
-        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
+    def factory(cls, pkg_file: PkgFile, lazy: bool = False) -> _PhysPkgReader:
+        """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`.
+
+        A zip package is read in full on first access unless `lazy` is True, in which case a
+        |_LazyZipPkgReader| is returned. A directory package is always read on demand.
+        """
+        ZipPkgReader = _LazyZipPkgReader if lazy else _ZipPkgReader
+
+        # --- package bytes already in memory are read in place, without a copy ---
+        if isinstance(pkg_file, (bytes, bytearray, memoryview, mmap.mmap)):
+            buffer = memoryview(pkg_file)
+            return _LazyZipPkgReader(buffer) if lazy else _ZipPkgReader(_BufferStream(buffer))
+
         # --- for pkg_file other than str, assume it's a stream and pass it to Zip
         # --- reader to sort out
         if not isinstance(pkg_file, str):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReader(pkg_file)
 
         # --- otherwise we treat `pkg_file` as a path ---
         if os.path.isdir(pkg_file):
             return _DirPkgReader(pkg_file)
 
         if zipfile.is_zipfile(pkg_file):
-            return _ZipPkgReader(pkg_file)
+            return ZipPkgReader(pkg_file)
 
         raise PackageNotFoundError("Package not found at '%s'" % pkg_file)
 
+    def close(self) -> None:
+        """Release any resources held by this reader.
+
+        Only a reader that keeps its package file open needs to override this.
+        """
+
+    def compressed_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """(zip-info, compressed-bytes) pair for the member `pack_uri`, when available.
+
+        Only a reader that keeps a zip archive open can provide this.
+        """
+        return None
+
 
 class _DirPkgReader(_PhysPkgReader):
     """Implements |PhysPkgReader| interface for OPC package extracted into directory.
@@ -195,30 +417,296 @@ class _ZipPkgReader(_PhysPkgReader):
             return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
 
 
+class _LazyZipPkgReader(_PhysPkgReader):
+    """Implements |PhysPkgReader| interface for a zip-file OPC package read on demand.
+
+    The archive is held open for the life of the reader and a member is only inflated when its
+    blob is requested. Recently read blobs are retained, up to `cache_size` bytes in total, so a
+    part read more than once in quick succession is only inflated once.
+
+    `pkg_file` can be a path, a file-like object, or a `memoryview` of the package bytes. A path
+    is read through a regular file handle rather than memory-mapped, so a package file truncated
+    or rewritten in place while open produces `BadZipFile` on the next read instead of crashing
+    the interpreter. When the package is a `memoryview`, each member is sliced directly from it
+    (and inflated when compressed) rather than being read through a stream.
+    """
+
+    def __init__(self, pkg_file: str | IO[bytes] | memoryview, cache_size: int = 16 * 1024 * 1024):
+        self._pkg_file = pkg_file
+        self._cache_size = cache_size
+        self._cache: collections.OrderedDict[PackURI, bytes] = collections.OrderedDict()
+        self._cached_bytes = 0
+        self._cache_lock = threading.Lock()
+
+    def __contains__(self, pack_uri: object) -> bool:
+        """Return True when part identified by `pack_uri` is present in zip archive."""
+        return pack_uri in self._members
+
+    def __getitem__(self, pack_uri: PackURI) -> bytes:
+        """Return bytes for part corresponding to `pack_uri`.
+
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        cache = self._cache
+        with self._cache_lock:
+            if pack_uri in cache:
+                cache.move_to_end(pack_uri)
+                return cache[pack_uri]
+
+        if pack_uri not in self._members:
+            raise KeyError("no member '%s' in package" % pack_uri)
+
+        blob = self._read_member(self._members[pack_uri])
+        self._cache_blob(pack_uri, blob)
+        return blob
+
+    def compressed_member(self, pack_uri: PackURI) -> tuple[zipfile.ZipInfo, bytes] | None:
+        """(zip-info, compressed-bytes) pair for the member `pack_uri`.
+
+        Returns |None| for a member that is encrypted or uses a compression method other than
+        stored or deflated, since such a member is not copied as-is.
+        """
+        info = self._members.get(pack_uri)
+        if info is None or not self._is_plain(info):
+            return None
+        start = self._data_offset(info)
+        end = start + info.compress_size
+        buffer = self._buffer
+        if buffer is not None:
+            return info, bytes(buffer[start:end])
+        zipf = self._zipf
+        with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+            zipf.fp.seek(start)  # pyright: ignore[reportOptionalMemberAccess]
+            data = zipf.fp.read(info.compress_size)  # pyright: ignore
+        if len(data) != info.compress_size:
+            raise zipfile.BadZipFile("Truncated data for file '%s'" % info.filename)
+        return info, data
+
+    def close(self) -> None:
+        """Close the zip archive and discard any cached blobs."""
+        self._cache.clear()
+        self._cached_bytes = 0
+        if "_zipf" in self.__dict__:
+            self._zipf.close()
+        if self._buffer is not None:
+            self._buffer.release()
+
+    def _cache_blob(self, pack_uri: PackURI, blob: bytes) -> None:
+        """Add `blob` to the cache, evicting least-recently read blobs to stay in budget.
+
+        A blob larger than the whole budget is not cached at all.
+        """
+        if len(blob) > self._cache_size:
+            return
+        cache = self._cache
+        with self._cache_lock:
+            if pack_uri in cache:
+                return
+            cache[pack_uri] = blob
+            self._cached_bytes += len(blob)
+            while self._cached_bytes > self._cache_size:
+                _, evicted = cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    @property
+    def _buffer(self) -> memoryview | None:
+        """The package bytes when given as a `memoryview`, |None| when read from a file."""
+        pkg_file = self._pkg_file
+        return pkg_file if isinstance(pkg_file, memoryview) else None
+
+    def _data_offset(self, info: zipfile.ZipInfo) -> int:
+        """Offset of the (compressed) data of the member described by `info` in the archive."""
+        offset = info.header_offset
+        buffer = self._buffer
+        if buffer is not None:
+            header = buffer[offset : offset + 30]
+        else:
+            zipf = self._zipf
+            with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+                zipf.fp.seek(offset)  # pyright: ignore[reportOptionalMemberAccess]
+                header = zipf.fp.read(30)  # pyright: ignore[reportOptionalMemberAccess]
+        if len(header) < 30:
+            raise zipfile.BadZipFile("Truncated file header for '%s'" % info.filename)
+
+        # -- local file header is 30 bytes, followed by the member name and an extra field --
+        signature, name_len, extra_len = struct.unpack("<4s22xHH", header)
+        if signature != b"PK\x03\x04":
+            raise zipfile.BadZipFile("Bad magic number for file header of '%s'" % info.filename)
+        return offset + 30 + name_len + extra_len
+
+    @staticmethod
+    def _is_plain(info: zipfile.ZipInfo) -> bool:
+        """True when the member described by `info` is unencrypted and stored or deflated."""
+        return not info.flag_bits & 0x1 and info.compress_type in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+        )
+
+    @lazyproperty
+    def _members(self) -> dict[PackURI, zipfile.ZipInfo]:
+        """dict mapping partname to the zip central-directory entry for that member."""
+        return {PackURI("/%s" % info.filename): info for info in self._zipf.infolist()}
+
+    def _read_member(self, info: zipfile.ZipInfo) -> bytes:
+        """Return the uncompressed bytes of the archive member described by `info`.
+
+        When the package is in memory, a stored or deflated member is sliced straight from it.
+        Anything else, like an encrypted member, is left to `zipfile`.
+        """
+        buffer = self._buffer
+        if buffer is None or not self._is_plain(info):
+            return self._zipf.read(info)
+
+        start = self._data_offset(info)
+        data = buffer[start : start + info.compress_size]
+
+        blob = (
+            bytes(data) if info.compress_type == zipfile.ZIP_STORED else zlib.decompress(data, -15)
+        )
+        if zlib.crc32(blob) != info.CRC:
+            raise zipfile.BadZipFile("Bad CRC-32 for file '%s'" % info.filename)
+        return blob
+
+    @lazyproperty
+    def _zipf(self) -> zipfile.ZipFile:
+        """`ZipFile` instance open for reading, held open until this reader is closed."""
+        buffer = self._buffer
+        return zipfile.ZipFile(self._pkg_file if buffer is None else _BufferStream(buffer), "r")
+
+
+class _BufferStream(io.RawIOBase):
+    """Read-only, seekable file-like object over a `memoryview`, for use by `zipfile`.
+
+    Unlike `io.BytesIO`, it does not copy the buffer it is constructed with.
+    """
+
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+        self._pos = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Return up to `size` bytes from the current position, all remaining when negative."""
+        start = self._pos
+        end = (
+            len(self._buffer) if size is None or size < 0 else min(start + size, len(self._buffer))
+        )
+        self._pos = max(start, end)
+        return bytes(self._buffer[start:end])
+
+    def readable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to `offset` relative to `whence` and return the new absolute position."""
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._buffer)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+
 class _PhysPkgWriter:
     """Base class for physical package writer objects."""
 
     @classmethod
-    def factory(cls, pkg_file: str | IO[bytes]) -> _ZipPkgWriter:
+    def factory(
+        cls, pkg_file: str | IO[bytes], compression: CompressionPolicy | None = None
+    ) -> _DirPkgWriter | _ZipPkgWriter:
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
-        Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be implemented
-        or even a `_StreamPkgWriter`.
+        A `pkg_file` that names an existing directory gets a `_DirPkgWriter` that writes the
+        package expanded into that directory. Anything else is written as a zip archive.
+        `compression` applies only to a zip archive.
         """
-        return _ZipPkgWriter(pkg_file)
+        if isinstance(pkg_file, str) and os.path.isdir(pkg_file):
+            return _DirPkgWriter(pkg_file)
+        return _ZipPkgWriter(pkg_file, compression)
+
+    def __enter__(self) -> Self:
+        """Enable use as a context-manager."""
+        return self
+
+    def __exit__(self, *exc: list[Any]) -> None:
+        """Release any resources held by this writer on exit from context."""
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str | None = None) -> None:
         """Write `blob` to package with membername corresponding to `pack_uri`."""
         raise NotImplementedError(  # pragma: no cover
             f"`{type(self).__name__}` must implement `.write()`"
         )
 
+    def write_compressed(self, pack_uri: PackURI, info: zipfile.ZipInfo, data: bytes) -> None:
+        """Write already-compressed member `data` described by `info` as `pack_uri`."""
+        raise NotImplementedError(  # pragma: no cover
+            f"`{type(self).__name__}` must implement `.write_compressed()`"
+        )
+
+
+class _DirPkgWriter(_PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for an OPC package expanded into a directory.
+
+    `path` is the path to an existing directory. Each member is written to a file of the same
+    name below it, creating subdirectories as needed. A member whose file already holds the same
+    bytes is not written again, so re-saving a package to the directory it was saved to before
+    only touches the parts that changed. Files of parts no longer in the package are left in
+    place; they are not referenced by any relationship and so are ignored when the package is
+    read back.
+    """
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str | None = None) -> None:
+        """Write `blob` to the file corresponding to `pack_uri` unless it already holds `blob`."""
+        path = os.path.join(self._path, *pack_uri.membername.split("/"))
+        if self._holds(path, blob):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(blob)
+
+    def write_compressed(self, pack_uri: PackURI, info: zipfile.ZipInfo, data: bytes) -> None:
+        """Write already-compressed zip member `data` described by `info` as `pack_uri`.
+
+        A directory holds plain files, so `data` is inflated first.
+        """
+        blob = data if info.compress_type == zipfile.ZIP_STORED else zlib.decompress(data, -15)
+        self.write(pack_uri, blob)
+
+    @staticmethod
+    def _holds(path: str, blob: bytes) -> bool:
+        """True when the file at `path` exists and its content is the same as `blob`.
+
+        The file is only read when its size matches, and is then compared by SHA1 digest.
+        """
+        try:
+            if os.path.getsize(path) != len(blob):
+                return False
+            with open(path, "rb") as f:
+                file_sha1 = hashlib.sha1(f.read()).digest()
+        except OSError:
+            return False
+        return file_sha1 == hashlib.sha1(blob).digest()
+
+
+# -- private `ZipFile` members `_ZipPkgWriter.write_compressed()` uses to copy a member as-is --
+_ZIPFILE_WRITE_INTERNALS = ("_didModify", "_lock", "_seekable", "_writecheck", "start_dir")
+
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file: str | IO[bytes]):
+    Each member is compressed as determined by `compression` from its content type, or deflated
+    at the default level when no policy is provided.
+    """
+
+    def __init__(self, pkg_file: str | IO[bytes], compression: CompressionPolicy | None = None):
         self._pkg_file = pkg_file
+        self._compression = compression or CompressionPolicy()
 
     def __enter__(self) -> _ZipPkgWriter:
         """Enable use as a context-manager. Opening zip for writing happens here."""
@@ -231,9 +719,87 @@ class _ZipPkgWriter(_PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri: PackURI, blob: bytes) -> None:
-        """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+    def compress(
+        self, pack_uri: PackURI, blob: bytes, content_type: str | None = None
+    ) -> tuple[zipfile.ZipInfo, bytes]:
+        """Return (zip-info, compressed-bytes) pair for `blob` stored as `pack_uri`.
+
+        The result is suitable for :meth:`write_compressed`. This does not touch the archive and
+        so can safely be called from more than one thread at a time.
+        """
+        compress_type, compress_level = self._compression.compression_for(content_type)
+        zinfo = zipfile.ZipInfo(pack_uri.membername, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = compress_type
+        if compress_type == zipfile.ZIP_STORED:
+            data = bytes(blob)
+        else:
+            level = zlib.Z_DEFAULT_COMPRESSION if compress_level is None else compress_level
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            data = compressor.compress(blob) + compressor.flush()
+        zinfo.CRC = zlib.crc32(blob)
+        zinfo.file_size = len(blob)
+        zinfo.compress_size = len(data)
+        return zinfo, data
+
+    def write(self, pack_uri: PackURI, blob: bytes, content_type: str | None = None) -> None:
+        """Write `blob` to zip package with membername corresponding to `pack_uri`.
+
+        `blob` is compressed as the compression policy determines for `content_type`.
+        """
+        compress_type, compress_level = self._compression.compression_for(content_type)
+        self._zipf.writestr(
+            pack_uri.membername, blob, compress_type=compress_type, compresslevel=compress_level
+        )
+
+    def write_compressed(self, pack_uri: PackURI, info: zipfile.ZipInfo, data: bytes) -> None:
+        """Write already-compressed member `data` described by `info` as `pack_uri`.
+
+        `info` is the zip-info of the member in its source archive; its compression method,
+        CRC and sizes are carried over unchanged so `data` is written without being inflated or
+        compressed again. `zipfile` has no public interface for this, so this does what
+        `ZipFile.writestr()` does short of compressing, using private `ZipFile` members. When
+        this Python's `zipfile` lacks any of those, `data` is inflated and written the ordinary
+        way instead.
+        """
+        zipf = self._zipf
+        zinfo = zipfile.ZipInfo(pack_uri.membername, date_time=info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.external_attr = 0o600 << 16
+        if not self._copies_compressed:
+            blob = data if info.compress_type == zipfile.ZIP_STORED else zlib.decompress(data, -15)
+            zipf.writestr(zinfo, blob)
+            return
+
+        zinfo.CRC = info.CRC
+        zinfo.compress_size = info.compress_size
+        zinfo.file_size = info.file_size
+        zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+
+        with zipf._lock:  # pyright: ignore[reportAttributeAccessIssue]
+            fp = cast(IO[bytes], zipf.fp)
+            if zipf._seekable:  # pyright: ignore[reportAttributeAccessIssue]
+                fp.seek(zipf.start_dir)  # pyright: ignore[reportAttributeAccessIssue]
+            zinfo.header_offset = fp.tell()
+            zipf._writecheck(zinfo)  # pyright: ignore[reportAttributeAccessIssue]
+            zipf._didModify = True  # pyright: ignore[reportAttributeAccessIssue]
+            fp.write(zinfo.FileHeader(zip64))
+            fp.write(data)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = fp.tell()  # pyright: ignore[reportAttributeAccessIssue]
+
+    @lazyproperty
+    def _copies_compressed(self) -> bool:
+        """True when the archive has the private members needed to copy compressed data as-is.
+
+        These are implementation details of `zipfile`, present in every CPython release this
+        package supports; the check keeps a `zipfile` that changes them from producing a corrupt
+        archive.
+        """
+        zipf = self._zipf
+        return hasattr(zipfile.ZipInfo, "FileHeader") and all(
+            hasattr(zipf, name) for name in _ZIPFILE_WRITE_INTERNALS
+        )
 
     @lazyproperty
     def _zipf(self) -> zipfile.ZipFile:
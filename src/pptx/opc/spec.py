@@ -42,3 +42,18 @@ image_content_types = {
     "wdp": CT.MS_PHOTO,
     "wmf": CT.X_WMF,
 }
+
+
+# -- content types of payloads that are already compressed, so gain little from deflate. A
+# -- "type/*" item matches any content type of that major type.
+compressed_content_types = (
+    "audio/*",
+    "video/*",
+    CT.GIF,
+    CT.JPEG,
+    CT.MS_PHOTO,
+    CT.PNG,
+    CT.PML_PRESENTATION,
+    CT.SML_SHEET,
+    CT.WML_DOCUMENT,
+)
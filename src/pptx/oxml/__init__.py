@@ -1,10 +1,16 @@
 """Initializes lxml parser, particularly the custom element classes.
 
 Also makes available a handful of functions that wrap its typical uses.
+
+The custom element classes are registered lazily. The module defining an element class is only
+imported the first time the parser encounters an element having one of its tags, so a program
+that never touches, say, a chart does not pay for importing the chart element classes.
 """
 
 from __future__ import annotations
 
+import functools
+import importlib
 import os
 from typing import TYPE_CHECKING, Type
 
@@ -16,19 +22,67 @@ if TYPE_CHECKING:
     from pptx.oxml.xmlchemy import BaseOxmlElement
 
 
+class _LazyElementClassLookup(etree.CustomElementClassLookup):
+    """Element-class lookup that loads the custom element classes of a module on first use.
+
+    This is the fallback of `element_class_lookup`, so it is only consulted for a tag that has no
+    element class registered (yet). When the tag is one registered with
+    `_register_lazy_element_clss()`, the module defining its class is imported and all the
+    element classes of that module are registered, so later elements having any of those tags
+    are looked up by `element_class_lookup` directly.
+    """
+
+    def lookup(
+        self, node_type: str, doc: object, namespace: str | None, name: str
+    ) -> Type[BaseOxmlElement] | None:
+        module_name = _lazy_element_cls_modules.get(namespace, {}).get(name)
+        if module_name is None:
+            return None
+        # -- registering is idempotent, so a thread that loses a race for the same module just
+        # -- registers the same classes again --
+        module = importlib.import_module(module_name)
+        for nsptagname, cls_name in _lazy_element_clss[module_name]:
+            register_element_cls(nsptagname, getattr(module, cls_name))
+        return element_class_lookup.get_namespace(namespace)[name]
+
+
 # -- configure etree XML parser ----------------------------
-element_class_lookup = etree.ElementNamespaceClassLookup()
+element_class_lookup = etree.ElementNamespaceClassLookup(_LazyElementClassLookup())
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# -- {nsuri: {local-name: module-name}} of each element class registered lazily --
+_lazy_element_cls_modules: dict[str | None, dict[str, str]] = {}
+# -- {module-name: ((nsptagname, cls-name), ...)} of each module registered lazily --
+_lazy_element_clss: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+# -- {xml: element} of each XML template parsed so far, see `parse_prototype()` --
+_prototypes: dict[str | bytes, BaseOxmlElement] = {}
+
 
 def parse_from_template(template_file_name: str):
-    """Return an element loaded from the XML in the template file identified by `template_name`."""
-    thisdir = os.path.split(__file__)[0]
-    filename = os.path.join(thisdir, "..", "templates", "%s.xml" % template_file_name)
-    with open(filename, "rb") as f:
-        xml = f.read()
-    return parse_xml(xml)
+    """Return an element loaded from the XML in the template file identified by `template_name`.
+
+    The template file is only read and parsed once; each call returns a new copy.
+    """
+    return parse_prototype(_template_xml(template_file_name))
+
+
+def parse_prototype(xml: str | bytes) -> BaseOxmlElement:
+    """Return a new element tree like the one obtained by parsing `xml`.
+
+    `xml` is parsed only the first time it is seen. That tree is kept as a prototype and each
+    call returns a deep copy of it, which is several times faster than parsing the XML again.
+    `xml` should be a fixed template; any value that varies from one element to the next is set
+    on the returned copy rather than formatted into `xml`.
+    """
+    prototype = _prototypes.get(xml)
+    if prototype is None:
+        prototype = _prototypes[xml] = parse_xml(xml)
+    # -- lxml copies the whole subtree either way; calling `__deepcopy__()` directly avoids the
+    # -- overhead of `copy.deepcopy()`, which is a large fraction of the cost of a small tree.
+    return prototype.__deepcopy__(None)
 
 
 def parse_xml(xml: str | bytes):
@@ -36,6 +90,15 @@ def parse_xml(xml: str | bytes):
     return etree.fromstring(xml, oxml_parser)
 
 
+@functools.lru_cache(maxsize=None)
+def _template_xml(template_file_name: str) -> bytes:
+    """XML contents of the template file identified by `template_file_name`."""
+    thisdir = os.path.split(__file__)[0]
+    filename = os.path.join(thisdir, "..", "templates", "%s.xml" % template_file_name)
+    with open(filename, "rb") as f:
+        return f.read()
+
+
 def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
     """Register `cls` to be constructed when oxml parser encounters element having `nsptag_name`.
 
@@ -46,448 +109,377 @@ def register_element_cls(nsptagname: str, cls: Type[BaseOxmlElement]):
     namespace[nsptag.local_part] = cls
 
 
-from pptx.oxml.action import CT_Hyperlink  # noqa: E402
+def _register_lazy_element_clss(module_name: str, element_clss: dict[str, str]):
+    """Register the element classes in `module_name` to be loaded on first use.
 
-register_element_cls("a:hlinkClick", CT_Hyperlink)
-register_element_cls("a:hlinkHover", CT_Hyperlink)
+    `element_clss` maps each `nsptagname`, like `"p:sp"`, to the name of the element class in
+    `module_name` to be constructed for elements having that tag. The module is not imported
+    until the parser first encounters one of these tags.
+    """
+    _lazy_element_clss[module_name] = tuple(element_clss.items())
+    for nsptagname in element_clss:
+        nsptag = NamespacePrefixedTag(nsptagname)
+        _lazy_element_cls_modules.setdefault(nsptag.nsuri, {})[nsptag.local_part] = module_name
+
+
+_register_lazy_element_clss(
+    "pptx.oxml.action",
+    {
+        "a:hlinkClick": "CT_Hyperlink",
+        "a:hlinkHover": "CT_Hyperlink",
+    },
+)
 
 
-from pptx.oxml.chart.axis import (  # noqa: E402
-    CT_AxisUnit,
-    CT_CatAx,
-    CT_ChartLines,
-    CT_Crosses,
-    CT_DateAx,
-    CT_LblOffset,
-    CT_Orientation,
-    CT_Scaling,
-    CT_TickLblPos,
-    CT_TickMark,
-    CT_ValAx,
+_register_lazy_element_clss(
+    "pptx.oxml.chart.axis",
+    {
+        "c:catAx": "CT_CatAx",
+        "c:crosses": "CT_Crosses",
+        "c:dateAx": "CT_DateAx",
+        "c:lblOffset": "CT_LblOffset",
+        "c:majorGridlines": "CT_ChartLines",
+        "c:majorTickMark": "CT_TickMark",
+        "c:majorUnit": "CT_AxisUnit",
+        "c:minorTickMark": "CT_TickMark",
+        "c:minorUnit": "CT_AxisUnit",
+        "c:orientation": "CT_Orientation",
+        "c:scaling": "CT_Scaling",
+        "c:tickLblPos": "CT_TickLblPos",
+        "c:valAx": "CT_ValAx",
+    },
 )
 
-register_element_cls("c:catAx", CT_CatAx)
-register_element_cls("c:crosses", CT_Crosses)
-register_element_cls("c:dateAx", CT_DateAx)
-register_element_cls("c:lblOffset", CT_LblOffset)
-register_element_cls("c:majorGridlines", CT_ChartLines)
-register_element_cls("c:majorTickMark", CT_TickMark)
-register_element_cls("c:majorUnit", CT_AxisUnit)
-register_element_cls("c:minorTickMark", CT_TickMark)
-register_element_cls("c:minorUnit", CT_AxisUnit)
-register_element_cls("c:orientation", CT_Orientation)
-register_element_cls("c:scaling", CT_Scaling)
-register_element_cls("c:tickLblPos", CT_TickLblPos)
-register_element_cls("c:valAx", CT_ValAx)
-
-
-from pptx.oxml.chart.chart import (  # noqa: E402
-    CT_Chart,
-    CT_ChartSpace,
-    CT_ExternalData,
-    CT_PlotArea,
-    CT_Style,
+
+_register_lazy_element_clss(
+    "pptx.oxml.chart.chart",
+    {
+        "c:chart": "CT_Chart",
+        "c:chartSpace": "CT_ChartSpace",
+        "c:externalData": "CT_ExternalData",
+        "c:plotArea": "CT_PlotArea",
+        "c:style": "CT_Style",
+    },
 )
 
-register_element_cls("c:chart", CT_Chart)
-register_element_cls("c:chartSpace", CT_ChartSpace)
-register_element_cls("c:externalData", CT_ExternalData)
-register_element_cls("c:plotArea", CT_PlotArea)
-register_element_cls("c:style", CT_Style)
 
+_register_lazy_element_clss(
+    "pptx.oxml.chart.datalabel",
+    {
+        "c:dLbl": "CT_DLbl",
+        "c:dLblPos": "CT_DLblPos",
+        "c:dLbls": "CT_DLbls",
+    },
+)
 
-from pptx.oxml.chart.datalabel import CT_DLbl, CT_DLblPos, CT_DLbls  # noqa: E402
 
-register_element_cls("c:dLbl", CT_DLbl)
-register_element_cls("c:dLblPos", CT_DLblPos)
-register_element_cls("c:dLbls", CT_DLbls)
+_register_lazy_element_clss(
+    "pptx.oxml.chart.legend",
+    {
+        "c:legend": "CT_Legend",
+        "c:legendPos": "CT_LegendPos",
+    },
+)
 
 
-from pptx.oxml.chart.legend import CT_Legend, CT_LegendPos  # noqa: E402
+_register_lazy_element_clss(
+    "pptx.oxml.chart.marker",
+    {
+        "c:marker": "CT_Marker",
+        "c:size": "CT_MarkerSize",
+        "c:symbol": "CT_MarkerStyle",
+    },
+)
 
-register_element_cls("c:legend", CT_Legend)
-register_element_cls("c:legendPos", CT_LegendPos)
 
+_register_lazy_element_clss(
+    "pptx.oxml.chart.plot",
+    {
+        "c:area3DChart": "CT_Area3DChart",
+        "c:areaChart": "CT_AreaChart",
+        "c:barChart": "CT_BarChart",
+        "c:barDir": "CT_BarDir",
+        "c:bubbleChart": "CT_BubbleChart",
+        "c:bubbleScale": "CT_BubbleScale",
+        "c:doughnutChart": "CT_DoughnutChart",
+        "c:gapWidth": "CT_GapAmount",
+        "c:grouping": "CT_Grouping",
+        "c:lineChart": "CT_LineChart",
+        "c:overlap": "CT_Overlap",
+        "c:pieChart": "CT_PieChart",
+        "c:radarChart": "CT_RadarChart",
+        "c:scatterChart": "CT_ScatterChart",
+    },
+)
 
-from pptx.oxml.chart.marker import CT_Marker, CT_MarkerSize, CT_MarkerStyle  # noqa: E402
 
-register_element_cls("c:marker", CT_Marker)
-register_element_cls("c:size", CT_MarkerSize)
-register_element_cls("c:symbol", CT_MarkerStyle)
+_register_lazy_element_clss(
+    "pptx.oxml.chart.series",
+    {
+        "c:bubbleSize": "CT_NumDataSource",
+        "c:cat": "CT_AxDataSource",
+        "c:dPt": "CT_DPt",
+        "c:lvl": "CT_Lvl",
+        "c:pt": "CT_StrVal_NumVal_Composite",
+        "c:ser": "CT_SeriesComposite",
+        "c:val": "CT_NumDataSource",
+        "c:xVal": "CT_NumDataSource",
+        "c:yVal": "CT_NumDataSource",
+    },
+)
 
 
-from pptx.oxml.chart.plot import (  # noqa: E402
-    CT_Area3DChart,
-    CT_AreaChart,
-    CT_BarChart,
-    CT_BarDir,
-    CT_BubbleChart,
-    CT_BubbleScale,
-    CT_DoughnutChart,
-    CT_GapAmount,
-    CT_Grouping,
-    CT_LineChart,
-    CT_Overlap,
-    CT_PieChart,
-    CT_RadarChart,
-    CT_ScatterChart,
+_register_lazy_element_clss(
+    "pptx.oxml.chart.shared",
+    {
+        "c:autoTitleDeleted": "CT_Boolean_Explicit",
+        "c:autoUpdate": "CT_Boolean",
+        "c:bubble3D": "CT_Boolean",
+        "c:crossAx": "CT_UnsignedInt",
+        "c:crossesAt": "CT_Double",
+        "c:date1904": "CT_Boolean",
+        "c:delete": "CT_Boolean",
+        "c:idx": "CT_UnsignedInt",
+        "c:invertIfNegative": "CT_Boolean_Explicit",
+        "c:layout": "CT_Layout",
+        "c:manualLayout": "CT_ManualLayout",
+        "c:max": "CT_Double",
+        "c:min": "CT_Double",
+        "c:numFmt": "CT_NumFmt",
+        "c:order": "CT_UnsignedInt",
+        "c:overlay": "CT_Boolean_Explicit",
+        "c:ptCount": "CT_UnsignedInt",
+        "c:showCatName": "CT_Boolean_Explicit",
+        "c:showLegendKey": "CT_Boolean_Explicit",
+        "c:showPercent": "CT_Boolean_Explicit",
+        "c:showSerName": "CT_Boolean_Explicit",
+        "c:showVal": "CT_Boolean_Explicit",
+        "c:smooth": "CT_Boolean",
+        "c:title": "CT_Title",
+        "c:tx": "CT_Tx",
+        "c:varyColors": "CT_Boolean",
+        "c:x": "CT_Double",
+        "c:xMode": "CT_LayoutMode",
+    },
 )
 
-register_element_cls("c:area3DChart", CT_Area3DChart)
-register_element_cls("c:areaChart", CT_AreaChart)
-register_element_cls("c:barChart", CT_BarChart)
-register_element_cls("c:barDir", CT_BarDir)
-register_element_cls("c:bubbleChart", CT_BubbleChart)
-register_element_cls("c:bubbleScale", CT_BubbleScale)
-register_element_cls("c:doughnutChart", CT_DoughnutChart)
-register_element_cls("c:gapWidth", CT_GapAmount)
-register_element_cls("c:grouping", CT_Grouping)
-register_element_cls("c:lineChart", CT_LineChart)
-register_element_cls("c:overlap", CT_Overlap)
-register_element_cls("c:pieChart", CT_PieChart)
-register_element_cls("c:radarChart", CT_RadarChart)
-register_element_cls("c:scatterChart", CT_ScatterChart)
-
-
-from pptx.oxml.chart.series import (  # noqa: E402
-    CT_AxDataSource,
-    CT_DPt,
-    CT_Lvl,
-    CT_NumDataSource,
-    CT_SeriesComposite,
-    CT_StrVal_NumVal_Composite,
-)
 
-register_element_cls("c:bubbleSize", CT_NumDataSource)
-register_element_cls("c:cat", CT_AxDataSource)
-register_element_cls("c:dPt", CT_DPt)
-register_element_cls("c:lvl", CT_Lvl)
-register_element_cls("c:pt", CT_StrVal_NumVal_Composite)
-register_element_cls("c:ser", CT_SeriesComposite)
-register_element_cls("c:val", CT_NumDataSource)
-register_element_cls("c:xVal", CT_NumDataSource)
-register_element_cls("c:yVal", CT_NumDataSource)
-
-
-from pptx.oxml.chart.shared import (  # noqa: E402
-    CT_Boolean,
-    CT_Boolean_Explicit,
-    CT_Double,
-    CT_Layout,
-    CT_LayoutMode,
-    CT_ManualLayout,
-    CT_NumFmt,
-    CT_Title,
-    CT_Tx,
-    CT_UnsignedInt,
+_register_lazy_element_clss(
+    "pptx.oxml.coreprops",
+    {
+        "cp:coreProperties": "CT_CoreProperties",
+    },
 )
 
-register_element_cls("c:autoTitleDeleted", CT_Boolean_Explicit)
-register_element_cls("c:autoUpdate", CT_Boolean)
-register_element_cls("c:bubble3D", CT_Boolean)
-register_element_cls("c:crossAx", CT_UnsignedInt)
-register_element_cls("c:crossesAt", CT_Double)
-register_element_cls("c:date1904", CT_Boolean)
-register_element_cls("c:delete", CT_Boolean)
-register_element_cls("c:idx", CT_UnsignedInt)
-register_element_cls("c:invertIfNegative", CT_Boolean_Explicit)
-register_element_cls("c:layout", CT_Layout)
-register_element_cls("c:manualLayout", CT_ManualLayout)
-register_element_cls("c:max", CT_Double)
-register_element_cls("c:min", CT_Double)
-register_element_cls("c:numFmt", CT_NumFmt)
-register_element_cls("c:order", CT_UnsignedInt)
-register_element_cls("c:overlay", CT_Boolean_Explicit)
-register_element_cls("c:ptCount", CT_UnsignedInt)
-register_element_cls("c:showCatName", CT_Boolean_Explicit)
-register_element_cls("c:showLegendKey", CT_Boolean_Explicit)
-register_element_cls("c:showPercent", CT_Boolean_Explicit)
-register_element_cls("c:showSerName", CT_Boolean_Explicit)
-register_element_cls("c:showVal", CT_Boolean_Explicit)
-register_element_cls("c:smooth", CT_Boolean)
-register_element_cls("c:title", CT_Title)
-register_element_cls("c:tx", CT_Tx)
-register_element_cls("c:varyColors", CT_Boolean)
-register_element_cls("c:x", CT_Double)
-register_element_cls("c:xMode", CT_LayoutMode)
-
-
-from pptx.oxml.coreprops import CT_CoreProperties  # noqa: E402
-
-register_element_cls("cp:coreProperties", CT_CoreProperties)
-
-
-from pptx.oxml.dml.color import (  # noqa: E402
-    CT_Color,
-    CT_HslColor,
-    CT_Percentage,
-    CT_PresetColor,
-    CT_SchemeColor,
-    CT_ScRgbColor,
-    CT_SRgbColor,
-    CT_SystemColor,
-)
 
-register_element_cls("a:bgClr", CT_Color)
-register_element_cls("a:fgClr", CT_Color)
-register_element_cls("a:hslClr", CT_HslColor)
-register_element_cls("a:lumMod", CT_Percentage)
-register_element_cls("a:lumOff", CT_Percentage)
-register_element_cls("a:prstClr", CT_PresetColor)
-register_element_cls("a:schemeClr", CT_SchemeColor)
-register_element_cls("a:scrgbClr", CT_ScRgbColor)
-register_element_cls("a:srgbClr", CT_SRgbColor)
-register_element_cls("a:sysClr", CT_SystemColor)
-
-
-from pptx.oxml.dml.fill import (  # noqa: E402
-    CT_Blip,
-    CT_BlipFillProperties,
-    CT_GradientFillProperties,
-    CT_GradientStop,
-    CT_GradientStopList,
-    CT_GroupFillProperties,
-    CT_LinearShadeProperties,
-    CT_NoFillProperties,
-    CT_PatternFillProperties,
-    CT_RelativeRect,
-    CT_SolidColorFillProperties,
+_register_lazy_element_clss(
+    "pptx.oxml.dml.color",
+    {
+        "a:bgClr": "CT_Color",
+        "a:fgClr": "CT_Color",
+        "a:hslClr": "CT_HslColor",
+        "a:lumMod": "CT_Percentage",
+        "a:lumOff": "CT_Percentage",
+        "a:prstClr": "CT_PresetColor",
+        "a:schemeClr": "CT_SchemeColor",
+        "a:scrgbClr": "CT_ScRgbColor",
+        "a:srgbClr": "CT_SRgbColor",
+        "a:sysClr": "CT_SystemColor",
+    },
 )
 
-register_element_cls("a:blip", CT_Blip)
-register_element_cls("a:blipFill", CT_BlipFillProperties)
-register_element_cls("a:gradFill", CT_GradientFillProperties)
-register_element_cls("a:grpFill", CT_GroupFillProperties)
-register_element_cls("a:gs", CT_GradientStop)
-register_element_cls("a:gsLst", CT_GradientStopList)
-register_element_cls("a:lin", CT_LinearShadeProperties)
-register_element_cls("a:noFill", CT_NoFillProperties)
-register_element_cls("a:pattFill", CT_PatternFillProperties)
-register_element_cls("a:solidFill", CT_SolidColorFillProperties)
-register_element_cls("a:srcRect", CT_RelativeRect)
 
+_register_lazy_element_clss(
+    "pptx.oxml.dml.fill",
+    {
+        "a:blip": "CT_Blip",
+        "a:blipFill": "CT_BlipFillProperties",
+        "a:gradFill": "CT_GradientFillProperties",
+        "a:grpFill": "CT_GroupFillProperties",
+        "a:gs": "CT_GradientStop",
+        "a:gsLst": "CT_GradientStopList",
+        "a:lin": "CT_LinearShadeProperties",
+        "a:noFill": "CT_NoFillProperties",
+        "a:pattFill": "CT_PatternFillProperties",
+        "a:solidFill": "CT_SolidColorFillProperties",
+        "a:srcRect": "CT_RelativeRect",
+        "p:blipFill": "CT_BlipFillProperties",
+    },
+)
 
-from pptx.oxml.dml.line import CT_PresetLineDashProperties  # noqa: E402
 
-register_element_cls("a:prstDash", CT_PresetLineDashProperties)
+_register_lazy_element_clss(
+    "pptx.oxml.dml.line",
+    {
+        "a:prstDash": "CT_PresetLineDashProperties",
+    },
+)
 
 
-from pptx.oxml.presentation import (  # noqa: E402
-    CT_Presentation,
-    CT_SlideId,
-    CT_SlideIdList,
-    CT_SlideMasterIdList,
-    CT_SlideMasterIdListEntry,
-    CT_SlideSize,
+_register_lazy_element_clss(
+    "pptx.oxml.presentation",
+    {
+        "p:presentation": "CT_Presentation",
+        "p:sldId": "CT_SlideId",
+        "p:sldIdLst": "CT_SlideIdList",
+        "p:sldMasterId": "CT_SlideMasterIdListEntry",
+        "p:sldMasterIdLst": "CT_SlideMasterIdList",
+        "p:sldSz": "CT_SlideSize",
+    },
 )
 
-register_element_cls("p:presentation", CT_Presentation)
-register_element_cls("p:sldId", CT_SlideId)
-register_element_cls("p:sldIdLst", CT_SlideIdList)
-register_element_cls("p:sldMasterId", CT_SlideMasterIdListEntry)
-register_element_cls("p:sldMasterIdLst", CT_SlideMasterIdList)
-register_element_cls("p:sldSz", CT_SlideSize)
-
-
-from pptx.oxml.shapes.autoshape import (  # noqa: E402
-    CT_AdjPoint2D,
-    CT_CustomGeometry2D,
-    CT_GeomGuide,
-    CT_GeomGuideList,
-    CT_NonVisualDrawingShapeProps,
-    CT_Path2D,
-    CT_Path2DClose,
-    CT_Path2DLineTo,
-    CT_Path2DList,
-    CT_Path2DMoveTo,
-    CT_PresetGeometry2D,
-    CT_Shape,
-    CT_ShapeNonVisual,
-)
 
-register_element_cls("a:avLst", CT_GeomGuideList)
-register_element_cls("a:custGeom", CT_CustomGeometry2D)
-register_element_cls("a:gd", CT_GeomGuide)
-register_element_cls("a:close", CT_Path2DClose)
-register_element_cls("a:lnTo", CT_Path2DLineTo)
-register_element_cls("a:moveTo", CT_Path2DMoveTo)
-register_element_cls("a:path", CT_Path2D)
-register_element_cls("a:pathLst", CT_Path2DList)
-register_element_cls("a:prstGeom", CT_PresetGeometry2D)
-register_element_cls("a:pt", CT_AdjPoint2D)
-register_element_cls("p:cNvSpPr", CT_NonVisualDrawingShapeProps)
-register_element_cls("p:nvSpPr", CT_ShapeNonVisual)
-register_element_cls("p:sp", CT_Shape)
-
-
-from pptx.oxml.shapes.connector import (  # noqa: E402
-    CT_Connection,
-    CT_Connector,
-    CT_ConnectorNonVisual,
-    CT_NonVisualConnectorProperties,
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.autoshape",
+    {
+        "a:avLst": "CT_GeomGuideList",
+        "a:custGeom": "CT_CustomGeometry2D",
+        "a:gd": "CT_GeomGuide",
+        "a:close": "CT_Path2DClose",
+        "a:lnTo": "CT_Path2DLineTo",
+        "a:moveTo": "CT_Path2DMoveTo",
+        "a:path": "CT_Path2D",
+        "a:pathLst": "CT_Path2DList",
+        "a:prstGeom": "CT_PresetGeometry2D",
+        "a:pt": "CT_AdjPoint2D",
+        "p:cNvSpPr": "CT_NonVisualDrawingShapeProps",
+        "p:nvSpPr": "CT_ShapeNonVisual",
+        "p:sp": "CT_Shape",
+    },
 )
 
-register_element_cls("a:endCxn", CT_Connection)
-register_element_cls("a:stCxn", CT_Connection)
-register_element_cls("p:cNvCxnSpPr", CT_NonVisualConnectorProperties)
-register_element_cls("p:cxnSp", CT_Connector)
-register_element_cls("p:nvCxnSpPr", CT_ConnectorNonVisual)
-
 
-from pptx.oxml.shapes.graphfrm import (  # noqa: E402
-    CT_GraphicalObject,
-    CT_GraphicalObjectData,
-    CT_GraphicalObjectFrame,
-    CT_GraphicalObjectFrameNonVisual,
-    CT_OleObject,
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.connector",
+    {
+        "a:endCxn": "CT_Connection",
+        "a:stCxn": "CT_Connection",
+        "p:cNvCxnSpPr": "CT_NonVisualConnectorProperties",
+        "p:cxnSp": "CT_Connector",
+        "p:nvCxnSpPr": "CT_ConnectorNonVisual",
+    },
 )
 
-register_element_cls("a:graphic", CT_GraphicalObject)
-register_element_cls("a:graphicData", CT_GraphicalObjectData)
-register_element_cls("p:graphicFrame", CT_GraphicalObjectFrame)
-register_element_cls("p:nvGraphicFramePr", CT_GraphicalObjectFrameNonVisual)
-register_element_cls("p:oleObj", CT_OleObject)
 
-
-from pptx.oxml.shapes.groupshape import (  # noqa: E402
-    CT_GroupShape,
-    CT_GroupShapeNonVisual,
-    CT_GroupShapeProperties,
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.graphfrm",
+    {
+        "a:graphic": "CT_GraphicalObject",
+        "a:graphicData": "CT_GraphicalObjectData",
+        "p:graphicFrame": "CT_GraphicalObjectFrame",
+        "p:nvGraphicFramePr": "CT_GraphicalObjectFrameNonVisual",
+        "p:oleObj": "CT_OleObject",
+    },
 )
 
-register_element_cls("p:grpSp", CT_GroupShape)
-register_element_cls("p:grpSpPr", CT_GroupShapeProperties)
-register_element_cls("p:nvGrpSpPr", CT_GroupShapeNonVisual)
-register_element_cls("p:spTree", CT_GroupShape)
 
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.groupshape",
+    {
+        "p:grpSp": "CT_GroupShape",
+        "p:grpSpPr": "CT_GroupShapeProperties",
+        "p:nvGrpSpPr": "CT_GroupShapeNonVisual",
+        "p:spTree": "CT_GroupShape",
+    },
+)
 
-from pptx.oxml.shapes.picture import CT_Picture, CT_PictureNonVisual  # noqa: E402
 
-register_element_cls("p:blipFill", CT_BlipFillProperties)
-register_element_cls("p:nvPicPr", CT_PictureNonVisual)
-register_element_cls("p:pic", CT_Picture)
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.picture",
+    {
+        "p:nvPicPr": "CT_PictureNonVisual",
+        "p:pic": "CT_Picture",
+    },
+)
 
 
-from pptx.oxml.shapes.shared import (  # noqa: E402
-    CT_ApplicationNonVisualDrawingProps,
-    CT_LineProperties,
-    CT_NonVisualDrawingProps,
-    CT_Placeholder,
-    CT_Point2D,
-    CT_PositiveSize2D,
-    CT_ShapeProperties,
-    CT_Transform2D,
+_register_lazy_element_clss(
+    "pptx.oxml.shapes.shared",
+    {
+        "a:chExt": "CT_PositiveSize2D",
+        "a:chOff": "CT_Point2D",
+        "a:ext": "CT_PositiveSize2D",
+        "a:ln": "CT_LineProperties",
+        "a:off": "CT_Point2D",
+        "a:xfrm": "CT_Transform2D",
+        "c:spPr": "CT_ShapeProperties",
+        "p:cNvPr": "CT_NonVisualDrawingProps",
+        "p:nvPr": "CT_ApplicationNonVisualDrawingProps",
+        "p:ph": "CT_Placeholder",
+        "p:spPr": "CT_ShapeProperties",
+        "p:xfrm": "CT_Transform2D",
+    },
 )
 
-register_element_cls("a:chExt", CT_PositiveSize2D)
-register_element_cls("a:chOff", CT_Point2D)
-register_element_cls("a:ext", CT_PositiveSize2D)
-register_element_cls("a:ln", CT_LineProperties)
-register_element_cls("a:off", CT_Point2D)
-register_element_cls("a:xfrm", CT_Transform2D)
-register_element_cls("c:spPr", CT_ShapeProperties)
-register_element_cls("p:cNvPr", CT_NonVisualDrawingProps)
-register_element_cls("p:nvPr", CT_ApplicationNonVisualDrawingProps)
-register_element_cls("p:ph", CT_Placeholder)
-register_element_cls("p:spPr", CT_ShapeProperties)
-register_element_cls("p:xfrm", CT_Transform2D)
-
-
-from pptx.oxml.slide import (  # noqa: E402
-    CT_Background,
-    CT_BackgroundProperties,
-    CT_CommonSlideData,
-    CT_NotesMaster,
-    CT_NotesSlide,
-    CT_Slide,
-    CT_SlideLayout,
-    CT_SlideLayoutIdList,
-    CT_SlideLayoutIdListEntry,
-    CT_SlideMaster,
-    CT_SlideTiming,
-    CT_TimeNodeList,
-    CT_TLMediaNodeVideo,
+
+_register_lazy_element_clss(
+    "pptx.oxml.slide",
+    {
+        "p:bg": "CT_Background",
+        "p:bgPr": "CT_BackgroundProperties",
+        "p:childTnLst": "CT_TimeNodeList",
+        "p:cSld": "CT_CommonSlideData",
+        "p:notes": "CT_NotesSlide",
+        "p:notesMaster": "CT_NotesMaster",
+        "p:sld": "CT_Slide",
+        "p:sldLayout": "CT_SlideLayout",
+        "p:sldLayoutId": "CT_SlideLayoutIdListEntry",
+        "p:sldLayoutIdLst": "CT_SlideLayoutIdList",
+        "p:sldMaster": "CT_SlideMaster",
+        "p:timing": "CT_SlideTiming",
+        "p:video": "CT_TLMediaNodeVideo",
+    },
 )
 
-register_element_cls("p:bg", CT_Background)
-register_element_cls("p:bgPr", CT_BackgroundProperties)
-register_element_cls("p:childTnLst", CT_TimeNodeList)
-register_element_cls("p:cSld", CT_CommonSlideData)
-register_element_cls("p:notes", CT_NotesSlide)
-register_element_cls("p:notesMaster", CT_NotesMaster)
-register_element_cls("p:sld", CT_Slide)
-register_element_cls("p:sldLayout", CT_SlideLayout)
-register_element_cls("p:sldLayoutId", CT_SlideLayoutIdListEntry)
-register_element_cls("p:sldLayoutIdLst", CT_SlideLayoutIdList)
-register_element_cls("p:sldMaster", CT_SlideMaster)
-register_element_cls("p:timing", CT_SlideTiming)
-register_element_cls("p:video", CT_TLMediaNodeVideo)
-
-
-from pptx.oxml.table import (  # noqa: E402
-    CT_Table,
-    CT_TableCell,
-    CT_TableCellProperties,
-    CT_TableCol,
-    CT_TableGrid,
-    CT_TableProperties,
-    CT_TableRow,
+
+_register_lazy_element_clss(
+    "pptx.oxml.table",
+    {
+        "a:gridCol": "CT_TableCol",
+        "a:tbl": "CT_Table",
+        "a:tblGrid": "CT_TableGrid",
+        "a:tblPr": "CT_TableProperties",
+        "a:tc": "CT_TableCell",
+        "a:tcPr": "CT_TableCellProperties",
+        "a:tr": "CT_TableRow",
+    },
 )
 
-register_element_cls("a:gridCol", CT_TableCol)
-register_element_cls("a:tbl", CT_Table)
-register_element_cls("a:tblGrid", CT_TableGrid)
-register_element_cls("a:tblPr", CT_TableProperties)
-register_element_cls("a:tc", CT_TableCell)
-register_element_cls("a:tcPr", CT_TableCellProperties)
-register_element_cls("a:tr", CT_TableRow)
-
-
-from pptx.oxml.text import (  # noqa: E402
-    CT_RegularTextRun,
-    CT_TextBody,
-    CT_TextBodyProperties,
-    CT_TextCharacterProperties,
-    CT_TextField,
-    CT_TextFont,
-    CT_TextLineBreak,
-    CT_TextNormalAutofit,
-    CT_TextParagraph,
-    CT_TextParagraphProperties,
-    CT_TextSpacing,
-    CT_TextSpacingPercent,
-    CT_TextSpacingPoint,
-    CT_TextCharBullet,
-    CT_TextNoBullet,
-    CT_ListStyle,
+
+_register_lazy_element_clss(
+    "pptx.oxml.text",
+    {
+        "a:bodyPr": "CT_TextBodyProperties",
+        "a:br": "CT_TextLineBreak",
+        "a:defRPr": "CT_TextCharacterProperties",
+        "a:endParaRPr": "CT_TextCharacterProperties",
+        "a:fld": "CT_TextField",
+        "a:latin": "CT_TextFont",
+        "a:lnSpc": "CT_TextSpacing",
+        "a:normAutofit": "CT_TextNormalAutofit",
+        "a:r": "CT_RegularTextRun",
+        "a:p": "CT_TextParagraph",
+        "a:pPr": "CT_TextParagraphProperties",
+        "c:rich": "CT_TextBody",
+        "a:rPr": "CT_TextCharacterProperties",
+        "a:spcAft": "CT_TextSpacing",
+        "a:spcBef": "CT_TextSpacing",
+        "a:spcPct": "CT_TextSpacingPercent",
+        "a:spcPts": "CT_TextSpacingPoint",
+        "a:buNone": "CT_TextNoBullet",
+        "a:buChar": "CT_TextCharBullet",
+        "a:txBody": "CT_TextBody",
+        "c:txPr": "CT_TextBody",
+        "p:txBody": "CT_TextBody",
+        "a:lstStyle": "CT_ListStyle",
+        "a:lvl1pPr": "CT_TextParagraphProperties",
+    },
 )
 
-register_element_cls("a:bodyPr", CT_TextBodyProperties)
-register_element_cls("a:br", CT_TextLineBreak)
-register_element_cls("a:defRPr", CT_TextCharacterProperties)
-register_element_cls("a:endParaRPr", CT_TextCharacterProperties)
-register_element_cls("a:fld", CT_TextField)
-register_element_cls("a:latin", CT_TextFont)
-register_element_cls("a:lnSpc", CT_TextSpacing)
-register_element_cls("a:normAutofit", CT_TextNormalAutofit)
-register_element_cls("a:r", CT_RegularTextRun)
-register_element_cls("a:p", CT_TextParagraph)
-register_element_cls("a:pPr", CT_TextParagraphProperties)
-register_element_cls("c:rich", CT_TextBody)
-register_element_cls("a:rPr", CT_TextCharacterProperties)
-register_element_cls("a:spcAft", CT_TextSpacing)
-register_element_cls("a:spcBef", CT_TextSpacing)
-register_element_cls("a:spcPct", CT_TextSpacingPercent)
-register_element_cls("a:spcPts", CT_TextSpacingPoint)
-register_element_cls("a:buNone", CT_TextNoBullet)
-register_element_cls("a:buChar", CT_TextCharBullet)
-register_element_cls("a:txBody", CT_TextBody)
-register_element_cls("c:txPr", CT_TextBody)
-register_element_cls("p:txBody", CT_TextBody)
-register_element_cls("a:lstStyle", CT_ListStyle)
-register_element_cls("a:lvl1pPr", CT_TextParagraphProperties)
-
-
-from pptx.oxml.theme import CT_OfficeStyleSheet  # noqa: E402
-
-register_element_cls("a:theme", CT_OfficeStyleSheet)
+
+_register_lazy_element_clss(
+    "pptx.oxml.theme",
+    {
+        "a:theme": "CT_OfficeStyleSheet",
+    },
+)
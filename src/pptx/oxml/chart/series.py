@@ -99,7 +99,7 @@ class CT_NumDataSource(BaseOxmlElement):
         Return the Y value for data point *idx* in this cache, or None if no
         value is present for that data point.
         """
-        results = self.xpath(".//c:pt[@idx=%d]" % idx)
+        results = self.xpath(".//c:pt[@idx=$idx]", idx=idx)
         return results[0].value if results else None
 
 
@@ -196,7 +196,7 @@ class CT_SeriesComposite(BaseOxmlElement):
         Return the `c:dPt` child representing the visual properties of the
         data point at index *idx*.
         """
-        matches = self.xpath('c:dPt[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dPt[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         dPt = self._add_dPt()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 
 # -- Maps namespace prefix to namespace name for all known PowerPoint XML namespaces --
 _nsmap = {
@@ -35,6 +36,9 @@ _nsmap = {
 
 pfxmap = {value: key for key, value in _nsmap.items()}
 
+# -- Maps each namespace-prefixed tag passed to `qn()` so far to its (interned) clark name --
+_clark_names: dict[str, str] = {}
+
 
 class NamespacePrefixedTag(str):
     """Value object that knows the semantics of an XML tag having a namespace prefix."""
@@ -124,6 +128,14 @@ def qn(namespace_prefixed_tag: str) -> str:
 
     As an example, `qn("p:cSld")` returns:
         `"{http://schemas.openxmlformats.org/drawingml/2006/main}cSld"`.
+
+    This is called on nearly every access to a child element, so the clark name of each tag is
+    only computed once and then looked up. Clark names are interned so the many element classes
+    and descriptors using the same tag share a single string.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    clark_name = _clark_names.get(namespace_prefixed_tag)
+    if clark_name is None:
+        clark_name = _clark_names[namespace_prefixed_tag] = sys.intern(
+            NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+        )
+    return clark_name
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, cast
 
 from pptx.oxml.simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
 from pptx.oxml.xmlchemy import BaseOxmlElement, RequiredAttribute, ZeroOrMore, ZeroOrOne
@@ -47,6 +47,18 @@ class CT_SlideId(BaseOxmlElement):
     id: int = RequiredAttribute("id", ST_SlideId)  # pyright: ignore[reportAssignmentType]
     rId: str = RequiredAttribute("r:id", XsdString)  # pyright: ignore[reportAssignmentType]
 
+    def addnext(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        """Insert `element` as the next sibling of this slide-id, noting the slide-order change."""
+        note_slide_order_change(element.getparent())
+        super().addnext(element)
+        note_slide_order_change(self.getparent())
+
+    def addprevious(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        """Insert `element` as the previous sibling of this slide-id, noting the change."""
+        note_slide_order_change(element.getparent())
+        super().addprevious(element)
+        note_slide_order_change(self.getparent())
+
 
 class CT_SlideIdList(BaseOxmlElement):
     """`p:sldIdLst` element.
@@ -59,6 +71,56 @@ class CT_SlideIdList(BaseOxmlElement):
     _add_sldId: Callable[..., CT_SlideId]
     sldId = ZeroOrMore("p:sldId")
 
+    # -- count of changes to the order of the `p:sldId` children, see `.slide_order_version` --
+    _slide_order_version = 0
+
+    # -- The lxml methods that change the children of this element are extended to count the
+    # -- change, so a lookup table built from the slide-ids in this list can tell it is out of
+    # -- date (see `.slide_order_version`). Appending an element not already in this list leaves
+    # -- the others where they were and so is not counted. An element moved here from another
+    # -- slide-id list counts as a change to that list.
+
+    def __delitem__(self, x: int | slice) -> None:
+        super().__delitem__(x)
+        note_slide_order_change(self)
+
+    def __setitem__(self, x: int | slice, value: Any) -> None:
+        elements = list(value) if isinstance(x, slice) else [value]
+        for element in elements:
+            note_slide_order_change(element.getparent())
+        super().__setitem__(x, elements if isinstance(x, slice) else value)
+        note_slide_order_change(self)
+
+    def append(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        note_slide_order_change(element.getparent())
+        super().append(element)
+
+    def clear(self, keep_tail: bool = False) -> None:
+        super().clear(keep_tail)
+        note_slide_order_change(self)
+
+    def extend(self, elements: Iterable[BaseOxmlElement]) -> None:  # pyright: ignore
+        elements = list(elements)
+        for element in elements:
+            note_slide_order_change(element.getparent())
+        super().extend(elements)
+
+    def insert(self, index: int, element: BaseOxmlElement) -> None:  # pyright: ignore
+        note_slide_order_change(element.getparent())
+        super().insert(index, element)
+        note_slide_order_change(self)
+
+    def remove(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        super().remove(element)
+        note_slide_order_change(self)
+
+    def replace(  # pyright: ignore
+        self, old_element: BaseOxmlElement, new_element: BaseOxmlElement
+    ) -> None:
+        note_slide_order_change(new_element.getparent())
+        super().replace(old_element, new_element)
+        note_slide_order_change(self)
+
     def add_sldId(self, rId: str) -> CT_SlideId:
         """Create and return a reference to a new `p:sldId` child element.
 
@@ -66,6 +128,18 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    @property
+    def slide_order_version(self) -> int:
+        """Count of the changes so far that moved or removed a `p:sldId` child of this list.
+
+        A `p:sldId` element removed, inserted before another or moved within this list through
+        the lxml methods of this element or of one of its children counts as a change; appending
+        a new one does not, since the others keep their positions. Changes made any other way,
+        such as with `lxml.etree` functions, are not counted. Used to tell when a lookup table
+        built from these slide-ids is out of date.
+        """
+        return self._slide_order_version
+
     @property
     def _next_id(self) -> int:
         """The next available slide ID as an `int`.
@@ -128,3 +202,9 @@ class CT_SlideSize(BaseOxmlElement):
     cy: Length = RequiredAttribute(  # pyright: ignore[reportAssignmentType]
         "cy", ST_SlideSizeCoordinate
     )
+
+
+def note_slide_order_change(elm: BaseOxmlElement | None) -> None:
+    """Count a change to the order of the slide-ids under `elm` when it is a `p:sldIdLst`."""
+    if isinstance(elm, CT_SlideIdList):
+        elm._slide_order_version += 1  # pyright: ignore[reportPrivateUsage]
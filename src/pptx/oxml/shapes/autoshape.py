@@ -7,7 +7,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, cast
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import (
@@ -199,6 +199,133 @@ class CT_Shape(BaseShapeElement):
     spPr: CT_ShapeProperties = OneAndOnlyOne("p:spPr")  # pyright: ignore[reportAssignmentType]
     txBody: CT_TextBody | None = ZeroOrOne("p:txBody", successors=("p:extLst",))  # pyright: ignore
 
+    # -- Fixed XML of each kind of new shape, see `pptx.oxml.parse_prototype()`. The id, name,
+    # -- position and size of each new shape are set on the copy. --
+    _autoshape_sp_xml = (
+        "<p:sp %s>\n"
+        "  <p:nvSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvSpPr/>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvSpPr>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        '    <a:prstGeom prst="rect">\n'
+        "      <a:avLst/>\n"
+        "    </a:prstGeom>\n"
+        "  </p:spPr>\n"
+        "  <p:style>\n"
+        '    <a:lnRef idx="1">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:lnRef>\n"
+        '    <a:fillRef idx="3">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:fillRef>\n"
+        '    <a:effectRef idx="2">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:effectRef>\n"
+        '    <a:fontRef idx="minor">\n'
+        '      <a:schemeClr val="lt1"/>\n'
+        "    </a:fontRef>\n"
+        "  </p:style>\n"
+        "  <p:txBody>\n"
+        '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
+        "    <a:lstStyle/>\n"
+        "    <a:p>\n"
+        '      <a:pPr algn="ctr"/>\n'
+        "    </a:p>\n"
+        "  </p:txBody>\n"
+        "</p:sp>" % nsdecls("a", "p")
+    )
+
+    _freeform_sp_xml = (
+        "<p:sp %s>\n"
+        "  <p:nvSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvSpPr/>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvSpPr>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        "    <a:custGeom>\n"
+        "      <a:avLst/>\n"
+        "      <a:gdLst/>\n"
+        "      <a:ahLst/>\n"
+        "      <a:cxnLst/>\n"
+        '      <a:rect l="l" t="t" r="r" b="b"/>\n'
+        "      <a:pathLst/>\n"
+        "    </a:custGeom>\n"
+        "  </p:spPr>\n"
+        "  <p:style>\n"
+        '    <a:lnRef idx="1">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:lnRef>\n"
+        '    <a:fillRef idx="3">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:fillRef>\n"
+        '    <a:effectRef idx="2">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:effectRef>\n"
+        '    <a:fontRef idx="minor">\n'
+        '      <a:schemeClr val="lt1"/>\n'
+        "    </a:fontRef>\n"
+        "  </p:style>\n"
+        "  <p:txBody>\n"
+        '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
+        "    <a:lstStyle/>\n"
+        "    <a:p>\n"
+        '      <a:pPr algn="ctr"/>\n'
+        "    </a:p>\n"
+        "  </p:txBody>\n"
+        "</p:sp>" % nsdecls("a", "p")
+    )
+
+    _placeholder_sp_xml = (
+        "<p:sp %s>\n"
+        "  <p:nvSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvSpPr>\n"
+        '      <a:spLocks noGrp="1"/>\n'
+        "    </p:cNvSpPr>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvSpPr>\n"
+        "  <p:spPr/>\n"
+        "</p:sp>" % nsdecls("a", "p")
+    )
+
+    _textbox_sp_xml = (
+        "<p:sp %s>\n"
+        "  <p:nvSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        '    <p:cNvSpPr txBox="1"/>\n'
+        "    <p:nvPr/>\n"
+        "  </p:nvSpPr>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        '    <a:prstGeom prst="rect">\n'
+        "      <a:avLst/>\n"
+        "    </a:prstGeom>\n"
+        "    <a:noFill/>\n"
+        "  </p:spPr>\n"
+        "  <p:txBody>\n"
+        '    <a:bodyPr wrap="none">\n'
+        "      <a:spAutoFit/>\n"
+        "    </a:bodyPr>\n"
+        "    <a:lstStyle/>\n"
+        "    <a:p/>\n"
+        "  </p:txBody>\n"
+        "</p:sp>" % nsdecls("a", "p")
+    )
+
     def add_path(self, w: Length, h: Length) -> CT_Path2D:
         custGeom = self.spPr.custGeom
         if custGeom is None:
@@ -250,46 +377,11 @@ class CT_Shape(BaseShapeElement):
         id_: int, name: str, prst: str, left: int, top: int, width: int, height: int
     ) -> CT_Shape:
         """Return a new `p:sp` element tree configured as a base auto shape."""
-        xml = (
-            "<p:sp %s>\n"
-            "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
-            "    <p:cNvSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvSpPr>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
-            "    </a:xfrm>\n"
-            '    <a:prstGeom prst="%s">\n'
-            "      <a:avLst/>\n"
-            "    </a:prstGeom>\n"
-            "  </p:spPr>\n"
-            "  <p:style>\n"
-            '    <a:lnRef idx="1">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:lnRef>\n"
-            '    <a:fillRef idx="3">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:fillRef>\n"
-            '    <a:effectRef idx="2">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:effectRef>\n"
-            '    <a:fontRef idx="minor">\n'
-            '      <a:schemeClr val="lt1"/>\n'
-            "    </a:fontRef>\n"
-            "  </p:style>\n"
-            "  <p:txBody>\n"
-            '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
-            "    <a:lstStyle/>\n"
-            "    <a:p>\n"
-            '      <a:pPr algn="ctr"/>\n'
-            "    </a:p>\n"
-            "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d", "%s")
-        ) % (id_, name, left, top, width, height, prst)
-        return cast(CT_Shape, parse_xml(xml))
+        sp = cast(CT_Shape, parse_prototype(CT_Shape._autoshape_sp_xml))
+        spPr = sp[1]
+        sp._init_new_shape(id_, name, spPr[0], left, top, width, height)
+        spPr[1].set("prst", prst)
+        return sp
 
     @staticmethod
     def new_freeform_sp(shape_id: int, name: str, x: int, y: int, cx: int, cy: int):
@@ -298,72 +390,17 @@ class CT_Shape(BaseShapeElement):
         The returned shape has a `a:custGeom` subtree but no paths in its
         path list.
         """
-        xml = (
-            "<p:sp %s>\n"
-            "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
-            "    <p:cNvSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvSpPr>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
-            "    </a:xfrm>\n"
-            "    <a:custGeom>\n"
-            "      <a:avLst/>\n"
-            "      <a:gdLst/>\n"
-            "      <a:ahLst/>\n"
-            "      <a:cxnLst/>\n"
-            '      <a:rect l="l" t="t" r="r" b="b"/>\n'
-            "      <a:pathLst/>\n"
-            "    </a:custGeom>\n"
-            "  </p:spPr>\n"
-            "  <p:style>\n"
-            '    <a:lnRef idx="1">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:lnRef>\n"
-            '    <a:fillRef idx="3">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:fillRef>\n"
-            '    <a:effectRef idx="2">\n'
-            '      <a:schemeClr val="accent1"/>\n'
-            "    </a:effectRef>\n"
-            '    <a:fontRef idx="minor">\n'
-            '      <a:schemeClr val="lt1"/>\n'
-            "    </a:fontRef>\n"
-            "  </p:style>\n"
-            "  <p:txBody>\n"
-            '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
-            "    <a:lstStyle/>\n"
-            "    <a:p>\n"
-            '      <a:pPr algn="ctr"/>\n'
-            "    </a:p>\n"
-            "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
-        ) % (shape_id, name, x, y, cx, cy)
-        return cast(CT_Shape, parse_xml(xml))
+        sp = cast(CT_Shape, parse_prototype(CT_Shape._freeform_sp_xml))
+        sp._init_new_shape(shape_id, name, sp[1][0], x, y, cx, cy)
+        return sp
 
     @staticmethod
     def new_placeholder_sp(
         id_: int, name: str, ph_type: PP_PLACEHOLDER, orient: str, sz, idx
     ) -> CT_Shape:
         """Return a new `p:sp` element tree configured as a placeholder shape."""
-        sp = cast(
-            CT_Shape,
-            parse_xml(
-                f"<p:sp {nsdecls('a', 'p')}>\n"
-                f"  <p:nvSpPr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
-                f"    <p:cNvSpPr>\n"
-                f'      <a:spLocks noGrp="1"/>\n'
-                f"    </p:cNvSpPr>\n"
-                f"    <p:nvPr/>\n"
-                f"  </p:nvSpPr>\n"
-                f"  <p:spPr/>\n"
-                f"</p:sp>"
-            ),
-        )
+        sp = cast(CT_Shape, parse_prototype(CT_Shape._placeholder_sp_xml))
+        sp._init_new_shape(id_, name)
 
         ph = sp.nvSpPr.nvPr.get_or_add_ph()
         ph.type = ph_type
@@ -387,9 +424,8 @@ class CT_Shape(BaseShapeElement):
     @staticmethod
     def new_textbox_sp(id_, name, left, top, width, height):
         """Return a new `p:sp` element tree configured as a base textbox shape."""
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
+        sp = cast(CT_Shape, parse_prototype(CT_Shape._textbox_sp_xml))
+        sp._init_new_shape(id_, name, sp[1][0], left, top, width, height)
         return sp
 
     @property
@@ -411,35 +447,6 @@ class CT_Shape(BaseShapeElement):
     def _new_txBody(self):
         return CT_TextBody.new_p_txBody()
 
-    @staticmethod
-    def _textbox_sp_tmpl():
-        return (
-            "<p:sp %s>\n"
-            "  <p:nvSpPr>\n"
-            '    <p:cNvPr id="%s" name="%s"/>\n'
-            '    <p:cNvSpPr txBox="1"/>\n'
-            "    <p:nvPr/>\n"
-            "  </p:nvSpPr>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%s" y="%s"/>\n'
-            '      <a:ext cx="%s" cy="%s"/>\n'
-            "    </a:xfrm>\n"
-            '    <a:prstGeom prst="rect">\n'
-            "      <a:avLst/>\n"
-            "    </a:prstGeom>\n"
-            "    <a:noFill/>\n"
-            "  </p:spPr>\n"
-            "  <p:txBody>\n"
-            '    <a:bodyPr wrap="none">\n'
-            "      <a:spAutoFit/>\n"
-            "    </a:bodyPr>\n"
-            "    <a:lstStyle/>\n"
-            "    <a:p/>\n"
-            "  </p:txBody>\n"
-            "</p:sp>" % (nsdecls("a", "p"), "%d", "%s", "%d", "%d", "%d", "%d")
-        )
-
 
 class CT_ShapeNonVisual(BaseShapeElement):
     """`p:nvSpPr` custom element class."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import ST_DrawingElementId, XsdUnsignedInt
@@ -32,6 +32,40 @@ class CT_Connector(BaseShapeElement):
     spPr: CT_ShapeProperties = OneAndOnlyOne("p:spPr")  # pyright: ignore[reportAssignmentType]
     del _tag_seq
 
+    # -- Fixed XML of a new connector, see `pptx.oxml.parse_prototype()` --
+    _cxnSp_xml = (
+        "<p:cxnSp %s>\n"
+        "  <p:nvCxnSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvCxnSpPr/>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvCxnSpPr>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        '    <a:prstGeom prst="line">\n'
+        "      <a:avLst/>\n"
+        "    </a:prstGeom>\n"
+        "  </p:spPr>\n"
+        "  <p:style>\n"
+        '    <a:lnRef idx="2">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:lnRef>\n"
+        '    <a:fillRef idx="0">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:fillRef>\n"
+        '    <a:effectRef idx="1">\n'
+        '      <a:schemeClr val="accent1"/>\n'
+        "    </a:effectRef>\n"
+        '    <a:fontRef idx="minor">\n'
+        '      <a:schemeClr val="tx1"/>\n'
+        "    </a:fontRef>\n"
+        "  </p:style>\n"
+        "</p:cxnSp>" % nsdecls("a", "p")
+    )
+
     @classmethod
     def new_cxnSp(
         cls,
@@ -46,42 +80,16 @@ class CT_Connector(BaseShapeElement):
         flipV: bool,
     ) -> CT_Connector:
         """Return a new `p:cxnSp` element tree configured as a base connector."""
-        flip = (' flipH="1"' if flipH else "") + (' flipV="1"' if flipV else "")
-        return cast(
-            CT_Connector,
-            parse_xml(
-                f"<p:cxnSp {nsdecls('a', 'p')}>\n"
-                f"  <p:nvCxnSpPr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
-                f"    <p:cNvCxnSpPr/>\n"
-                f"    <p:nvPr/>\n"
-                f"  </p:nvCxnSpPr>\n"
-                f"  <p:spPr>\n"
-                f"    <a:xfrm{flip}>\n"
-                f'      <a:off x="{x}" y="{y}"/>\n'
-                f'      <a:ext cx="{cx}" cy="{cy}"/>\n'
-                f"    </a:xfrm>\n"
-                f'    <a:prstGeom prst="{prst}">\n'
-                f"      <a:avLst/>\n"
-                f"    </a:prstGeom>\n"
-                f"  </p:spPr>\n"
-                f"  <p:style>\n"
-                f'    <a:lnRef idx="2">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:lnRef>\n"
-                f'    <a:fillRef idx="0">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:fillRef>\n"
-                f'    <a:effectRef idx="1">\n'
-                f'      <a:schemeClr val="accent1"/>\n'
-                f"    </a:effectRef>\n"
-                f'    <a:fontRef idx="minor">\n'
-                f'      <a:schemeClr val="tx1"/>\n'
-                f"    </a:fontRef>\n"
-                f"  </p:style>\n"
-                f"</p:cxnSp>"
-            ),
-        )
+        cxnSp = cast(CT_Connector, parse_prototype(cls._cxnSp_xml))
+        spPr = cxnSp[1]
+        xfrm = spPr[0]
+        cxnSp._init_new_shape(id_, name, xfrm, x, y, cx, cy)
+        if flipH:
+            xfrm.set("flipH", "1")
+        if flipV:
+            xfrm.set("flipV", "1")
+        spPr[1].set("prst", prst)
+        return cxnSp
 
 
 class CT_ConnectorNonVisual(BaseOxmlElement):
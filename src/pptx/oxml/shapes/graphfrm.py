@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
 
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.chart.chart import CT_Chart
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import XsdBoolean, XsdString
 from pptx.oxml.table import CT_Table
@@ -130,6 +130,71 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         "a:graphic"
     )
 
+    # -- Fixed XML of each kind of new graphic-frame, see `pptx.oxml.parse_prototype()` --
+    _graphicFrame_xml = (
+        "<p:graphicFrame %s>\n"
+        "  <p:nvGraphicFramePr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvGraphicFramePr>\n"
+        '      <a:graphicFrameLocks noGrp="1"/>\n'
+        "    </p:cNvGraphicFramePr>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvGraphicFramePr>\n"
+        "  <p:xfrm>\n"
+        '    <a:off x="0" y="0"/>\n'
+        '    <a:ext cx="0" cy="0"/>\n'
+        "  </p:xfrm>\n"
+        "  <a:graphic>\n"
+        "    <a:graphicData/>\n"
+        "  </a:graphic>\n"
+        "</p:graphicFrame>" % nsdecls("a", "p")
+    )
+
+    _ole_object_graphicFrame_xml = (
+        "<p:graphicFrame %s>\n"
+        "  <p:nvGraphicFramePr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvGraphicFramePr>\n"
+        '      <a:graphicFrameLocks noGrp="1"/>\n'
+        "    </p:cNvGraphicFramePr>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvGraphicFramePr>\n"
+        "  <p:xfrm>\n"
+        '    <a:off x="0" y="0"/>\n'
+        '    <a:ext cx="0" cy="0"/>\n'
+        "  </p:xfrm>\n"
+        "  <a:graphic>\n"
+        '    <a:graphicData uri="http://schemas.openxmlformats.org/presentationml/2006/ole">\n'
+        '      <p:oleObj showAsIcon="1" r:id="" imgW="0" imgH="0" progId="">\n'
+        "        <p:embed/>\n"
+        "        <p:pic>\n"
+        "          <p:nvPicPr>\n"
+        '            <p:cNvPr id="0" name=""/>\n'
+        "            <p:cNvPicPr/>\n"
+        "            <p:nvPr/>\n"
+        "          </p:nvPicPr>\n"
+        "          <p:blipFill>\n"
+        '            <a:blip r:embed=""/>\n'
+        "            <a:stretch>\n"
+        "              <a:fillRect/>\n"
+        "            </a:stretch>\n"
+        "          </p:blipFill>\n"
+        "          <p:spPr>\n"
+        "            <a:xfrm>\n"
+        '              <a:off x="0" y="0"/>\n'
+        '              <a:ext cx="0" cy="0"/>\n'
+        "            </a:xfrm>\n"
+        '            <a:prstGeom prst="rect">\n'
+        "              <a:avLst/>\n"
+        "            </a:prstGeom>\n"
+        "          </p:spPr>\n"
+        "        </p:pic>\n"
+        "      </p:oleObj>\n"
+        "    </a:graphicData>\n"
+        "  </a:graphic>\n"
+        "</p:graphicFrame>" % nsdecls("a", "p", "r")
+    )
+
     @property
     def chart(self) -> CT_Chart | None:
         """The `c:chart` great-grandchild element, or |None| if not present."""
@@ -197,27 +262,9 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         Note that a graphicFrame element is not a valid shape until it contains a graphical object
         such as a table.
         """
-        return cast(
-            CT_GraphicalObjectFrame,
-            parse_xml(
-                f"<p:graphicFrame {nsdecls('a', 'p')}>\n"
-                f"  <p:nvGraphicFramePr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
-                f"    <p:cNvGraphicFramePr>\n"
-                f'      <a:graphicFrameLocks noGrp="1"/>\n'
-                f"    </p:cNvGraphicFramePr>\n"
-                f"    <p:nvPr/>\n"
-                f"  </p:nvGraphicFramePr>\n"
-                f"  <p:xfrm>\n"
-                f'    <a:off x="{x}" y="{y}"/>\n'
-                f'    <a:ext cx="{cx}" cy="{cy}"/>\n'
-                f"  </p:xfrm>\n"
-                f"  <a:graphic>\n"
-                f"    <a:graphicData/>\n"
-                f"  </a:graphic>\n"
-                f"</p:graphicFrame>"
-            ),
-        )
+        graphicFrame = cast(CT_GraphicalObjectFrame, parse_prototype(cls._graphicFrame_xml))
+        graphicFrame._init_new_shape(id_, name, graphicFrame[1], x, y, cx, cy)
+        return graphicFrame
 
     @classmethod
     def new_ole_object_graphicFrame(
@@ -244,58 +291,23 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         `icon_rId` identifies the relationship to an image part used to display the OLE-object as
         an icon (vs. a preview).
         """
-        return cast(
-            CT_GraphicalObjectFrame,
-            parse_xml(
-                f"<p:graphicFrame {nsdecls('a', 'p', 'r')}>\n"
-                f"  <p:nvGraphicFramePr>\n"
-                f'    <p:cNvPr id="{id_}" name="{name}"/>\n'
-                f"    <p:cNvGraphicFramePr>\n"
-                f'      <a:graphicFrameLocks noGrp="1"/>\n'
-                f"    </p:cNvGraphicFramePr>\n"
-                f"    <p:nvPr/>\n"
-                f"  </p:nvGraphicFramePr>\n"
-                f"  <p:xfrm>\n"
-                f'    <a:off x="{x}" y="{y}"/>\n'
-                f'    <a:ext cx="{cx}" cy="{cy}"/>\n'
-                f"  </p:xfrm>\n"
-                f"  <a:graphic>\n"
-                f"    <a:graphicData"
-                f'        uri="http://schemas.openxmlformats.org/presentationml/2006/ole">\n'
-                f'      <p:oleObj showAsIcon="1"'
-                f'                r:id="{ole_object_rId}"'
-                f'                imgW="{imgW}"'
-                f'                imgH="{imgH}"'
-                f'                progId="{progId}">\n'
-                f"        <p:embed/>\n"
-                f"        <p:pic>\n"
-                f"          <p:nvPicPr>\n"
-                f'            <p:cNvPr id="0" name=""/>\n'
-                f"            <p:cNvPicPr/>\n"
-                f"            <p:nvPr/>\n"
-                f"          </p:nvPicPr>\n"
-                f"          <p:blipFill>\n"
-                f'            <a:blip r:embed="{icon_rId}"/>\n'
-                f"            <a:stretch>\n"
-                f"              <a:fillRect/>\n"
-                f"            </a:stretch>\n"
-                f"          </p:blipFill>\n"
-                f"          <p:spPr>\n"
-                f"            <a:xfrm>\n"
-                f'              <a:off x="{x}" y="{y}"/>\n'
-                f'              <a:ext cx="{cx}" cy="{cy}"/>\n'
-                f"            </a:xfrm>\n"
-                f'            <a:prstGeom prst="rect">\n'
-                f"              <a:avLst/>\n"
-                f"            </a:prstGeom>\n"
-                f"          </p:spPr>\n"
-                f"        </p:pic>\n"
-                f"      </p:oleObj>\n"
-                f"    </a:graphicData>\n"
-                f"  </a:graphic>\n"
-                f"</p:graphicFrame>"
-            ),
+        graphicFrame = cast(
+            CT_GraphicalObjectFrame, parse_prototype(cls._ole_object_graphicFrame_xml)
         )
+        graphicFrame._init_new_shape(id_, name, graphicFrame[1], x, y, cx, cy)
+        oleObj = graphicFrame[2][0][0]
+        oleObj.set(qn("r:id"), ole_object_rId)
+        oleObj.set("imgW", "%d" % imgW)
+        oleObj.set("imgH", "%d" % imgH)
+        oleObj.set("progId", progId)
+        pic = oleObj[1]
+        pic[1][0].set(qn("r:embed"), icon_rId)
+        off, ext = pic[2][0]
+        off.set("x", "%d" % x)
+        off.set("y", "%d" % y)
+        ext.set("cx", "%d" % cx)
+        ext.set("cy", "%d" % cy)
+        return graphicFrame
 
     @classmethod
     def new_table_graphicFrame(
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Sequence, cast
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
-from pptx.oxml.shapes.shared import BaseShapeElement
+from pptx.oxml.shapes.shared import BaseShapeElement, note_shape_tree_change
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
 from pptx.util import Emu
 
@@ -40,6 +40,79 @@ class CT_GroupShape(BaseShapeElement):
         qn("p:contentPart"),
     )
 
+    # -- Fixed XML of a new group shape, see `pptx.oxml.parse_prototype()` --
+    _grpSp_xml = (
+        "<p:grpSp %s>\n"
+        "  <p:nvGrpSpPr>\n"
+        '    <p:cNvPr id="0" name=""/>\n'
+        "    <p:cNvGrpSpPr/>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvGrpSpPr>\n"
+        "  <p:grpSpPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        '      <a:chOff x="0" y="0"/>\n'
+        '      <a:chExt cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        "  </p:grpSpPr>\n"
+        "</p:grpSp>" % nsdecls("a", "p", "r")
+    )
+
+    # -- The lxml methods that change the children of this element are extended to count the
+    # -- change, so a lookup table built from the shapes in this tree can tell it is out of date
+    # -- (see `.shape_tree_version`). An element moved here from another shape tree counts as a
+    # -- change to that tree as well.
+
+    def __delitem__(self, x: int | slice) -> None:
+        super().__delitem__(x)
+        note_shape_tree_change(self)
+
+    def __setitem__(self, x: int | slice, value: Any) -> None:
+        elements = list(value) if isinstance(x, slice) else [value]
+        for element in elements:
+            note_shape_tree_change(element.getparent())
+        super().__setitem__(x, elements if isinstance(x, slice) else value)
+        note_shape_tree_change(self)
+
+    def append(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        note_shape_tree_change(element.getparent())
+        super().append(element)
+        note_shape_tree_change(self)
+
+    def clear(self, keep_tail: bool = False) -> None:
+        super().clear(keep_tail)
+        note_shape_tree_change(self)
+
+    def extend(self, elements: Iterable[BaseOxmlElement]) -> None:  # pyright: ignore
+        elements = list(elements)
+        for element in elements:
+            note_shape_tree_change(element.getparent())
+        super().extend(elements)
+        note_shape_tree_change(self)
+
+    def insert(self, index: int, element: BaseOxmlElement) -> None:  # pyright: ignore
+        note_shape_tree_change(element.getparent())
+        super().insert(index, element)
+        note_shape_tree_change(self)
+
+    def insert_element_before(self, elm: BaseOxmlElement, *tagnames: str):
+        note_shape_tree_change(elm.getparent())
+        elm = super().insert_element_before(elm, *tagnames)
+        note_shape_tree_change(self)
+        return elm
+
+    def remove(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        super().remove(element)
+        note_shape_tree_change(self)
+
+    def replace(  # pyright: ignore
+        self, old_element: BaseOxmlElement, new_element: BaseOxmlElement
+    ) -> None:
+        note_shape_tree_change(new_element.getparent())
+        super().replace(old_element, new_element)
+        note_shape_tree_change(self)
+
     def add_autoshape(
         self, id_: int, name: str, prst: str, x: int, y: int, cx: int, cy: int
     ) -> CT_Shape:
@@ -118,6 +191,16 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, "p:extLst")
         return sp
 
+    def append_shape_elms(self, shape_elms: Sequence[ShapeElement]) -> None:
+        """Append each of `shape_elms` to this group/shapetree in a single operation.
+
+        Like the `add_*()` methods, the elements are placed after any existing shapes but ahead
+        of any `p:extLst` element.
+        """
+        extLst = self.find(qn("p:extLst"))
+        idx = len(self) if extLst is None else self.index(extLst)
+        self[idx:idx] = shape_elms
+
     @property
     def chExt(self):
         """Descendent `p:grpSpPr/a:xfrm/a:chExt` element."""
@@ -165,24 +248,8 @@ class CT_GroupShape(BaseShapeElement):
     @classmethod
     def new_grpSp(cls, id_: int, name: str) -> CT_GroupShape:
         """Return new "loose" `p:grpSp` element having `id_` and `name`."""
-        xml = (
-            "<p:grpSp %s>\n"
-            "  <p:nvGrpSpPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s"/>\n'
-            "    <p:cNvGrpSpPr/>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvGrpSpPr>\n"
-            "  <p:grpSpPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="0" y="0"/>\n'
-            '      <a:ext cx="0" cy="0"/>\n'
-            '      <a:chOff x="0" y="0"/>\n'
-            '      <a:chExt cx="0" cy="0"/>\n'
-            "    </a:xfrm>\n"
-            "  </p:grpSpPr>\n"
-            "</p:grpSp>" % nsdecls("a", "p", "r")
-        ) % (id_, name)
-        grpSp = parse_xml(xml)
+        grpSp = cast(CT_GroupShape, parse_prototype(cls._grpSp_xml))
+        grpSp._init_new_shape(id_, name)
         return grpSp
 
     def recalculate_extents(self) -> None:
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast
-from xml.sax.saxutils import escape
 
-from pptx.oxml import parse_xml
-from pptx.oxml.ns import nsdecls
+from pptx.oxml import parse_prototype
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne
 
@@ -25,6 +24,90 @@ class CT_Picture(BaseShapeElement):
     blipFill = OneAndOnlyOne("p:blipFill")
     spPr: CT_ShapeProperties = OneAndOnlyOne("p:spPr")  # pyright: ignore[reportAssignmentType]
 
+    # -- Fixed XML of each kind of new picture, see `pptx.oxml.parse_prototype()` --
+    _pic_xml = (
+        "<p:pic %s>\n"
+        "  <p:nvPicPr>\n"
+        '    <p:cNvPr id="0" name="" descr=""/>\n'
+        "    <p:cNvPicPr>\n"
+        '      <a:picLocks noChangeAspect="1"/>\n'
+        "    </p:cNvPicPr>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvPicPr>\n"
+        "  <p:blipFill>\n"
+        '    <a:blip r:embed=""/>\n'
+        "    <a:stretch>\n"
+        "      <a:fillRect/>\n"
+        "    </a:stretch>\n"
+        "  </p:blipFill>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        '    <a:prstGeom prst="rect">\n'
+        "      <a:avLst/>\n"
+        "    </a:prstGeom>\n"
+        "  </p:spPr>\n"
+        "</p:pic>" % nsdecls("a", "p", "r")
+    )
+
+    _ph_pic_xml = (
+        "<p:pic %s>\n"
+        "  <p:nvPicPr>\n"
+        '    <p:cNvPr id="0" name="" descr=""/>\n'
+        "    <p:cNvPicPr>\n"
+        '      <a:picLocks noGrp="1" noChangeAspect="1"/>\n'
+        "    </p:cNvPicPr>\n"
+        "    <p:nvPr/>\n"
+        "  </p:nvPicPr>\n"
+        "  <p:blipFill>\n"
+        '    <a:blip r:embed=""/>\n'
+        "    <a:stretch>\n"
+        "      <a:fillRect/>\n"
+        "    </a:stretch>\n"
+        "  </p:blipFill>\n"
+        "  <p:spPr/>\n"
+        "</p:pic>" % nsdecls("p", "a", "r")
+    )
+
+    _video_pic_xml = (
+        "<p:pic %s>\n"
+        "  <p:nvPicPr>\n"
+        '    <p:cNvPr id="0" name="">\n'
+        '      <a:hlinkClick r:id="" action="ppaction://media"/>\n'
+        "    </p:cNvPr>\n"
+        "    <p:cNvPicPr>\n"
+        '      <a:picLocks noChangeAspect="1"/>\n'
+        "    </p:cNvPicPr>\n"
+        "    <p:nvPr>\n"
+        '      <a:videoFile r:link=""/>\n'
+        "      <p:extLst>\n"
+        '        <p:ext uri="{DAA4B4D4-6D71-4841-9C94-3DE7FCFB9230}">\n'
+        '          <p14:media xmlns:p14="http://schemas.microsoft.com/of'
+        'fice/powerpoint/2010/main" r:embed=""/>\n'
+        "        </p:ext>\n"
+        "      </p:extLst>\n"
+        "    </p:nvPr>\n"
+        "  </p:nvPicPr>\n"
+        "  <p:blipFill>\n"
+        '    <a:blip r:embed=""/>\n'
+        "    <a:stretch>\n"
+        "      <a:fillRect/>\n"
+        "    </a:stretch>\n"
+        "  </p:blipFill>\n"
+        "  <p:spPr>\n"
+        "    <a:xfrm>\n"
+        '      <a:off x="0" y="0"/>\n'
+        '      <a:ext cx="0" cy="0"/>\n'
+        "    </a:xfrm>\n"
+        '    <a:prstGeom prst="rect">\n'
+        "      <a:avLst/>\n"
+        "    </a:prstGeom>\n"
+        "  </p:spPr>\n"
+        "</p:pic>" % nsdecls("a", "p", "r")
+    )
+
     @property
     def blip_rId(self) -> str | None:
         """Value of `p:blipFill/a:blip/@r:embed`.
@@ -63,12 +146,20 @@ class CT_Picture(BaseShapeElement):
         Return a new `p:pic` placeholder element populated with the supplied
         parameters.
         """
-        return parse_xml(cls._pic_ph_tmpl() % (id_, name, desc, rId))
+        pic = cast(CT_Picture, parse_prototype(cls._ph_pic_xml))
+        pic._init_new_shape(id_, name)
+        pic[0][0].set("descr", desc)
+        pic[1][0].set(qn("r:embed"), rId)
+        return pic
 
     @classmethod
     def new_pic(cls, shape_id, name, desc, rId, x, y, cx, cy):
         """Return new `<p:pic>` element tree configured with supplied parameters."""
-        return parse_xml(cls._pic_tmpl() % (shape_id, name, escape(desc), rId, x, y, cx, cy))
+        pic = cast(CT_Picture, parse_prototype(cls._pic_xml))
+        pic._init_new_shape(shape_id, name, pic[2][0], x, y, cx, cy)
+        pic[0][0].set("descr", desc)
+        pic[1][0].set(qn("r:embed"), rId)
+        return pic
 
     @classmethod
     def new_video_pic(
@@ -84,23 +175,13 @@ class CT_Picture(BaseShapeElement):
         cy: Length,
     ) -> CT_Picture:
         """Return a new `p:pic` populated with the specified video."""
-        return cast(
-            CT_Picture,
-            parse_xml(
-                cls._pic_video_tmpl()
-                % (
-                    shape_id,
-                    shape_name,
-                    video_rId,
-                    media_rId,
-                    poster_frame_rId,
-                    x,
-                    y,
-                    cx,
-                    cy,
-                )
-            ),
-        )
+        pic = cast(CT_Picture, parse_prototype(cls._video_pic_xml))
+        pic._init_new_shape(shape_id, shape_name, pic[2][0], x, y, cx, cy)
+        nvPr = pic[0][2]
+        nvPr[0].set(qn("r:link"), video_rId)
+        nvPr[1][0][0].set(qn("r:embed"), media_rId)
+        pic[1][0].set(qn("r:embed"), poster_frame_rId)
+        return pic
 
     @property
     def srcRect_b(self):
@@ -161,95 +242,6 @@ class CT_Picture(BaseShapeElement):
             return (0.0, crop, 0.0, crop)
         return (0.0, 0.0, 0.0, 0.0)
 
-    @classmethod
-    def _pic_ph_tmpl(cls):
-        return (
-            "<p:pic %s>\n"
-            "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s" descr="%%s"/>\n'
-            "    <p:cNvPicPr>\n"
-            '      <a:picLocks noGrp="1" noChangeAspect="1"/>\n'
-            "    </p:cNvPicPr>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvPicPr>\n"
-            "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
-            "    <a:stretch>\n"
-            "      <a:fillRect/>\n"
-            "    </a:stretch>\n"
-            "  </p:blipFill>\n"
-            "  <p:spPr/>\n"
-            "</p:pic>" % nsdecls("p", "a", "r")
-        )
-
-    @classmethod
-    def _pic_tmpl(cls):
-        return (
-            "<p:pic %s>\n"
-            "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s" descr="%%s"/>\n'
-            "    <p:cNvPicPr>\n"
-            '      <a:picLocks noChangeAspect="1"/>\n'
-            "    </p:cNvPicPr>\n"
-            "    <p:nvPr/>\n"
-            "  </p:nvPicPr>\n"
-            "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
-            "    <a:stretch>\n"
-            "      <a:fillRect/>\n"
-            "    </a:stretch>\n"
-            "  </p:blipFill>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%%d" y="%%d"/>\n'
-            '      <a:ext cx="%%d" cy="%%d"/>\n'
-            "    </a:xfrm>\n"
-            '    <a:prstGeom prst="rect">\n'
-            "      <a:avLst/>\n"
-            "    </a:prstGeom>\n"
-            "  </p:spPr>\n"
-            "</p:pic>" % nsdecls("a", "p", "r")
-        )
-
-    @classmethod
-    def _pic_video_tmpl(cls):
-        return (
-            "<p:pic %s>\n"
-            "  <p:nvPicPr>\n"
-            '    <p:cNvPr id="%%d" name="%%s">\n'
-            '      <a:hlinkClick r:id="" action="ppaction://media"/>\n'
-            "    </p:cNvPr>\n"
-            "    <p:cNvPicPr>\n"
-            '      <a:picLocks noChangeAspect="1"/>\n'
-            "    </p:cNvPicPr>\n"
-            "    <p:nvPr>\n"
-            '      <a:videoFile r:link="%%s"/>\n'
-            "      <p:extLst>\n"
-            '        <p:ext uri="{DAA4B4D4-6D71-4841-9C94-3DE7FCFB9230}">\n'
-            '          <p14:media xmlns:p14="http://schemas.microsoft.com/of'
-            'fice/powerpoint/2010/main" r:embed="%%s"/>\n'
-            "        </p:ext>\n"
-            "      </p:extLst>\n"
-            "    </p:nvPr>\n"
-            "  </p:nvPicPr>\n"
-            "  <p:blipFill>\n"
-            '    <a:blip r:embed="%%s"/>\n'
-            "    <a:stretch>\n"
-            "      <a:fillRect/>\n"
-            "    </a:stretch>\n"
-            "  </p:blipFill>\n"
-            "  <p:spPr>\n"
-            "    <a:xfrm>\n"
-            '      <a:off x="%%d" y="%%d"/>\n'
-            '      <a:ext cx="%%d" cy="%%d"/>\n'
-            "    </a:xfrm>\n"
-            '    <a:prstGeom prst="rect">\n'
-            "      <a:avLst/>\n"
-            "    </a:prstGeom>\n"
-            "  </p:spPr>\n"
-            "</p:pic>" % nsdecls("a", "p", "r")
-        )
-
     def _srcRect_x(self, attr_name):
         """
         Value of `p:blipFill/a:srcRect/@{attr_name}` or 0.0 if not present.
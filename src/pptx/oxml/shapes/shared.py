@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING, Callable
 
 from pptx.dml.fill import CT_GradientFillProperties
@@ -33,6 +34,7 @@ from pptx.util import Emu
 if TYPE_CHECKING:
     from pptx.oxml.action import CT_Hyperlink
     from pptx.oxml.shapes.autoshape import CT_CustomGeometry2D, CT_PresetGeometry2D
+    from pptx.types import WatchesShapeMoves
     from pptx.util import Length
 
 
@@ -41,6 +43,52 @@ class BaseShapeElement(BaseOxmlElement):
 
     spPr: CT_ShapeProperties
 
+    # -- count of changes to the shapes directly under this element, see `.shape_tree_version` --
+    _shape_tree_version = 0
+    # -- objects told when a shape under this element moves, see `.watch_shape_moves()` --
+    _shape_move_watchers: weakref.WeakSet[WatchesShapeMoves] | None = None
+
+    def _init_new_shape(
+        self,
+        id_: int,
+        name: str,
+        xfrm: BaseOxmlElement | None = None,
+        x: int = 0,
+        y: int = 0,
+        cx: int = 0,
+        cy: int = 0,
+    ) -> None:
+        """Set the id and name, and the position and size in `xfrm`, of a new shape element.
+
+        Used on a copy of a shape prototype (see `pptx.oxml.parse_prototype()`), which always has
+        `p:cNvPr` as the first child of its first child. `xfrm` is the `a:xfrm` or `p:xfrm`
+        element of the shape, having `a:off` and `a:ext` children in that order. Attributes are
+        set by position rather than through the child-element properties because this is on the
+        hot path of adding shapes.
+        """
+        cNvPr = self[0][0]
+        cNvPr.set("id", "%d" % id_)
+        cNvPr.set("name", name)
+        if xfrm is None:
+            return
+        off, ext = xfrm[0], xfrm[1]
+        off.set("x", "%d" % x)
+        off.set("y", "%d" % y)
+        ext.set("cx", "%d" % cx)
+        ext.set("cy", "%d" % cy)
+
+    def addnext(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        """Insert `element` as the next sibling of this shape, noting the shape-tree change."""
+        note_shape_tree_change(element.getparent())
+        super().addnext(element)
+        note_shape_tree_change(self.getparent())
+
+    def addprevious(self, element: BaseOxmlElement) -> None:  # pyright: ignore
+        """Insert `element` as the previous sibling of this shape, noting the shape-tree change."""
+        note_shape_tree_change(element.getparent())
+        super().addprevious(element)
+        note_shape_tree_change(self.getparent())
+
     @property
     def cx(self) -> Length:
         return self._get_xfrm_attr("cx")
@@ -167,6 +215,33 @@ class BaseShapeElement(BaseOxmlElement):
         """
         return self._nvXxPr.cNvPr.name
 
+    @shape_name.setter
+    def shape_name(self, value: str):
+        self._nvXxPr.cNvPr.name = value
+        note_shape_tree_change(self.getparent())
+
+    @property
+    def shape_tree_version(self) -> int:
+        """Count of the changes so far to the shapes directly under this shape tree or group.
+
+        A shape added, removed or moved through the lxml methods of this element or of one of its
+        child shapes, or renamed using `.shape_name`, counts as a change. Changes made any other
+        way, such as with `lxml.etree` functions or by setting `p:cNvPr/@name` directly, are not
+        counted. Used to tell when a lookup table built from those shapes is out of date.
+        """
+        return self._shape_tree_version
+
+    def watch_shape_moves(self, watcher: WatchesShapeMoves) -> None:
+        """Call `watcher.note_shape_moved()` each time a shape under this element is moved.
+
+        A shape at any depth under this shape tree or group counts, and is passed to the call when
+        its position or size is changed through `.x`, `.y`, `.cx` or `.cy`. `watcher` is held by
+        weak reference, so watching ends when it is garbage-collected.
+        """
+        if self._shape_move_watchers is None:
+            self._shape_move_watchers = weakref.WeakSet()
+        self._shape_move_watchers.add(watcher)
+
     @property
     def hidden(self):
         value = self._nvXxPr.cNvPr.get("hidden", None)
@@ -222,6 +297,22 @@ class BaseShapeElement(BaseOxmlElement):
     def _set_xfrm_attr(self, name, value):
         xfrm = self.get_or_add_xfrm()
         setattr(xfrm, name, value)
+        note_shape_moved(self)
+
+
+def note_shape_tree_change(elm: BaseOxmlElement | None) -> None:
+    """Count a change to the shapes under `elm` when it is a shape tree or group shape element."""
+    if isinstance(elm, BaseShapeElement):
+        elm._shape_tree_version += 1  # pyright: ignore[reportPrivateUsage]
+
+
+def note_shape_moved(shape_elm: BaseShapeElement) -> None:
+    """Tell the watchers of each shape tree or group containing `shape_elm` that it moved."""
+    elm = shape_elm.getparent()
+    while isinstance(elm, BaseShapeElement):
+        for watcher in elm._shape_move_watchers or ():  # pyright: ignore[reportPrivateUsage]
+            watcher.note_shape_moved(shape_elm)
+        elm = elm.getparent()
 
 
 class CT_ApplicationNonVisualDrawingProps(BaseOxmlElement):
@@ -15,11 +15,36 @@ from typing import Any
 from pptx.exc import InvalidXmlError
 from pptx.util import Centipoints, Emu
 
+# -- limit on the number of distinct XML values remembered by each simple type --
+_FROM_XML_CACHE_SIZE = 1024
+
 
 class BaseSimpleType:
+    # -- Python value of each XML value already converted by `from_xml()`, one dict per subclass --
+    _from_xml_cache: dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._from_xml_cache = {}
+
     @classmethod
     def from_xml(cls, xml_value: str) -> Any:
-        return cls.convert_from_xml(xml_value)
+        """Python value for `xml_value`, as parsed from an XML attribute.
+
+        An attribute value that has already been converted (and checked) once is not converted
+        again; its value is remembered per simple type. Every value produced is immutable (a
+        number, string or `Length`), so the remembered value can safely be shared.
+        """
+        cache = cls._from_xml_cache
+        try:
+            return cache[xml_value]
+        except KeyError:
+            pass
+
+        value = cls.convert_from_xml(xml_value)
+        if len(cache) < _FROM_XML_CACHE_SIZE:
+            cache[xml_value] = value
+        return value
 
     @classmethod
     def to_xml(cls, value: Any) -> str:
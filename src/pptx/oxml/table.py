@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable, Iterator, cast
 
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
@@ -109,8 +109,8 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = cast(CT_Table, parse_xml(xml))
+        tbl = cast(CT_Table, parse_prototype(cls._tbl_tmpl()))
+        tbl[0][0].text = tableStyleId
 
         # add specified number of rows and columns
         rowheight = height // rows
@@ -166,10 +166,10 @@ class CT_Table(BaseOxmlElement):
         return (
             "<a:tbl %s>\n"
             '  <a:tblPr firstRow="1" bandRow="1">\n'
-            "    <a:tableStyleId>%s</a:tableStyleId>\n"
+            "    <a:tableStyleId/>\n"
             "  </a:tblPr>\n"
             "  <a:tblGrid/>\n"
-            "</a:tbl>" % (nsdecls("a"), "%s")
+            "</a:tbl>" % nsdecls("a")
         )
 
 
@@ -201,6 +201,18 @@ class CT_TableCell(BaseOxmlElement):
         "vMerge", XsdBoolean, default=False
     )
 
+    # -- Fixed XML of a new cell, see `pptx.oxml.parse_prototype()` --
+    _tc_xml = (
+        "<a:tc %s>\n"
+        "  <a:txBody>\n"
+        "    <a:bodyPr/>\n"
+        "    <a:lstStyle/>\n"
+        "    <a:p/>\n"
+        "  </a:txBody>\n"
+        "  <a:tcPr/>\n"
+        "</a:tc>" % nsdecls("a")
+    )
+
     @property
     def anchor(self) -> MSO_VERTICAL_ANCHOR | None:
         """String held in `anchor` attribute of `a:tcPr` child element of this `a:tc` element."""
@@ -306,19 +318,7 @@ class CT_TableCell(BaseOxmlElement):
     @classmethod
     def new(cls) -> CT_TableCell:
         """Return a new `a:tc` element subtree."""
-        return cast(
-            CT_TableCell,
-            parse_xml(
-                f"<a:tc {nsdecls('a')}>\n"
-                f"  <a:txBody>\n"
-                f"    <a:bodyPr/>\n"
-                f"    <a:lstStyle/>\n"
-                f"    <a:p/>\n"
-                f"  </a:txBody>\n"
-                f"  <a:tcPr/>\n"
-                f"</a:tc>"
-            ),
-        )
+        return cast(CT_TableCell, parse_prototype(cls._tc_xml))
 
     @property
     def row_idx(self) -> int:
@@ -13,7 +13,7 @@ from pptx.enum.text import (
     PP_PARAGRAPH_ALIGNMENT,
 )
 from pptx.exc import InvalidXmlError
-from pptx.oxml import parse_xml
+from pptx.oxml import parse_prototype
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
@@ -139,7 +139,7 @@ class CT_TextBody(BaseOxmlElement):
     def new(cls):
         """Return a new `p:txBody` element tree."""
         xml = cls._txBody_tmpl()
-        txBody = parse_xml(xml)
+        txBody = parse_prototype(xml)
         return txBody
 
     @classmethod
@@ -149,14 +149,14 @@ class CT_TextBody(BaseOxmlElement):
         Suitable for use in a table cell and possibly other situations.
         """
         xml = cls._a_txBody_tmpl()
-        txBody = cast(CT_TextBody, parse_xml(xml))
+        txBody = cast(CT_TextBody, parse_prototype(xml))
         return txBody
 
     @classmethod
     def new_p_txBody(cls):
         """Return a new `p:txBody` element tree, suitable for use in an `p:sp` element."""
         xml = cls._p_txBody_tmpl()
-        return parse_xml(xml)
+        return parse_prototype(xml)
 
     @classmethod
     def new_txPr(cls):
@@ -175,7 +175,7 @@ class CT_TextBody(BaseOxmlElement):
             "  </a:p>\n"
             "</c:txPr>\n"
         ) % nsdecls("c", "a")
-        txPr = parse_xml(xml)
+        txPr = parse_prototype(xml)
         return txPr
 
     def unclear_content(self):
@@ -472,7 +472,7 @@ class CT_TextParagraph(BaseOxmlElement):
 
     def _new_r(self):
         r_xml = "<a:r %s><a:t/></a:r>" % nsdecls("a")
-        return parse_xml(r_xml)
+        return parse_prototype(r_xml)
 
 
 class CT_TextParagraphProperties(BaseOxmlElement):
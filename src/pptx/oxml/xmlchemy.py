@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any, Callable, Iterable, Protocol, Sequence, Type, cast
 
@@ -43,6 +44,24 @@ def OxmlElement(nsptag_str: str, nsmap: dict[str, str] | None = None) -> BaseOxm
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+def xpath_cache_info() -> functools._CacheInfo:  # pyright: ignore[reportPrivateUsage]
+    """Hits, misses and size of the cache of compiled expressions used by `BaseOxmlElement.xpath()`.
+
+    A miss is an expression compiled for the first time (or again after being evicted); every
+    other call of `.xpath()` is a hit.
+    """
+    return _compiled_xpath.cache_info()
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_xpath(xpath_str: str) -> etree.XPath:
+    """Compiled form of `xpath_str`, using the standard Open XML namespace mapping.
+
+    An `etree.XPath` object serializes its own evaluations, so one can be shared across threads.
+    """
+    return etree.XPath(xpath_str, namespaces=_nsmap)
+
+
 def serialize_for_reading(element: ElementBase):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -137,6 +156,8 @@ class BaseAttribute:
     def __init__(self, attr_name: str, simple_type: type[AttributeType]):
         self._attr_name = attr_name
         self._simple_type = simple_type
+        # -- resolved once, when the element class is defined, rather than on each access --
+        self._clark_name = qn(attr_name) if ":" in attr_name else attr_name
 
     def populate_class_members(self, element_cls: Type[BaseOxmlElement], prop_name: str):
         """
@@ -157,12 +178,6 @@ class BaseAttribute:
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
-        if ":" in self._attr_name:
-            return qn(self._attr_name)
-        return self._attr_name
-
     @property
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """Callable suitable for the "get" side of the attribute property descriptor."""
@@ -202,11 +217,13 @@ class OptionalAttribute(BaseAttribute):
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """Callable suitable for the "get" side of the attribute property descriptor."""
 
+        clark_name, default, simple_type = self._clark_name, self._default, self._simple_type
+
         def get_attr_value(obj: BaseOxmlElement) -> Any:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return simple_type.from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -215,15 +232,17 @@ class OptionalAttribute(BaseAttribute):
     def _setter(self) -> Callable[[BaseOxmlElement, Any], None]:
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
+        clark_name, default, simple_type = self._clark_name, self._default, self._simple_type
+
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
             # -- when an XML attribute has a default value, setting it to that default removes the
             # -- attribute from the element (when it is present)
-            if value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = simple_type.to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -241,13 +260,15 @@ class RequiredAttribute(BaseAttribute):
     def _getter(self) -> Callable[[BaseOxmlElement], Any]:
         """Callable suitable for the "get" side of the attribute property descriptor."""
 
+        clark_name, simple_type = self._clark_name, self._simple_type
+
         def get_attr_value(obj: BaseOxmlElement) -> Any:
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" % (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return simple_type.from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -267,9 +288,11 @@ class RequiredAttribute(BaseAttribute):
     def _setter(self) -> Callable[[BaseOxmlElement, Any], None]:
         """Callable suitable for the "set" side of the attribute property descriptor."""
 
+        clark_name, simple_type = self._clark_name, self._simple_type
+
         def set_attr_value(obj: BaseOxmlElement, value: Any) -> None:
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = simple_type.to_xml(value)
+            obj.set(clark_name, str_value)
 
         return set_attr_value
 
@@ -284,6 +307,8 @@ class _BaseChildElement:
         super(_BaseChildElement, self).__init__()
         self._nsptagname = nsptagname
         self._successors = successors
+        # -- resolved once, when the element class is defined, rather than on each access --
+        self._clark_name = qn(nsptagname)
 
     def populate_class_members(self, element_cls: Type[BaseOxmlElement], prop_name: str):
         """Baseline behavior for adding the appropriate methods to `element_cls`."""
@@ -378,8 +403,10 @@ class _BaseChildElement:
         present.
         """
 
+        clark_name = self._clark_name
+
         def get_child_element(obj: BaseOxmlElement) -> BaseOxmlElement | None:
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -394,8 +421,10 @@ class _BaseChildElement:
     def _list_getter(self) -> Callable[[BaseOxmlElement], list[BaseOxmlElement]]:
         """Callable suitable for the "get" side of a list property descriptor."""
 
+        clark_name = self._clark_name
+
         def get_child_element_list(obj: BaseOxmlElement) -> list[BaseOxmlElement]:
-            return cast("list[BaseOxmlElement]", obj.findall(qn(self._nsptagname)))
+            return cast("list[BaseOxmlElement]", obj.findall(clark_name))
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -488,8 +517,10 @@ class OneAndOnlyOne(_BaseChildElement):
     def _getter(self) -> Callable[[BaseOxmlElement], BaseOxmlElement]:
         """Callable suitable for the "get" side of the property descriptor."""
 
+        clark_name = self._clark_name
+
         def get_child_element(obj: BaseOxmlElement) -> BaseOxmlElement:
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -705,12 +736,17 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str: str) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def xpath(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, xpath_str: str, **variables: Any
+    ) -> Any:
         """Override of `lxml` _Element.xpath() method.
 
-        Provides standard Open XML namespace mapping (`nsmap`) in centralized location.
+        Provides standard Open XML namespace mapping (`nsmap`) in centralized location. Each
+        distinct `xpath_str` is compiled once and reused, so a value that varies from call to call
+        should be passed as an XPath variable in `variables`, e.g. `self.xpath("c:pt[@idx=$idx]",
+        idx=3)`, rather than formatted into `xpath_str`.
         """
-        return super().xpath(xpath_str, namespaces=_nsmap)
+        return _compiled_xpath(xpath_str)(self, **variables)
 
     @property
     def _nsptag(self) -> str:
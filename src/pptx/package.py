@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import IO, Iterator
+from typing import IO, Iterable, Iterator, TypeVar
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import OpcPackage
@@ -20,13 +20,15 @@ class Package(OpcPackage):
     def core_properties(self) -> CorePropertiesPart:
         """Instance of |CoreProperties| holding read/write Dublin Core doc properties.
 
-        Creates a default core properties part if one is not present (not common).
+        Creates a default core properties part if one is not present (not common). In a
+        read-only package, that default part is not added to the package.
         """
         try:
             return self.part_related_by(RT.CORE_PROPERTIES)
         except KeyError:
             core_props = CorePropertiesPart.default(self)
-            self.relate_to(core_props, RT.CORE_PROPERTIES)
+            if not self.is_read_only:
+                self.relate_to(core_props, RT.CORE_PROPERTIES)
             return core_props
 
     def get_or_add_image_part(self, image_file: str | IO[bytes]):
@@ -51,25 +53,7 @@ class Package(OpcPackage):
         Partname uses the next available sequence number. *ext* is used as the extention on the
         returned partname.
         """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if (
-                        part.partname.startswith("/ppt/media/image")
-                        and part.partname.idx is not None
-                    )
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        idx = self._partnames.first_available_idx("/ppt/media/image")
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -79,22 +63,7 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        idx = self._partnames.first_available_idx("/ppt/media/media")
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
     @property
@@ -104,6 +73,12 @@ class Package(OpcPackage):
         """
         return self.main_document_part
 
+    def _parts_dropped(self) -> None:
+        """Discard the partname and content-hash indexes after a relationship was removed."""
+        super()._parts_dropped()
+        self._image_parts.discard_index()
+        self._media_parts.discard_index()
+
     @lazyproperty
     def _image_parts(self):
         """
@@ -123,11 +98,17 @@ class Package(OpcPackage):
 
 
 class _ImageParts(object):
-    """Provides access to the image parts in a package."""
+    """Provides access to the image parts in a package.
+
+    Image parts are looked up by SHA1 using an index built on first use. The index is kept
+    current as image parts are added and is discarded by the package when a relationship is
+    dropped, since the image part it targeted may no longer belong to the package.
+    """
 
     def __init__(self, package):
         super(_ImageParts, self).__init__()
         self._package = package
+        self._sha1_index: dict[str, ImagePart] | None = None
 
     def __iter__(self) -> Iterator[ImagePart]:
         """Generate a reference to each |ImagePart| object in the package."""
@@ -152,7 +133,14 @@ class _ImageParts(object):
         """
         image = Image.from_file(image_file)
         image_part = self._find_by_sha1(image.sha1)
-        return image_part if image_part else ImagePart.new(self._package, image)
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            self._index()[image.sha1] = image_part
+        return image_part
+
+    def discard_index(self) -> None:
+        """Discard the SHA1 index, so it is rebuilt from the package parts when next needed."""
+        self._sha1_index = None
 
     def _find_by_sha1(self, sha1: str) -> ImagePart | None:
         """
@@ -160,25 +148,27 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
-        for image_part in self:
+        return self._index().get(sha1)
+
+    def _index(self) -> dict[str, ImagePart]:
+        """The dict {sha1: image_part} for the image parts in this package, built when needed."""
+        if self._sha1_index is None:
             # ---skip unknown/unsupported image types, like SVG---
-            if not hasattr(image_part, "sha1"):
-                continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+            self._sha1_index = _first_part_by_sha1(p for p in self if hasattr(p, "sha1"))
+        return self._sha1_index
 
 
 class _MediaParts(object):
     """Provides access to the media parts in a package.
 
     Supports iteration and :meth:`get()` using the media object SHA1 hash as
-    its key.
+    its key. As for image parts, the SHA1 lookup uses an index built on first use.
     """
 
     def __init__(self, package):
         super(_MediaParts, self).__init__()
         self._package = package
+        self._sha1_index: dict[str, MediaPart] | None = None
 
     def __iter__(self):
         """Generate a reference to each |MediaPart| object in the package."""
@@ -207,8 +197,13 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._index()[media.sha1] = media_part
         return media_part
 
+    def discard_index(self) -> None:
+        """Discard the SHA1 index, so it is rebuilt from the package parts when next needed."""
+        self._sha1_index = None
+
     def _find_by_sha1(self, sha1):
         """Return |MediaPart| object having *sha1* hash or None if not found.
 
@@ -216,7 +211,21 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
-        for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+        return self._index().get(sha1)
+
+    def _index(self) -> dict[str, MediaPart]:
+        """The dict {sha1: media_part} for the media parts in this package, built when needed."""
+        if self._sha1_index is None:
+            self._sha1_index = _first_part_by_sha1(self)
+        return self._sha1_index
+
+
+_PartT = TypeVar("_PartT", ImagePart, MediaPart)
+
+
+def _first_part_by_sha1(parts: Iterable[_PartT]) -> dict[str, _PartT]:
+    """Return dict {sha1: part} mapping each SHA1 to the first of `parts` having that hash."""
+    index: dict[str, _PartT] = {}
+    for part in parts:
+        index.setdefault(part.sha1, part)
+    return index
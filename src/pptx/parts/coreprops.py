@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import XmlPart
@@ -20,7 +20,10 @@ class CorePropertiesPart(XmlPart):
     Contains the core document properties for this document package.
     """
 
-    _element: CT_CoreProperties
+    @property
+    def _element(self) -> CT_CoreProperties:
+        """`cp:coreProperties` root element of this part, parsed on first access."""
+        return cast(CT_CoreProperties, super()._element)
 
     @classmethod
     def default(cls, package: Package):
@@ -7,8 +7,6 @@ import io
 import os
 from typing import IO, TYPE_CHECKING, Any, cast
 
-from PIL import Image as PIL_Image
-
 from pptx.introspection import IntrospectionMixin
 from pptx.opc.package import Part
 from pptx.opc.spec import image_content_types
@@ -314,7 +312,13 @@ class Image(IntrospectionMixin):
 
     @lazyproperty
     def _pil_props(self) -> tuple[str | None, tuple[int, int], tuple[int, int] | None]:
-        """tuple of image properties extracted from this image using Pillow."""
+        """tuple of image properties extracted from this image using Pillow.
+
+        Pillow is only imported here, on first use, because importing it is a sizable fraction
+        of the time taken by `import pptx`.
+        """
+        from PIL import Image as PIL_Image
+
         stream = io.BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)  # pyright: ignore[reportUnknownMemberType]
         format = pil_image.format
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-from typing import IO, TYPE_CHECKING, Iterable
+from typing import IO, TYPE_CHECKING, Callable, Iterable, cast
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import XmlPart
+from pptx.opc.package import Part, XmlPart
 from pptx.opc.packuri import PackURI
 from pptx.parts.slide import NotesMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from pptx.opc.serialized import CompressionPolicy
+    from pptx.oxml.presentation import CT_Presentation, CT_SlideId, CT_SlideIdList
     from pptx.parts.coreprops import CorePropertiesPart
     from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
+# -- namespace of the PowerPoint 2010 extensions, like sections, in `p:extLst` --
+_P14_NSURI = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+
 
 class PresentationPart(XmlPart):
     """Top level class in object model.
@@ -46,10 +51,10 @@ class PresentationPart(XmlPart):
 
         Returns |None| if no slide with `slide_id` is related to this presentation.
         """
-        for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
-                return self.related_part(sldId.rId).slide
-        return None
+        idx = self._slide_index.idx_for_id(slide_id)
+        if idx is None:
+            return None
+        return self._slide_index.slide_part(idx).slide
 
     @lazyproperty
     def notes_master(self) -> NotesMaster:
@@ -103,20 +108,72 @@ class PresentationPart(XmlPart):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream: str | IO[bytes]):
+    def retain_slides(self, idxs: Iterable[int]) -> None:
+        """Remove each slide not at one of the positions in `idxs` from this presentation.
+
+        Used to load only a subset of the slides of a lazily-read presentation. Only the
+        `p:sldId` entry and relationship of each other slide are removed; none of its parts are
+        loaded, so they cost nothing to open and are not written when the presentation is saved.
+        Being part of loading, this is allowed in a read-only presentation. Negative positions
+        count from the end, like a list index. Raises |IndexError| for a position out of range.
+        """
+        sldIdLst = self._element.sldIdLst
+        sldIds = [] if sldIdLst is None else list(sldIdLst.sldId_lst)
+        retained_idxs: set[int] = set()
+        for idx in idxs:
+            if not -len(sldIds) <= idx < len(sldIds):
+                raise IndexError("slide index out of range: %d" % idx)
+            retained_idxs.add(idx % len(sldIds))
+
+        dropped = [sldId for idx, sldId in enumerate(sldIds) if idx not in retained_idxs]
+        if not dropped:
+            return
+
+        dropped_ids = {sldId.id for sldId in dropped}
+        for sldId in dropped:
+            sldIdLst.remove(sldId)  # pyright: ignore[reportOptionalMemberAccess]
+        # -- a section lists its slides by slide-id, which must not outlive the slide --
+        for section_sldId in list(self._element.iter("{%s}sldId" % _P14_NSURI)):
+            if int(section_sldId.get("id", "0")) in dropped_ids:
+                section_sldId.getparent().remove(section_sldId)  # pyright: ignore
+
+        # -- a relationship still referenced elsewhere, like from a custom show, is kept --
+        referenced_rIds = set(cast("list[str]", self._element.xpath("//@r:id")))
+        for sldId in dropped:
+            if sldId.rId not in referenced_rIds:
+                self._rels.pop(sldId.rId)
+        self._package._parts_dropped()
+
+    def save(
+        self,
+        path_or_stream: str | IO[bytes],
+        workers: int | None = None,
+        compression: CompressionPolicy | None = None,
+    ):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. When `workers` is greater than 1, parts are serialized and compressed
+        by that many threads. `compression` optionally determines how each part is compressed.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, workers, compression)
 
     def slide_id(self, slide_part):
         """Return the slide-id associated with `slide_part`."""
-        for sldId in self._element.sldIdLst:
-            if self.related_part(sldId.rId) is slide_part:
-                return sldId.id
-        raise ValueError("matching slide_part not found")
+        idx = self._slide_index.idx_for_part(slide_part)
+        if idx is None:
+            raise ValueError("matching slide_part not found")
+        return self._slide_index.slide_id(idx)
+
+    def slide_idx(self, slide_part: Part) -> int:
+        """Return the zero-based position of `slide_part` in the slide sequence.
+
+        Raises |ValueError| when `slide_part` is not a slide of this presentation.
+        """
+        idx = self._slide_index.idx_for_part(slide_part)
+        if idx is None:
+            raise ValueError("matching slide_part not found")
+        return idx
 
     @property
     def _next_slide_partname(self):
@@ -124,3 +181,132 @@ class PresentationPart(XmlPart):
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
         return PackURI(partname_str)
+
+    @lazyproperty
+    def _slide_index(self) -> _SlideIndex:
+        """|_SlideIndex| mapping between the slide-id, rId, part and position of each slide."""
+        return _SlideIndex(self._element, self.related_part)
+
+
+class _SlideIndex:
+    """Maps between the slide-id, rId, slide part and position of each slide in a presentation.
+
+    Built from the `p:sldId` children of `p:sldIdLst` and kept as a snapshot. Each lookup checks
+    that no `p:sldId` element has been removed or moved since (see
+    `CT_SlideIdList.slide_order_version`) and that the one it lands on still has the same rId, so
+    slides added, removed or reordered in the XML are picked up on the next lookup that needs
+    them. Appended slides are added to the index incrementally; anything else rebuilds it.
+    """
+
+    def __init__(self, presentation: CT_Presentation, related_part: Callable[[str], Part]):
+        self._presentation = presentation
+        self._related_part = related_part
+        self._sldIdLst: CT_SlideIdList | None = None
+        self._slide_order_version = 0
+        self._sldIds: list[CT_SlideId] = []
+        self._rIds: list[str] = []
+        self._parts: list[Part] = []
+        self._idx_by_id: dict[int, int] = {}
+        self._idx_by_part: dict[Part, int] = {}
+        self._rebuild()
+
+    def idx_for_id(self, slide_id: int) -> int | None:
+        """Position of the slide identified by `slide_id` or |None| if there is no such slide."""
+
+        def lookup() -> int | None:
+            idx = self._idx_by_id.get(slide_id)
+            if idx is None or not self._holds(idx) or self._sldIds[idx].id != slide_id:
+                return None
+            return idx
+
+        return self._find(lookup)
+
+    def idx_for_part(self, slide_part: Part) -> int | None:
+        """Position of `slide_part` or |None| if it is not a slide of this presentation."""
+
+        def lookup() -> int | None:
+            idx = self._idx_by_part.get(slide_part)
+            if idx is None or not self._holds(idx):
+                return None
+            return idx
+
+        return self._find(lookup)
+
+    def slide_id(self, idx: int) -> int:
+        """The slide-id of the slide at `idx`."""
+        return self._sldIds[idx].id
+
+    def slide_part(self, idx: int) -> Part:
+        """The slide part of the slide at `idx`."""
+        return self._parts[idx]
+
+    def _add(self, sldId: CT_SlideId, rId: str, part: Part) -> None:
+        """Index `sldId`, related to `part` by `rId`, as the next slide in the sequence."""
+        idx = len(self._sldIds)
+        self._sldIds.append(sldId)
+        self._rIds.append(rId)
+        self._parts.append(part)
+        # -- first occurrence wins, like the linear search this index replaces --
+        self._idx_by_id.setdefault(sldId.id, idx)
+        self._idx_by_part.setdefault(part, idx)
+
+    def _extend(self) -> bool:
+        """Index `p:sldId` elements appended since the last refresh, True if there were any.
+
+        Only applies when the last indexed slide is still in place; False means a rebuild is
+        needed to bring the index up to date.
+        """
+        if not self._sldIds or not self._holds(len(self._sldIds) - 1):
+            return False
+        appended = list(self._sldIds[-1].itersiblings(self._sldIds[-1].tag))
+        for sldId in appended:
+            rId = sldId.rId
+            self._add(sldId, rId, self._related_part(rId))
+        return bool(appended)
+
+    def _find(self, lookup: Callable[[], int | None]) -> int | None:
+        """Result of `lookup`, bringing this index up to date first when it comes up empty.
+
+        Appended slides are indexed incrementally; the whole index is rebuilt only when that
+        doesn't produce a match.
+        """
+        idx = lookup()
+        if idx is None and self._extend():
+            idx = lookup()
+        if idx is None:
+            self._rebuild()
+            idx = lookup()
+        return idx
+
+    def _holds(self, idx: int) -> bool:
+        """True when the `p:sldId` indexed at `idx` is still at `idx` in the XML, with its rId.
+
+        No `p:sldId` element has moved when the slide-order version of `p:sldIdLst` is the one
+        this index was built at, which avoids a search of the list for each lookup.
+        """
+        sldIdLst, sldId = self._sldIdLst, self._sldIds[idx]
+        return (
+            sldIdLst is not None
+            and sldIdLst.getparent() is self._presentation
+            and sldIdLst.slide_order_version == self._slide_order_version
+            and sldId.getparent() is sldIdLst
+            and sldId.rId == self._rIds[idx]
+        )
+
+    def _rebuild(self) -> None:
+        """Index each `p:sldId` element of `p:sldIdLst` as it stands now.
+
+        Slide parts already resolved for an unchanged `p:sldId` element are reused.
+        """
+        resolved = dict(zip(zip(self._sldIds, self._rIds), self._parts))
+        sldIdLst = self._presentation.sldIdLst
+
+        self._sldIdLst = sldIdLst
+        self._slide_order_version = 0 if sldIdLst is None else sldIdLst.slide_order_version
+        self._sldIds, self._rIds, self._parts = [], [], []
+        self._idx_by_id, self._idx_by_part = {}, {}
+
+        for sldId in [] if sldIdLst is None else sldIdLst.sldId_lst:
+            rId = sldId.rId
+            part = resolved.get((sldId, rId))
+            self._add(sldId, rId, self._related_part(rId) if part is None else part)
@@ -13,6 +13,7 @@ from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.parts.chart import ChartPart
 from pptx.parts.embeddedpackage import EmbeddedPackagePart
+from pptx.shapes.shapetree import ShapeIdAllocator, ShapeNameIndex
 from pptx.slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 from pptx.util import lazyproperty
 
@@ -30,7 +31,10 @@ class BaseSlidePart(XmlPart):
     notes-master, and handout-master parts.
     """
 
-    _element: CT_Slide
+    @property
+    def _element(self) -> CT_Slide:
+        """Root element of the XML of this slide part, parsed on first access."""
+        return cast(CT_Slide, super()._element)
 
     def get_image(self, rId: str) -> Image:
         """Return an |Image| object containing the image related to this slide by *rId*.
@@ -56,6 +60,24 @@ class BaseSlidePart(XmlPart):
         """Internal name of this slide."""
         return self._element.cSld.name
 
+    @lazyproperty
+    def shape_id_allocator(self) -> ShapeIdAllocator:
+        """|ShapeIdAllocator| issuing the ids of shapes added to this slide.
+
+        Shared by every shape-collection object for this slide, so ids remain unique however
+        many of those objects are used.
+        """
+        return ShapeIdAllocator(self._element.spTree)
+
+    @lazyproperty
+    def shape_name_index(self) -> ShapeNameIndex:
+        """|ShapeNameIndex| of the shape names used on this slide.
+
+        Shared by every shape-collection object for this slide, so a name given to a shape
+        through any of them is seen by all.
+        """
+        return ShapeNameIndex(self._element.spTree)
+
 
 class NotesMasterPart(BaseSlidePart):
     """Notes master part.
@@ -11,6 +11,7 @@ from pptx.slide import SlideMasters, Slides
 from pptx.util import lazyproperty
 
 if TYPE_CHECKING:
+    from pptx.opc.serialized import CompressionPolicy
     from pptx.oxml.presentation import CT_Presentation, CT_SlideId
     from pptx.parts.presentation import PresentationPart
     from pptx.slide import NotesMaster, SlideLayouts
@@ -31,6 +32,23 @@ class Presentation(PartElementProxy, IntrospectionMixin):
         super().__init__(element, part)
         IntrospectionMixin.__init__(self)
 
+    def __enter__(self) -> Presentation:
+        """Enable use as a context manager that closes the presentation on exit."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the presentation on exit from context."""
+        self.close()
+
+    def close(self):
+        """Release the package file held open by a presentation opened `lazy` or `read_only`.
+
+        Images and other binary parts that were not yet read are no longer available once the
+        presentation is closed, so it should not be saved after closing. Has no effect on a
+        presentation that was read in full when opened.
+        """
+        self.part.package.close()
+
     @property
     def core_properties(self):
         """|CoreProperties| instance for this presentation.
@@ -39,6 +57,15 @@ class Presentation(PartElementProxy, IntrospectionMixin):
         """
         return self.part.core_properties
 
+    @property
+    def is_read_only(self) -> bool:
+        """True when this presentation was opened with `read_only=True`.
+
+        A read-only presentation cannot be saved, and changes that would add, remove or rename
+        a part of it raise |ReadOnlyPackageError|.
+        """
+        return self.part.package.is_read_only
+
     @property
     def notes_master(self) -> NotesMaster:
         """Instance of |NotesMaster| for this presentation.
@@ -48,12 +75,31 @@ class Presentation(PartElementProxy, IntrospectionMixin):
         """
         return self.part.notes_master
 
-    def save(self, file: str | IO[bytes]):
+    def save(
+        self,
+        file: str | IO[bytes],
+        workers: int | None = None,
+        compression: CompressionPolicy | None = None,
+    ):
         """Writes this presentation to `file`.
 
-        `file` can be either a file-path or a file-like object open for writing bytes.
+        `file` can be either a file-path or a file-like object open for writing bytes. When
+        `file` is the path of an existing directory, the presentation is written expanded into
+        it, one plain file per part, which is quicker to write and read back than a zip archive.
+        Files that already hold the bytes of a part are left untouched, so saving again to the
+        same directory only writes the parts that changed.
+
+        When `workers` is greater than 1, parts are serialized and compressed by that many
+        threads while earlier parts are written, which can shorten the save of a large
+        presentation considerably. The saved file is the same either way.
+
+        `compression` is an optional :class:`pptx.opc.serialized.CompressionPolicy` that
+        determines how each part is compressed, by its content type. For example,
+        `CompressionPolicy.store_compressed_media()` avoids deflating JPEG, PNG and video parts
+        again and `CompressionPolicy(store_only=True)` writes an uncompressed package fastest.
+        All parts are deflated at the default level when omitted.
         """
-        self.part.save(file)
+        self.part.save(file, workers, compression)
 
     @property
     def slide_height(self) -> Length | None:
@@ -115,7 +161,9 @@ class Presentation(PartElementProxy, IntrospectionMixin):
     def slides(self):
         """|Slides| object containing the slides in this presentation."""
         sldIdLst = self._element.get_or_add_sldIdLst()
-        self.part.rename_slide_parts([cast("CT_SlideId", sldId).rId for sldId in sldIdLst])
+        # -- slide partnames only matter when saving, which a read-only presentation can't do --
+        if not self.is_read_only:
+            self.part.rename_slide_parts([cast("CT_SlideId", sldId).rId for sldId in sldIdLst])
         return Slides(sldIdLst, self)
 
     # --- Introspection Methods ---
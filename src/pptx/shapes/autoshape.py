@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from numbers import Number
 from typing import TYPE_CHECKING, Iterable
-from xml.sax import saxutils
 
 from pptx.dml.fill import FillFormat
 from pptx.dml.line import LineFormat
@@ -12,7 +11,7 @@ from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
 from pptx.shapes.base import BaseShape
 from pptx.spec import autoshape_types
 from pptx.text.text import TextFrame
-from pptx.util import lazyproperty
+from pptx.util import identity_mapped, lazyproperty
 
 if TYPE_CHECKING:
     from pptx.oxml.shapes.autoshape import CT_GeomGuide, CT_PresetGeometry2D, CT_Shape
@@ -227,6 +226,9 @@ class AutoShapeType:
         integer. This value is escaped because at least one autoshape-type name includes double
         quotes ('"No" Symbol').
         """
+        # -- imported here because `xml.sax.saxutils` imports `urllib.request`, which is slow --
+        from xml.sax import saxutils
+
         return saxutils.escape(self._basename, {'"': "&quot;"})
 
     @classmethod
@@ -352,7 +354,7 @@ class Shape(BaseShape):
         Contains the text of the shape and provides access to text formatting properties.
         """
         txBody = self._sp.get_or_add_txBody()
-        return TextFrame(txBody, self)
+        return identity_mapped(txBody, self, lambda: TextFrame(txBody, self))
 
     # -- IntrospectionMixin overrides --
 
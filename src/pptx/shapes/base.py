@@ -131,7 +131,8 @@ class BaseShape(IntrospectionMixin):
 
     @name.setter
     def name(self, value: str):
-        self._element._nvXxPr.cNvPr.name = value  # pyright: ignore[reportPrivateUsage]
+        self._element.shape_name = value
+        self.part.shape_name_index.add(value)
 
     @property
     def part(self) -> BaseSlidePart:
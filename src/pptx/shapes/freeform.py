@@ -103,10 +103,11 @@ class FreeformBuilder(Sequence[DrawingOperation]):
         geometry in different locations on the slide.
         """
         sp = self._add_freeform_sp(origin_x, origin_y)
+        self._shapes._shape_name_index.add(sp.shape_name)  # pyright: ignore[reportPrivateUsage]
         path = self._start_path(sp)
         for drawing_operation in self:
             drawing_operation.apply_operation_to(path)
-        return self._shapes._shape_factory(sp)  # pyright: ignore[reportPrivateUsage]
+        return self._shapes._shape_proxy(sp)  # pyright: ignore[reportPrivateUsage]
 
     def move_to(self, x: float, y: float):
         """Move pen to (x, y) (local coordinates) without drawing line.
@@ -4,15 +4,28 @@ from __future__ import annotations
 
 import io
 import os
-from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from pptx.enum.shapes import PP_PLACEHOLDER, PROG_ID
+from pptx.enum.shapes import MSO_CONNECTOR_TYPE, PP_PLACEHOLDER, PROG_ID
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
+from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.simpletypes import ST_Direction
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
@@ -33,22 +46,24 @@ from pptx.shapes.placeholder import (
     TablePlaceholder,
 )
 from pptx.shared import ParentedElementProxy
-from pptx.util import Emu, lazyproperty
+from pptx.util import Emu, identity_mapped, lazyproperty
 
 if TYPE_CHECKING:
     from pptx.chart.chart import Chart
     from pptx.chart.data import ChartData
     from pptx.enum.chart import XL_CHART_TYPE
-    from pptx.enum.shapes import MSO_CONNECTOR_TYPE, MSO_SHAPE
+    from pptx.enum.shapes import MSO_SHAPE
     from pptx.oxml.shapes import ShapeElement
-    from pptx.oxml.shapes.connector import CT_Connector
     from pptx.oxml.shapes.groupshape import CT_GroupShape
     from pptx.parts.image import ImagePart
-    from pptx.parts.slide import SlidePart
+    from pptx.parts.slide import BaseSlidePart, SlidePart
     from pptx.slide import Slide, SlideLayout
     from pptx.types import ProvidesPart
     from pptx.util import Length
 
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT", bound=BaseShape)
+
 # +-- _BaseShapes
 # |   |
 # |   +-- _BaseGroupShapes
@@ -83,21 +98,21 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree: CT_GroupShape, parent: ProvidesPart):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._turbo_add_enabled = False
+        self._cached_lookup: _ShapeLookup | None = None
 
     def __getitem__(self, idx: int) -> BaseShape:
         """Return shape at `idx` in sequence, e.g. `shapes[2]`."""
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._lookup.shape_elms[idx]
         except IndexError:
             raise IndexError("shape index out of range")
-        return self._shape_factory(shape_elm)
+        return self._shape_proxy(shape_elm)
 
     def __iter__(self) -> Iterator[BaseShape]:
         """Generate a reference to each shape in the collection, in sequence."""
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield self._shape_proxy(shape_elm)
 
     def __len__(self) -> int:
         """Return count of shapes in this shape tree.
@@ -105,8 +120,35 @@ class _BaseShapes(ParentedElementProxy):
         A group shape contributes 1 to the total, without regard to the number of shapes contained
         in the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._lookup.shape_elms)
+
+    @property
+    def by_id(self) -> Mapping[int, BaseShape]:
+        """Read-only mapping of shape id to shape for the shapes in this collection.
+
+        For example, `shapes.by_id[42]` is the shape having id 42. Lookup does not search the
+        collection; the mapping is built the first time it is needed and again after any change
+        to the shapes in this collection. Where two shapes share an id, the first one in the
+        collection is mapped.
+        """
+        return _ShapeMap(lambda: self._lookup.elm_by_id, self._shape_proxy)
+
+    @property
+    def by_idx(self) -> Mapping[int, BaseShape]:
+        """Read-only mapping of placeholder idx to placeholder shape for this collection.
+
+        Shapes that are not placeholders do not appear. Otherwise like :attr:`by_id`.
+        """
+        return _ShapeMap(lambda: self._lookup.elm_by_idx, self._shape_proxy)
+
+    @property
+    def by_name(self) -> Mapping[str, BaseShape]:
+        """Read-only mapping of shape name to shape for the shapes in this collection.
+
+        For example, `shapes.by_name["Title 1"]` is the shape named "Title 1". Where two shapes
+        share a name, the first one in the collection is mapped. Otherwise like :attr:`by_id`.
+        """
+        return _ShapeMap(lambda: self._lookup.elm_by_name, self._shape_proxy)
 
     def clone_placeholder(self, placeholder: LayoutPlaceholder) -> None:
         """Add a new placeholder shape based on `placeholder`."""
@@ -115,6 +157,7 @@ class _BaseShapes(ParentedElementProxy):
         id_ = self._next_shape_id
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
+        self._shape_name_index.add(name)
 
     def ph_basename(self, ph_type: PP_PLACEHOLDER) -> str:
         """Return the base name for a placeholder of `ph_type` in this shape collection.
@@ -140,30 +183,43 @@ class _BaseShapes(ParentedElementProxy):
             PP_PLACEHOLDER.TITLE: "Title",
         }[ph_type]
 
+    @lazyproperty
+    def spatial_index(self) -> ShapeSpatialIndex:
+        """|ShapeSpatialIndex| answering where-is questions about the shapes in this collection.
+
+        For example, `shapes.spatial_index.overlapping_pairs()` finds the shapes that overlap
+        without comparing every shape with every other one.
+        """
+        return ShapeSpatialIndex(self)
+
     @property
     def turbo_add_enabled(self) -> bool:
         """True if "turbo-add" mode is enabled. Read/Write.
 
         EXPERIMENTAL: This feature can radically improve performance when adding large numbers
-        (hundreds of shapes) to a slide. It works by caching the last shape ID used and
-        incrementing that value to assign the next shape id. This avoids repeatedly searching all
-        shape ids in the slide each time a new ID is required.
+        (hundreds of shapes) to a slide one at a time. It works by taking each new shape id from
+        the slide's |ShapeIdAllocator|, which remembers the last shape id used, instead of
+        searching all shape ids in the slide each time a new id is required.
 
         Performance is not noticeably improved for a slide with a relatively small number of
         shapes, but because the search time rises with the square of the shape count, this option
-        can be useful for optimizing generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if more than one |Slide|
-        object is used to interact with the same slide in the presentation. Note that the |Slides|
-        collection creates a new |Slide| object each time a slide is accessed (e.g. `slide =
-        prs.slides[0]`, so you must be careful to limit use to a single |Slide| object.
+        can be useful for optimizing generation of a slide composed of many shapes. Consider
+        :meth:`add_shapes` when the shapes can be added in a batch.
+
+        The allocator belongs to the slide part, so every shape collection of the slide draws ids
+        from the same sequence and using more than one |Slide| object for the same slide cannot
+        produce a shape-id collision. Ids assigned by editing the slide XML directly while
+        turbo-add is enabled are not seen however; toggling this property off and on again picks
+        them up.
         """
-        return self._cached_max_shape_id is not None
+        return self._turbo_add_enabled
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value: bool):
         enable = bool(value)
-        self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        if enable:
+            self._shape_id_allocator.sync()
+        self._turbo_add_enabled = enable
 
     @staticmethod
     def _is_member_elm(shape_elm: ShapeElement) -> bool:
@@ -179,6 +235,15 @@ class _BaseShapes(ParentedElementProxy):
             if self._is_member_elm(shape_elm):
                 yield shape_elm
 
+    @property
+    def _lookup(self) -> _ShapeLookup:
+        """Lookup tables for the shapes in this collection, rebuilt after the shape tree changes."""
+        version = self._spTree.shape_tree_version
+        lookup = self._cached_lookup
+        if lookup is None or lookup.version != version:
+            lookup = self._cached_lookup = _ShapeLookup(list(self._iter_member_elms()), version)
+        return lookup
+
     def _next_ph_name(self, ph_type: PP_PLACEHOLDER, id: int, orient: str) -> str:
         """Next unique placeholder name for placeholder shape of type `ph_type`.
 
@@ -194,15 +259,7 @@ class _BaseShapes(ParentedElementProxy):
             basename = "Vertical %s" % basename
 
         # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
-        while True:
-            name = "%s %d" % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        return self._shape_name_index.unique_name(basename, id - 1)
 
     @property
     def _next_shape_id(self) -> int:
@@ -211,17 +268,37 @@ class _BaseShapes(ParentedElementProxy):
         The returned id is 1 greater than the maximum shape id used so far. In practice, the
         minimum id is 2 because the spTree element is always assigned id="1".
         """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
+        return self._next_shape_ids(1)[0]
+
+    def _next_shape_ids(self, count: int) -> range:
+        """Return `count` consecutive unique shape ids suitable for use with new shapes.
+
+        Unless turbo-add is enabled, the slide XML is searched for the maximum shape id used so
+        far, once per call, so ids assigned outside python-pptx are accounted for.
+        """
+        allocator = self._shape_id_allocator
+        if not self._turbo_add_enabled:
+            allocator.sync()
+        return allocator.next_ids(count)
 
-        return self._spTree.max_shape_id + 1
+    @property
+    def _shape_id_allocator(self) -> ShapeIdAllocator:
+        """The |ShapeIdAllocator| shared by every shape collection on this slide."""
+        return cast("BaseSlidePart", self.part).shape_id_allocator
+
+    @property
+    def _shape_name_index(self) -> ShapeNameIndex:
+        """The |ShapeNameIndex| shared by every shape collection on this slide."""
+        return cast("BaseSlidePart", self.part).shape_name_index
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
         return BaseShapeFactory(shape_elm, self)
 
+    def _shape_proxy(self, shape_elm: ShapeElement) -> BaseShape:
+        """The shape proxy object for `shape_elm`, new unless a |proxy_identity_map| is active."""
+        return identity_mapped(shape_elm, self, lambda: self._shape_factory(shape_elm))
+
 
 class _BaseGroupShapes(_BaseShapes):
     """Base class for shape-trees that can add shapes."""
@@ -255,7 +332,7 @@ class _BaseGroupShapes(_BaseShapes):
         rId = self.part.add_chart_part(chart_type, chart_data)
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
         self._recalculate_extents()
-        return cast("Chart", self._shape_factory(graphicFrame))
+        return cast("Chart", self._shape_proxy(graphicFrame))
 
     def add_connector(
         self,
@@ -273,7 +350,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         cxnSp = self._add_cxnSp(connector_type, begin_x, begin_y, end_x, end_y)
         self._recalculate_extents()
-        return cast(Connector, self._shape_factory(cxnSp))
+        return cast(Connector, self._shape_proxy(cxnSp))
 
     def add_group_shape(self, shapes: Iterable[BaseShape] = ()) -> GroupShape:
         """Return a |GroupShape| object newly appended to this shape tree.
@@ -285,13 +362,14 @@ class _BaseGroupShapes(_BaseShapes):
         """
         shapes = tuple(shapes)
         grpSp = self._element.add_grpSp()
+        self._shape_name_index.add(grpSp.shape_name)
         for shape in shapes:
             grpSp.insert_element_before(
                 shape._element, "p:extLst"  # pyright: ignore[reportPrivateUsage]
             )
         if shapes:
             grpSp.recalculate_extents()
-        return cast(GroupShape, self._shape_factory(grpSp))
+        return cast(GroupShape, self._shape_proxy(grpSp))
 
     def add_ole_object(
         self,
@@ -347,8 +425,9 @@ class _BaseGroupShapes(_BaseShapes):
             icon_height,
         )
         self._spTree.append(graphicFrame)
+        self._shape_name_index.add(graphicFrame.shape_name)
         self._recalculate_extents()
-        return cast(GraphicFrame, self._shape_factory(graphicFrame))
+        return cast(GraphicFrame, self._shape_proxy(graphicFrame))
 
     def add_picture(
         self,
@@ -370,7 +449,7 @@ class _BaseGroupShapes(_BaseShapes):
         image_part, rId = self.part.get_or_add_image_part(image_file)
         pic = self._add_pic_from_image_part(image_part, rId, left, top, width, height)
         self._recalculate_extents()
-        return cast(Picture, self._shape_factory(pic))
+        return cast(Picture, self._shape_proxy(pic))
 
     def add_shape(
         self, autoshape_type_id: MSO_SHAPE, left: Length, top: Length, width: Length, height: Length
@@ -384,7 +463,35 @@ class _BaseGroupShapes(_BaseShapes):
         autoshape_type = AutoShapeType(autoshape_type_id)
         sp = self._add_sp(autoshape_type, left, top, width, height)
         self._recalculate_extents()
-        return cast(Shape, self._shape_factory(sp))
+        return cast(Shape, self._shape_proxy(sp))
+
+    def add_shapes(self, specs: Iterable[ShapeSpec]) -> list[BaseShape]:
+        """Return list of shapes newly appended to this shape tree, one for each item in `specs`.
+
+        Each item in `specs` is an |AutoShapeSpec|, |TextboxSpec|, |PictureSpec| or
+        |ConnectorSpec| specifying a shape as the arguments to the corresponding `add_*()` method
+        would. The shapes are added in the order specified, each getting the same id and name it
+        would get when added singly, so `shapes.add_shapes([AutoShapeSpec(...)])` is equivalent to
+        `shapes.add_shape(...)`.
+
+        This is much faster than adding the shapes one at a time when there are many of them. The
+        shape elements are all built first and then appended to the shape tree in a single
+        operation, the existing shape ids are searched just once for the whole batch, and an
+        image used by more than one picture is only read once.
+        """
+        specs = list(specs)
+        image_parts: dict[str | IO[bytes], tuple[ImagePart, str]] = {}
+        shape_elms = [
+            self._new_shape_elm(spec, shape_id, image_parts)
+            for spec, shape_id in zip(specs, self._next_shape_ids(len(specs)))
+        ]
+        self._element.append_shape_elms(shape_elms)
+        name_index = self._shape_name_index
+        for shape_elm in shape_elms:
+            name_index.add(shape_elm.shape_name)
+        if shape_elms:
+            self._recalculate_extents()
+        return [self._shape_proxy(shape_elm) for shape_elm in shape_elms]
 
     def add_textbox(self, left: Length, top: Length, width: Length, height: Length) -> Shape:
         """Return newly added text box shape appended to this shape tree.
@@ -393,7 +500,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         sp = self._add_textbox_sp(left, top, width, height)
         self._recalculate_extents()
-        return cast(Shape, self._shape_factory(sp))
+        return cast(Shape, self._shape_proxy(sp))
 
     def build_freeform(
         self, start_x: float = 0, start_y: float = 0, scale: tuple[float, float] | float = 1.0
@@ -423,8 +530,10 @@ class _BaseGroupShapes(_BaseShapes):
 
         Raises |ValueError| if `shape` is not in the collection.
         """
-        shape_elms = list(self._element.iter_shape_elms())
-        return shape_elms.index(shape.element)
+        try:
+            return self._lookup.position_by_elm[shape.element]
+        except KeyError:
+            raise ValueError("shape is not in this collection")
 
     def _add_chart_graphicFrame(
         self, rId: str, x: Length, y: Length, cx: Length, cy: Length
@@ -440,6 +549,7 @@ class _BaseGroupShapes(_BaseShapes):
             shape_id, name, rId, x, y, cx, cy
         )
         self._spTree.append(graphicFrame)
+        self._shape_name_index.add(name)
         return graphicFrame
 
     def _add_cxnSp(
@@ -457,12 +567,10 @@ class _BaseGroupShapes(_BaseShapes):
         """
         id_ = self._next_shape_id
         name = "Connector %d" % (id_ - 1)
-
-        flipH, flipV = begin_x > end_x, begin_y > end_y
-        x, y = min(begin_x, end_x), min(begin_y, end_y)
-        cx, cy = abs(end_x - begin_x), abs(end_y - begin_y)
-
-        return self._element.add_cxnSp(id_, name, connector_type, x, y, cx, cy, flipH, flipV)
+        x, y, cx, cy, flipH, flipV = _connector_geometry(begin_x, begin_y, end_x, end_y)
+        cxnSp = self._element.add_cxnSp(id_, name, connector_type, x, y, cx, cy, flipH, flipV)
+        self._shape_name_index.add(name)
+        return cxnSp
 
     def _add_pic_from_image_part(
         self,
@@ -484,6 +592,7 @@ class _BaseGroupShapes(_BaseShapes):
         name = "Picture %d" % (id_ - 1)
         desc = image_part.desc
         pic = self._grpSp.add_pic(id_, name, desc, rId, x, y, scaled_cx, scaled_cy)
+        self._shape_name_index.add(name)
         return pic
 
     def _add_sp(
@@ -496,6 +605,7 @@ class _BaseGroupShapes(_BaseShapes):
         id_ = self._next_shape_id
         name = "%s %d" % (autoshape_type.basename, id_ - 1)
         sp = self._grpSp.add_autoshape(id_, name, autoshape_type.prst, x, y, cx, cy)
+        self._shape_name_index.add(name)
         return sp
 
     def _add_textbox_sp(self, x: Length, y: Length, cx: Length, cy: Length) -> CT_Shape:
@@ -506,8 +616,53 @@ class _BaseGroupShapes(_BaseShapes):
         id_ = self._next_shape_id
         name = "TextBox %d" % (id_ - 1)
         sp = self._spTree.add_textbox(id_, name, x, y, cx, cy)
+        self._shape_name_index.add(name)
         return sp
 
+    def _new_shape_elm(
+        self,
+        spec: ShapeSpec,
+        shape_id: int,
+        image_parts: dict[str | IO[bytes], tuple[ImagePart, str]],
+    ) -> ShapeElement:
+        """Return a new "loose" shape element having `shape_id` as specified by `spec`.
+
+        `image_parts` maps each image file already used by a picture in this batch to its image
+        part and rId, so an image file used by many pictures is only read once.
+        """
+        if isinstance(spec, AutoShapeSpec):
+            autoshape_type = AutoShapeType(spec.autoshape_type_id)
+            name = "%s %d" % (autoshape_type.basename, shape_id - 1)
+            return CT_Shape.new_autoshape_sp(
+                shape_id, name, autoshape_type.prst, spec.left, spec.top, spec.width, spec.height
+            )
+
+        if isinstance(spec, TextboxSpec):
+            name = "TextBox %d" % (shape_id - 1)
+            return CT_Shape.new_textbox_sp(
+                shape_id, name, spec.left, spec.top, spec.width, spec.height
+            )
+
+        if isinstance(spec, PictureSpec):
+            if spec.image_file not in image_parts:
+                image_parts[spec.image_file] = self.part.get_or_add_image_part(spec.image_file)
+            image_part, rId = image_parts[spec.image_file]
+            cx, cy = image_part.scale(spec.width, spec.height)
+            name = "Picture %d" % (shape_id - 1)
+            return CT_Picture.new_pic(
+                shape_id, name, image_part.desc, rId, spec.left, spec.top, cx, cy
+            )
+
+        if isinstance(spec, ConnectorSpec):
+            name = "Connector %d" % (shape_id - 1)
+            x, y, cx, cy, flipH, flipV = _connector_geometry(
+                spec.begin_x, spec.begin_y, spec.end_x, spec.end_y
+            )
+            prst = MSO_CONNECTOR_TYPE.to_xml(spec.connector_type)
+            return CT_Connector.new_cxnSp(shape_id, name, prst, x, y, cx, cy, flipH, flipV)
+
+        raise TypeError("add_shapes() got unsupported shape spec %r" % (spec,))
+
     def _recalculate_extents(self) -> None:
         """Adjust position and size to incorporate all contained shapes.
 
@@ -583,8 +738,9 @@ class SlideShapes(_BaseGroupShapes):
             mime_type,
         )
         self._spTree.append(movie_pic)
+        self._shape_name_index.add(movie_pic.shape_name)
         self._add_video_timing(movie_pic)
-        return cast(GraphicFrame, self._shape_factory(movie_pic))
+        return cast(GraphicFrame, self._shape_proxy(movie_pic))
 
     def add_table(
         self, rows: int, cols: int, left: Length, top: Length, width: Length, height: Length
@@ -597,7 +753,7 @@ class SlideShapes(_BaseGroupShapes):
         returned |GraphicFrame| shape must be used to access the enclosed |Table| object.
         """
         graphicFrame = self._add_graphicFrame_containing_table(rows, cols, left, top, width, height)
-        return cast(GraphicFrame, self._shape_factory(graphicFrame))
+        return cast(GraphicFrame, self._shape_proxy(graphicFrame))
 
     def clone_layout_placeholders(self, slide_layout: SlideLayout) -> None:
         """Add placeholder shapes based on those in `slide_layout`.
@@ -621,7 +777,7 @@ class SlideShapes(_BaseGroupShapes):
         """
         for elm in self._spTree.iter_ph_elms():
             if elm.ph_idx == 0:
-                return cast(Shape, self._shape_factory(elm))
+                return cast(Shape, self._shape_proxy(elm))
         return None
 
     def _add_graphicFrame_containing_table(
@@ -631,6 +787,7 @@ class SlideShapes(_BaseGroupShapes):
         _id = self._next_shape_id
         name = "Table %d" % (_id - 1)
         graphicFrame = self._spTree.add_table(_id, name, rows, cols, x, y, cx, cy)
+        self._shape_name_index.add(name)
         return graphicFrame
 
     def _add_video_timing(self, pic: CT_Picture) -> None:
@@ -722,10 +879,7 @@ class LayoutPlaceholders(BasePlaceholders):
 
     def get(self, idx: int, default: LayoutPlaceholder | None = None) -> LayoutPlaceholder | None:
         """The first placeholder shape with matching `idx` value, or `default` if not found."""
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        return cast("LayoutPlaceholder | None", self.by_idx.get(idx, default))
 
     def _shape_factory(self, shape_elm: ShapeElement) -> BaseShape:
         """Return an instance of the appropriate shape proxy class for `shape_elm`."""
@@ -779,25 +933,55 @@ class SlidePlaceholders(ParentedElementProxy):
 
     _element: CT_GroupShape
 
+    def __init__(self, spTree: CT_GroupShape, parent: ProvidesPart):
+        super(SlidePlaceholders, self).__init__(spTree, parent)
+        self._cached_lookup: _ShapeLookup | None = None
+
     def __getitem__(self, idx: int):
         """Access placeholder shape having `idx`.
 
         Note that while this looks like list access, idx is actually a dictionary key and will
         raise |KeyError| if no placeholder with that idx value is in the collection.
         """
-        for e in self._element.iter_ph_elms():
-            if e.ph_idx == idx:
-                return SlideShapeFactory(e, self)
-        raise KeyError("no placeholder on this slide with idx == %d" % idx)
+        ph_elm = self._lookup.elm_by_idx.get(idx)
+        if ph_elm is None:
+            raise KeyError("no placeholder on this slide with idx == %d" % idx)
+        return self._shape_proxy(ph_elm)
 
     def __iter__(self):
         """Generate placeholder shapes in `idx` order."""
         ph_elms = sorted([e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx)
-        return (SlideShapeFactory(e, self) for e in ph_elms)
+        return (self._shape_proxy(e) for e in ph_elms)
 
     def __len__(self) -> int:
         """Return count of placeholder shapes."""
-        return len(list(self._element.iter_ph_elms()))
+        return len(self._lookup.shape_elms)
+
+    @property
+    def by_id(self) -> Mapping[int, SlidePlaceholder]:
+        """Read-only mapping of shape id to placeholder, like :attr:`SlideShapes.by_id`."""
+        return _ShapeMap(lambda: self._lookup.elm_by_id, self._shape_proxy)
+
+    @property
+    def by_name(self) -> Mapping[str, SlidePlaceholder]:
+        """Read-only mapping of shape name to placeholder, like :attr:`SlideShapes.by_name`."""
+        return _ShapeMap(lambda: self._lookup.elm_by_name, self._shape_proxy)
+
+    @property
+    def _lookup(self) -> _ShapeLookup:
+        """Lookup tables for the placeholders on the slide, rebuilt after the shape tree changes."""
+        version = self._element.shape_tree_version
+        lookup = self._cached_lookup
+        if lookup is None or lookup.version != version:
+            ph_elms = list(self._element.iter_ph_elms())
+            lookup = self._cached_lookup = _ShapeLookup(ph_elms, version)
+        return lookup
+
+    def _shape_proxy(self, ph_elm: ShapeElement) -> SlidePlaceholder:
+        """Placeholder proxy object for `ph_elm`, new unless a |proxy_identity_map| is active."""
+        return cast(
+            SlidePlaceholder, identity_mapped(ph_elm, self, lambda: SlideShapeFactory(ph_elm, self))
+        )
 
 
 def BaseShapeFactory(shape_elm: ShapeElement, parent: ProvidesPart) -> BaseShape:
@@ -1188,3 +1372,505 @@ class _OleObjectElementCreator(object):
     def _slide_part(self) -> SlidePart:
         """SlidePart object for this slide."""
         return self._shapes.part
+
+
+class AutoShapeSpec(NamedTuple):
+    """Specifies an auto shape to be added by :meth:`SlideShapes.add_shapes`.
+
+    The fields are those of :meth:`SlideShapes.add_shape`.
+    """
+
+    autoshape_type_id: MSO_SHAPE
+    left: Length
+    top: Length
+    width: Length
+    height: Length
+
+
+class TextboxSpec(NamedTuple):
+    """Specifies a text box to be added by :meth:`SlideShapes.add_shapes`.
+
+    The fields are those of :meth:`SlideShapes.add_textbox`.
+    """
+
+    left: Length
+    top: Length
+    width: Length
+    height: Length
+
+
+class PictureSpec(NamedTuple):
+    """Specifies a picture to be added by :meth:`SlideShapes.add_shapes`.
+
+    The fields are those of :meth:`SlideShapes.add_picture`, including how a |None| `width` or
+    `height` is worked out from the native size of the image.
+    """
+
+    image_file: str | IO[bytes]
+    left: Length
+    top: Length
+    width: Length | None = None
+    height: Length | None = None
+
+
+class ConnectorSpec(NamedTuple):
+    """Specifies a connector to be added by :meth:`SlideShapes.add_shapes`.
+
+    The fields are those of :meth:`SlideShapes.add_connector`.
+    """
+
+    connector_type: MSO_CONNECTOR_TYPE
+    begin_x: Length
+    begin_y: Length
+    end_x: Length
+    end_y: Length
+
+
+ShapeSpec = Union[AutoShapeSpec, TextboxSpec, PictureSpec, ConnectorSpec]
+
+
+class _ShapeLookup:
+    """Lookup tables for the shape elements in a shape collection.
+
+    Each table is built the first time it is used. The tables are only good while the shape tree
+    is unchanged since `version` was read from `CT_GroupShape.shape_tree_version`; a collection
+    replaces its lookup object when that version moves on.
+    """
+
+    def __init__(self, shape_elms: list[ShapeElement], version: int):
+        self.shape_elms = shape_elms
+        self.version = version
+
+    @lazyproperty
+    def elm_by_id(self) -> dict[int, ShapeElement]:
+        """The first shape element having each shape id."""
+        elm_by_id: dict[int, ShapeElement] = {}
+        for elm in self._shape_elms_with_cNvPr:
+            elm_by_id.setdefault(elm.shape_id, elm)
+        return elm_by_id
+
+    @lazyproperty
+    def elm_by_idx(self) -> dict[int, ShapeElement]:
+        """The first placeholder shape element having each placeholder idx."""
+        elm_by_idx: dict[int, ShapeElement] = {}
+        for elm in self._shape_elms_with_cNvPr:
+            if elm.has_ph_elm:
+                elm_by_idx.setdefault(elm.ph_idx, elm)
+        return elm_by_idx
+
+    @lazyproperty
+    def elm_by_name(self) -> dict[str, ShapeElement]:
+        """The first shape element having each shape name."""
+        elm_by_name: dict[str, ShapeElement] = {}
+        for elm in self._shape_elms_with_cNvPr:
+            elm_by_name.setdefault(elm.shape_name, elm)
+        return elm_by_name
+
+    @lazyproperty
+    def position_by_elm(self) -> dict[ShapeElement, int]:
+        """The position of each shape element in the collection."""
+        return {elm: idx for idx, elm in enumerate(self.shape_elms)}
+
+    @property
+    def _shape_elms_with_cNvPr(self) -> Iterator[ShapeElement]:
+        """Generate each shape element in the collection that has an id, name and so on.
+
+        This skips a `p:contentPart` element, which has none of these.
+        """
+        return (elm for elm in self.shape_elms if isinstance(elm, BaseShapeElement))
+
+
+class _ShapeMap(Mapping[_KT, _VT]):
+    """Read-only mapping of a key like shape id to the shape having it in a shape collection.
+
+    `get_elm_map` returns the collection's current key-to-element map, so the mapping stays
+    current when the shapes change. Proxy objects are only created for shapes looked up.
+    """
+
+    def __init__(
+        self,
+        get_elm_map: Callable[[], dict[_KT, ShapeElement]],
+        shape_factory: Callable[[ShapeElement], _VT],
+    ):
+        self._get_elm_map = get_elm_map
+        self._shape_factory = shape_factory
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._get_elm_map()
+
+    def __getitem__(self, key: _KT) -> _VT:
+        return self._shape_factory(self._get_elm_map()[key])
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self._get_elm_map())
+
+    def __len__(self) -> int:
+        return len(self._get_elm_map())
+
+
+class ShapeIdAllocator:
+    """Issues the ids of new shapes on a slide, slide layout, slide master or notes slide.
+
+    There is one allocator per slide part, available as its `shape_id_allocator` property, so
+    every shape-collection object for a slide draws ids from the same sequence no matter how many
+    |Slide| or shape-collection objects are in use. Each id issued is one greater than the last
+    one, which is the maximum id in the slide XML as of the last call to :meth:`sync`.
+    """
+
+    def __init__(self, spTree: CT_GroupShape):
+        self._spTree = spTree
+        self._max_id: int | None = None
+
+    def next_ids(self, count: int) -> range:
+        """Return `count` consecutive shape ids, each greater than any issued so far.
+
+        The slide XML is searched for the maximum id in use the first time ids are requested.
+        """
+        max_id = self._spTree.max_shape_id if self._max_id is None else self._max_id
+        self._max_id = max_id + count
+        return range(max_id + 1, max_id + count + 1)
+
+    def sync(self) -> None:
+        """Continue numbering from the maximum id currently used in the slide XML.
+
+        Accounts for ids assigned outside this allocator, like those of shape elements copied
+        into the slide XML directly.
+        """
+        self._max_id = self._spTree.max_shape_id
+
+
+class ShapeNameIndex:
+    """The set of shape names used on a slide, slide layout, slide master or notes slide.
+
+    There is one index per slide part, available as its `shape_name_index` property. It is read
+    from the slide XML the first time it is needed and then kept current as shapes are added and
+    renamed through python-pptx, so a unique name for a new shape can be found without searching
+    the slide XML each time. A name stays in the index after its shape is removed, which at worst
+    causes a generated name to skip a number. Names assigned by editing the slide XML directly are
+    not seen until the next call to :meth:`sync`.
+    """
+
+    def __init__(self, spTree: CT_GroupShape):
+        self._spTree = spTree
+        self._names: set[str] | None = None
+
+    def __contains__(self, name: object) -> bool:
+        """True if a shape on the slide is named `name`."""
+        return name in self._name_set
+
+    def add(self, name: str) -> None:
+        """Record that a shape on the slide is now named `name`."""
+        self._name_set.add(name)
+
+    def sync(self) -> None:
+        """Re-read the shape names from the slide XML."""
+        self._names = set(self._spTree.xpath("//p:cNvPr/@name"))
+
+    def unique_name(self, basename: str, number: int) -> str:
+        """Return the first of "`basename` `number`", "`basename` `number + 1`", ... not in use.
+
+        The returned name is not recorded as used; that happens when a shape is given the name.
+        """
+        names = self._name_set
+        while True:
+            name = "%s %d" % (basename, number)
+            if name not in names:
+                return name
+            number += 1
+
+    @property
+    def _name_set(self) -> set[str]:
+        """The set of names, read from the slide XML on first use."""
+        if self._names is None:
+            self.sync()
+        return cast("set[str]", self._names)
+
+
+class ShapeSpatialIndex:
+    """Grid index of where the shapes of a shape collection are, for region and hit-test queries.
+
+    Available as the `spatial_index` property of a shape collection. Each shape is indexed by its
+    extents, the rectangle given by its `left`, `top`, `width` and `height`, with the offset and
+    scaling of any group shapes it is nested in applied, so for a slide's shapes the extents are
+    in slide coordinates. A group shape is not itself indexed; the shapes it contains are. The
+    rotation and flipping of shapes and groups is not taken into account, nor is a shape whose
+    position is neither set nor inherited.
+
+    The area the shapes cover is divided into square cells of `cell_size` EMU (by default the
+    median width or height of the shapes) and each shape is recorded in each cell its extents
+    touch, so a query only examines the shapes sharing a cell with the region or point it asks
+    about. A shape touching very many cells is instead examined by every query.
+
+    The index brings itself up to date at the start of each query. Shapes moved or resized
+    through python-pptx since the last query are re-recorded, and the index is rebuilt after
+    shapes are added to or removed from the collection or any group in it. Changes made any other
+    way, such as by editing the XML directly, are not detected until a shape is added or removed.
+    """
+
+    # -- a shape touching more cells than this is kept out of the grid and checked every time --
+    _MAX_CELLS_PER_SHAPE = 256
+
+    def __init__(self, shapes: _BaseShapes, cell_size: int | None = None):
+        self._shapes = shapes
+        self._cell_size_arg = cell_size
+        self._cell_size = 1
+        # -- (left, top, right, bottom) in collection coordinates of each indexed shape --
+        self._extents: dict[BaseShapeElement, tuple[int, int, int, int]] = {}
+        self._cells_by_elm: dict[BaseShapeElement, list[tuple[int, int]]] = {}
+        self._elms_by_cell: dict[tuple[int, int], set[BaseShapeElement]] = {}
+        self._oversize_elms: set[BaseShapeElement] = set()
+        # -- position in document order, collection, and coordinate transform of the space each
+        # -- shape or group element is positioned in, for indexed shapes and groups alike
+        self._order: dict[BaseShapeElement, int] = {}
+        self._shapes_by_elm: dict[BaseShapeElement, _BaseShapes] = {}
+        self._transforms: dict[BaseShapeElement, tuple[float, float, float, float]] = {}
+        self._tree_versions: dict[BaseShapeElement, int] = {}
+        self._moved_elms: set[BaseShapeElement] = set()
+        self._is_built = False
+        shapes._element.watch_shape_moves(self)  # pyright: ignore[reportPrivateUsage]
+
+    def note_shape_moved(self, shape_elm: BaseShapeElement) -> None:
+        """Record that `shape_elm` has moved, so it is re-recorded before the next query."""
+        self._moved_elms.add(shape_elm)
+
+    def overlapping_pairs(self) -> list[tuple[BaseShape, BaseShape]]:
+        """Each pair of shapes whose extents overlap, earlier shape in the collection first.
+
+        Shapes that only touch along an edge do not overlap. Pairs appear in collection order, and
+        a shape appearing in more than one pair is the same object in each.
+        """
+        self._refresh()
+        extents, order, cell_size = self._extents, self._order, self._cell_size
+
+        def overlap(a: BaseShapeElement, b: BaseShapeElement) -> bool:
+            al, at, ar, ab = extents[a]
+            bl, bt, br, bb = extents[b]
+            return al < br and bl < ar and at < bb and bt < ab
+
+        pairs: list[tuple[BaseShapeElement, BaseShapeElement]] = []
+        for cell, cell_elms in self._elms_by_cell.items():
+            elms = sorted(cell_elms, key=order.__getitem__)
+            for i, a in enumerate(elms):
+                for b in elms[i + 1 :]:
+                    if not overlap(a, b):
+                        continue
+                    # -- report each pair only from the cell holding the top-left corner of
+                    # -- their overlap, which both shapes are recorded in
+                    corner_cell = (
+                        max(extents[a][0], extents[b][0]) // cell_size,
+                        max(extents[a][1], extents[b][1]) // cell_size,
+                    )
+                    if corner_cell == cell:
+                        pairs.append((a, b))
+        for a in self._oversize_elms:
+            for b in extents:
+                if b is a or (b in self._oversize_elms and order[b] < order[a]):
+                    continue
+                if overlap(a, b):
+                    pairs.append((a, b) if order[a] < order[b] else (b, a))
+
+        pairs.sort(key=lambda pair: (order[pair[0]], order[pair[1]]))
+        # -- a shape in several pairs is represented by the same proxy object in each --
+        shapes = {elm: self._shape(elm) for elm in {elm for pair in pairs for elm in pair}}
+        return [(shapes[a], shapes[b]) for a, b in pairs]
+
+    def shapes_at(self, x: Length, y: Length) -> list[BaseShape]:
+        """The shapes whose extents contain the point (`x`, `y`), edges included.
+
+        Shapes appear in collection order, which is z-order, so the topmost shape is last.
+        """
+        self._refresh()
+        cell_size = self._cell_size
+        candidates = self._elms_by_cell.get((x // cell_size, y // cell_size), set())
+        return self._shapes_among(
+            candidates | self._oversize_elms,
+            lambda x1, y1, x2, y2: x1 <= x <= x2 and y1 <= y <= y2,
+        )
+
+    def shapes_in(
+        self, left: Length, top: Length, width: Length, height: Length, partly: bool = False
+    ) -> list[BaseShape]:
+        """The shapes whose extents lie within the region at `left`, `top` of `width`, `height`.
+
+        A shape on the boundary of the region is within it. When `partly` is True, shapes that
+        overlap or touch the region without lying wholly within it are included as well. Shapes
+        appear in collection order.
+        """
+        self._refresh()
+        right, bottom = left + width, top + height
+        cells = self._cells_covering(left, top, right, bottom)
+        if cells is None or len(cells) > len(self._extents):
+            candidates = set(self._extents)
+        else:
+            candidates = set(self._oversize_elms)
+            for cell in cells:
+                candidates.update(self._elms_by_cell.get(cell, ()))
+
+        def is_in(x1: int, y1: int, x2: int, y2: int) -> bool:
+            if partly:
+                return x1 <= right and left <= x2 and y1 <= bottom and top <= y2
+            return left <= x1 and x2 <= right and top <= y1 and y2 <= bottom
+
+        return self._shapes_among(candidates, is_in)
+
+    def _cells_covering(
+        self, left: int, top: int, right: int, bottom: int
+    ) -> list[tuple[int, int]] | None:
+        """The grid cells the rectangle touches, None when there are too many to record."""
+        cell_size = self._cell_size
+        cols = range(left // cell_size, right // cell_size + 1)
+        rows = range(top // cell_size, bottom // cell_size + 1)
+        if len(cols) * len(rows) > self._MAX_CELLS_PER_SHAPE:
+            return None
+        return [(col, row) for col in cols for row in rows]
+
+    def _extents_of(self, elm: BaseShapeElement) -> tuple[int, int, int, int] | None:
+        """(left, top, right, bottom) of `elm` in collection coordinates, None if it has none."""
+        x, y, cx, cy = elm.x, elm.y, elm.cx, elm.cy
+        if x is None or y is None or cx is None or cy is None:
+            # -- a placeholder can inherit its position from its layout placeholder --
+            shape = self._shape(elm)
+            x, y, cx, cy = shape.left, shape.top, shape.width, shape.height
+            if x is None or y is None or cx is None or cy is None:
+                return None
+        scale_x, offset_x, scale_y, offset_y = self._transforms[elm]
+        left, top = offset_x + scale_x * x, offset_y + scale_y * y
+        return (round(left), round(top), round(left + scale_x * cx), round(top + scale_y * cy))
+
+    @staticmethod
+    def _member_transform(
+        grpSp: BaseShapeElement, transform: tuple[float, float, float, float]
+    ) -> tuple[float, float, float, float]:
+        """Coordinate transform of the shapes in `grpSp`, which is positioned by `transform`.
+
+        A group maps the rectangle at its `a:chOff` of size `a:chExt`, in which its member shapes
+        are positioned, onto its own extents.
+        """
+        scale_x, offset_x, scale_y, offset_y = transform
+        xfrm = grpSp.xfrm
+        if xfrm is None or xfrm.off is None or xfrm.chOff is None:
+            return transform
+        ext, chExt = xfrm.ext, xfrm.chExt
+        member_scale_x = member_scale_y = 1.0
+        if ext is not None and chExt is not None:
+            member_scale_x = ext.cx / chExt.cx if chExt.cx else 1.0
+            member_scale_y = ext.cy / chExt.cy if chExt.cy else 1.0
+        return (
+            scale_x * member_scale_x,
+            offset_x + scale_x * (xfrm.off.x - xfrm.chOff.x * member_scale_x),
+            scale_y * member_scale_y,
+            offset_y + scale_y * (xfrm.off.y - xfrm.chOff.y * member_scale_y),
+        )
+
+    def _place(self, elm: BaseShapeElement, extents: tuple[int, int, int, int] | None) -> None:
+        """Record `elm` in the cells `extents` touch, replacing any earlier record of it."""
+        for cell in self._cells_by_elm.pop(elm, ()):
+            self._elms_by_cell[cell].discard(elm)
+        self._oversize_elms.discard(elm)
+        self._extents.pop(elm, None)
+
+        if extents is None:
+            return
+        self._extents[elm] = extents
+        cells = self._cells_covering(*extents)
+        if cells is None:
+            self._oversize_elms.add(elm)
+            return
+        self._cells_by_elm[elm] = cells
+        for cell in cells:
+            self._elms_by_cell.setdefault(cell, set()).add(elm)
+
+    def _rebuild(self) -> None:
+        """Index the shapes in the collection from scratch."""
+        for table in (
+            self._extents,
+            self._cells_by_elm,
+            self._elms_by_cell,
+            self._oversize_elms,
+            self._order,
+            self._shapes_by_elm,
+            self._transforms,
+            self._tree_versions,
+            self._moved_elms,
+        ):
+            table.clear()
+        root = self._shapes._element  # pyright: ignore[reportPrivateUsage]
+        self._tree_versions[root] = root.shape_tree_version
+        elms = self._visit(self._shapes, (1.0, 0.0, 1.0, 0.0))
+        extents = [self._extents_of(elm) for elm in elms]
+
+        if self._cell_size_arg is not None:
+            self._cell_size = max(1, self._cell_size_arg)
+        else:
+            sizes = sorted(max(x2 - x1, y2 - y1) for x1, y1, x2, y2 in filter(None, extents))
+            self._cell_size = max(1, sizes[len(sizes) // 2]) if sizes else 1
+        for elm, elm_extents in zip(elms, extents):
+            self._place(elm, elm_extents)
+        self._is_built = True
+
+    def _refresh(self) -> None:
+        """Bring the index up to date with the shapes in the collection."""
+        if not self._is_built or any(
+            elm.shape_tree_version != version for elm, version in self._tree_versions.items()
+        ):
+            self._rebuild()
+            return
+        moved_elms, self._moved_elms = self._moved_elms, set()
+        for elm in moved_elms:
+            if elm not in self._transforms:
+                continue
+            if elm.tag == qn("p:grpSp"):
+                # -- moving a group moves its members, and through them their members --
+                group = cast(GroupShape, self._shape(elm))
+                transform = self._member_transform(elm, self._transforms[elm])
+                for member_elm in self._visit(group.shapes, transform):
+                    self._place(member_elm, self._extents_of(member_elm))
+            else:
+                self._place(elm, self._extents_of(elm))
+
+    def _shape(self, elm: BaseShapeElement) -> BaseShape:
+        """The shape proxy for `elm`, provided by the collection `elm` is a member of."""
+        return self._shapes_by_elm[elm]._shape_proxy(elm)  # pyright: ignore[reportPrivateUsage]
+
+    def _shapes_among(
+        self,
+        elms: Iterable[BaseShapeElement],
+        matches: Callable[[int, int, int, int], bool],
+    ) -> list[BaseShape]:
+        """Shapes for those of `elms` whose extents `matches` accepts, in collection order."""
+        extents = self._extents
+        found = [elm for elm in elms if matches(*extents[elm])]
+        found.sort(key=self._order.__getitem__)
+        return [self._shape(elm) for elm in found]
+
+    def _visit(
+        self, shapes: _BaseShapes, transform: tuple[float, float, float, float]
+    ) -> list[BaseShapeElement]:
+        """Note the collection and transform of each shape in `shapes`, descending into groups.
+
+        Returns the shape elements to be indexed, those that are not groups.
+        """
+        elms: list[BaseShapeElement] = []
+        for elm in shapes._iter_member_elms():  # pyright: ignore[reportPrivateUsage]
+            if not isinstance(elm, BaseShapeElement):
+                continue
+            self._order.setdefault(elm, len(self._order))
+            self._shapes_by_elm[elm] = shapes
+            self._transforms[elm] = transform
+            if elm.tag == qn("p:grpSp"):
+                self._tree_versions[elm] = elm.shape_tree_version
+                group = cast(GroupShape, self._shape(elm))
+                elms.extend(self._visit(group.shapes, self._member_transform(elm, transform)))
+            else:
+                elms.append(elm)
+        return elms
+
+
+def _connector_geometry(
+    begin_x: int, begin_y: int, end_x: int, end_y: int
+) -> tuple[int, int, int, int, bool, bool]:
+    """Return `(x, y, cx, cy, flipH, flipV)` for a connector between the specified end-points."""
+    flipH, flipV = begin_x > end_x, begin_y > end_y
+    x, y = min(begin_x, end_x), min(begin_y, end_y)
+    cx, cy = abs(end_x - begin_x), abs(end_y - begin_y)
+    return x, y, cx, cy, flipH, flipV
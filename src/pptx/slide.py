@@ -664,10 +664,10 @@ class Slides(ParentedElementProxy):
 
         Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
-                return idx
-        raise ValueError("%s is not in slide collection" % slide)
+        try:
+            return self.part.slide_idx(slide.part)
+        except ValueError:
+            raise ValueError("%s is not in slide collection" % slide)
 
 
 class SlideLayout(_BaseSlide, IntrospectionMixin):
@@ -0,0 +1,224 @@
+"""Summary of a presentation read straight from its package, without loading it.
+
+Provides |PresentationSummary|, the value returned by :func:`pptx.peek`. Only the handful of
+package items needed for the summary are read, each streamed with `lxml.etree.iterparse()`, so
+no parts, proxy objects or relationship graphs are constructed.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, cast
+
+from lxml import etree
+from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.coreprops import CT_CoreProperties
+from pptx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    from pptx.opc.serialized import PackageReader
+
+
+class CorePropertiesSummary(NamedTuple):
+    """The core properties of a presentation, as found in its `/docProps/core.xml` item.
+
+    Each field has the same name and meaning as the corresponding property of
+    |CoreProperties|. A string property not present in the package is the empty string, and a
+    date property not present is |None|. Unlike a loaded presentation, no default properties are
+    provided when the package has no core-properties item.
+    """
+
+    author: str
+    category: str
+    comments: str
+    content_status: str
+    created: dt.datetime | None
+    identifier: str
+    keywords: str
+    language: str
+    last_modified_by: str
+    last_printed: dt.datetime | None
+    modified: dt.datetime | None
+    revision: int
+    subject: str
+    title: str
+    version: str
+
+    @classmethod
+    def from_xml(cls, coreProperties: CT_CoreProperties) -> CorePropertiesSummary:
+        """Return summary of the properties in `coreProperties`."""
+        return cls(
+            author=coreProperties.author_text,
+            category=coreProperties.category_text,
+            comments=coreProperties.comments_text,
+            content_status=coreProperties.contentStatus_text,
+            created=coreProperties.created_datetime,
+            identifier=coreProperties.identifier_text,
+            keywords=coreProperties.keywords_text,
+            language=coreProperties.language_text,
+            last_modified_by=coreProperties.lastModifiedBy_text,
+            last_printed=coreProperties.lastPrinted_datetime,
+            modified=coreProperties.modified_datetime,
+            revision=coreProperties.revision_number,
+            subject=coreProperties.subject_text,
+            title=coreProperties.title_text,
+            version=coreProperties.version_text,
+        )
+
+
+class PresentationSummary(NamedTuple):
+    """Immutable summary of a presentation, as returned by :func:`pptx.peek`.
+
+    `slide_titles` contains the text of the title placeholder of each slide, in slide order, as
+    it would be returned by `slide.shapes.title.text_frame.text`. The title of a slide that has
+    no title placeholder is |None|.
+    """
+
+    core_properties: CorePropertiesSummary
+    slide_count: int
+    slide_titles: tuple[str | None, ...]
+
+
+def read_summary(package_reader: PackageReader) -> PresentationSummary:
+    """Return a |PresentationSummary| of the presentation in `package_reader`.
+
+    Raises |ValueError| when the package has no main document part.
+    """
+    return _SummaryReader.read(package_reader)
+
+
+class _SummaryReader:
+    """Reads a |PresentationSummary| from the package items of `package_reader`.
+
+    Each package item is read at most once and parsing of a slide stops as soon as its title has
+    been found.
+    """
+
+    def __init__(self, package_reader: PackageReader):
+        self._package_reader = package_reader
+
+    @classmethod
+    def read(cls, package_reader: PackageReader) -> PresentationSummary:
+        """Return a |PresentationSummary| of the presentation in `package_reader`."""
+        return cls(package_reader)._read()
+
+    def _read(self) -> PresentationSummary:
+        pkg_rels = self._rels_for(PACKAGE_URI)
+        presentation_partname = self._target_of(pkg_rels, RT.OFFICE_DOCUMENT)
+        if presentation_partname is None:
+            raise ValueError("package has no main document part, it is not a PowerPoint file")
+
+        slide_rIds = self._slide_rIds(presentation_partname)
+        prs_rels = self._rels_for(presentation_partname)
+        slide_titles = tuple(
+            self._slide_title(prs_rels[rId][1] if rId in prs_rels else None) for rId in slide_rIds
+        )
+
+        return PresentationSummary(
+            core_properties=self._core_properties(self._target_of(pkg_rels, RT.CORE_PROPERTIES)),
+            slide_count=len(slide_rIds),
+            slide_titles=slide_titles,
+        )
+
+    def _core_properties(self, partname: PackURI | None) -> CorePropertiesSummary:
+        """Summary of core properties in `partname`, empty when there is no such part.
+
+        The core-properties item is small enough that it is simply parsed whole.
+        """
+        if partname is None or partname not in self._package_reader:
+            coreProperties = CT_CoreProperties.new_coreProperties()
+        else:
+            coreProperties = cast(CT_CoreProperties, parse_xml(self._package_reader[partname]))
+        return CorePropertiesSummary.from_xml(coreProperties)
+
+    def _iterparse(self, partname: PackURI, **kwargs: Any) -> Iterator[tuple[str, _Element]]:
+        """Generate (event, element) pairs from incrementally parsing the item `partname`."""
+        return etree.iterparse(  # pyright: ignore[reportUnknownMemberType]
+            io.BytesIO(self._package_reader[partname]), resolve_entities=False, **kwargs
+        )
+
+    def _rels_for(self, partname: PackURI) -> dict[str, tuple[str, PackURI]]:
+        """dict {rId: (reltype, target-partname)} of the internal relationships of `partname`."""
+        rels_uri = partname.rels_uri
+        if rels_uri not in self._package_reader:
+            return {}
+
+        base_uri = partname.baseURI
+        rels: dict[str, tuple[str, PackURI]] = {}
+        for _, rel in self._iterparse(rels_uri, tag=qn("pr:Relationship")):
+            if rel.get("TargetMode", RTM.INTERNAL) == RTM.INTERNAL:
+                target = PackURI.from_rel_ref(base_uri, rel.get("Target", ""))
+                rels[rel.get("Id", "")] = (rel.get("Type", ""), target)
+            rel.clear()
+        return rels
+
+    def _slide_rIds(self, presentation_partname: PackURI) -> list[str]:
+        """rId of each `p:sldId` element in the presentation part, in document order.
+
+        Parsing stops at the end of the `p:sldIdLst` element, so the rest of the presentation
+        part is never read.
+        """
+        rIds: list[str] = []
+        for event, elm in self._iterparse(presentation_partname, events=("start", "end")):
+            if event == "start":
+                if elm.getparent() is None and elm.tag != qn("p:presentation"):
+                    raise ValueError(
+                        "main document part is '%s', not a PowerPoint presentation" % elm.tag
+                    )
+                continue
+            if elm.tag == qn("p:sldId"):
+                rIds.append(elm.get(qn("r:id"), ""))
+            elif elm.tag == qn("p:sldIdLst"):
+                break
+        return rIds
+
+    def _slide_title(self, slide_partname: PackURI | None) -> str | None:
+        """Text of the title placeholder in `slide_partname`, |None| if it has none.
+
+        Like `SlideShapes.title`, the title is the first top-level placeholder shape having
+        idx 0. Parsing stops as soon as it is found and each shape is discarded once examined, so
+        only a single shape is held in memory at a time.
+        """
+        if slide_partname is None or slide_partname not in self._package_reader:
+            return None
+
+        spTree_tag = qn("p:spTree")
+        for _, shape in self._iterparse(
+            slide_partname, tag=(qn("p:sp"), qn("p:pic"), qn("p:graphicFrame"))
+        ):
+            parent = shape.getparent()
+            if parent is None or parent.tag != spTree_tag:
+                continue
+            ph = shape.find("./*[1]/%s/%s" % (qn("p:nvPr"), qn("p:ph")))
+            if ph is not None and ph.get("idx", "0") == "0":
+                return self._text_of(shape)
+            shape.clear()
+        return None
+
+    @staticmethod
+    def _target_of(rels: dict[str, tuple[str, PackURI]], reltype: str) -> PackURI | None:
+        """Target partname of the first relationship of `reltype` in `rels`, if any."""
+        return next((target for type_, target in rels.values() if type_ == reltype), None)
+
+    @staticmethod
+    def _text_of(shape: _Element) -> str:
+        """Text of `shape` encoded the same way as `TextFrame.text`."""
+        r_tag, fld_tag, br_tag = qn("a:r"), qn("a:fld"), qn("a:br")
+        t_tag = qn("a:t")
+
+        def iter_p_text(p: _Element) -> Iterator[str]:
+            for child in p:
+                if child.tag in (r_tag, fld_tag):
+                    yield child.findtext(t_tag) or ""
+                elif child.tag == br_tag:
+                    yield "\v"
+
+        return "\n".join(
+            "".join(iter_p_text(p)) for p in shape.iterfind("%s/%s" % (qn("p:txBody"), qn("a:p")))
+        )
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PIL import ImageFont
-
 if TYPE_CHECKING:
     from pptx.util import Length
 
@@ -298,6 +296,9 @@ class _Fonts(object):
 
     @classmethod
     def font(cls, font_path, point_size):
+        # -- Pillow is imported on first use, it is slow to import --
+        from PIL import ImageFont
+
         if (font_path, point_size) not in cls.fonts:
             cls.fonts[(font_path, point_size)] = ImageFont.truetype(font_path, point_size)
         return cls.fonts[(font_path, point_size)]
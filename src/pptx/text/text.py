@@ -16,7 +16,7 @@ from pptx.oxml.simpletypes import ST_TextFontStrike, ST_TextWrappingType
 from pptx.shapes import Subshape
 from pptx.text.fonts import FontFiles
 from pptx.text.layout import TextFitter
-from pptx.util import Centipoints, Emu, Length, Pt, lazyproperty
+from pptx.util import Centipoints, Emu, Length, Pt, identity_mapped, lazyproperty
 
 if TYPE_CHECKING:
     from pptx.enum.text import (
@@ -150,7 +150,9 @@ class TextFrame(Subshape, IntrospectionMixin):
 
         A text frame always contains at least one paragraph.
         """
-        return tuple([_Paragraph(p, self) for p in self._txBody.p_lst])
+        return tuple(
+            [identity_mapped(p, self, lambda: _Paragraph(p, self)) for p in self._txBody.p_lst]
+        )
 
     @property
     def text(self) -> str:
@@ -224,7 +226,8 @@ class TextFrame(Subshape, IntrospectionMixin):
         as the text frame the paragraph is contained in and they may be overridden by character
         properties set at the run level.
         """
-        return Font(self._defRPr)
+        defRPr = self._defRPr
+        return identity_mapped(defRPr, self, lambda: Font(defRPr))
 
     @property
     def vertical_anchor(self) -> MSO_VERTICAL_ANCHOR | None:
@@ -989,7 +992,8 @@ class _Paragraph(Subshape, IntrospectionMixin):
         as the text frame the paragraph is contained in and they may be overridden by character
         properties set at the run level.
         """
-        return Font(self._defRPr)
+        defRPr = self._defRPr
+        return identity_mapped(defRPr, self, lambda: Font(defRPr))
 
     @property
     def level(self) -> int:
@@ -1028,7 +1032,7 @@ class _Paragraph(Subshape, IntrospectionMixin):
     @property
     def runs(self) -> tuple[_Run, ...]:
         """Sequence of runs in this paragraph."""
-        return tuple(_Run(r, self) for r in self._element.r_lst)
+        return tuple(identity_mapped(r, self, lambda: _Run(r, self)) for r in self._element.r_lst)
 
     @property
     def space_after(self) -> Length | None:
@@ -1415,7 +1419,7 @@ class _Run(Subshape, IntrospectionMixin):
         overridden at the run level are contained in the font object.
         """
         rPr = self._r.get_or_add_rPr()
-        return Font(rPr)
+        return identity_mapped(rPr, self, lambda: Font(rPr))
 
     @lazyproperty
     def hyperlink(self) -> _Hyperlink:
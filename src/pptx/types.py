@@ -8,6 +8,7 @@ from typing_extensions import Protocol
 
 if TYPE_CHECKING:
     from pptx.opc.package import XmlPart
+    from pptx.oxml.shapes.shared import BaseShapeElement
     from pptx.util import Length
 
 
@@ -34,3 +35,11 @@ class ProvidesPart(Protocol):
 
     @property
     def part(self) -> XmlPart: ...
+
+
+class WatchesShapeMoves(Protocol):
+    """An object that is told when a shape in the shape tree it watches is moved or resized."""
+
+    def note_shape_moved(self, shape_elm: BaseShapeElement) -> None:
+        """Called with the shape element whose position or size changed."""
+        ...
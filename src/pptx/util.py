@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import functools
-from typing import Any, Callable, Generic, TypeVar, cast
+from contextvars import ContextVar
+from typing import Any, Callable, Generic, Iterator, TypeVar, cast
 
 
 class Length(int):
@@ -212,3 +214,56 @@ class lazyproperty(Generic[_T]):
         probably not a rich target for optimization efforts.
         """
         raise AttributeError("can't set attribute")
+
+
+# -- the proxy identity map of the innermost active `proxy_identity_map()` block, if any --
+_proxy_identity_map: ContextVar[dict[tuple[Any, int], tuple[Any, Any]] | None] = ContextVar(
+    "_proxy_identity_map", default=None
+)
+
+
+@contextlib.contextmanager
+def proxy_identity_map() -> Iterator[None]:
+    """Context manager within which each proxy object, once created, is reused.
+
+    Ordinarily a new proxy object is created each time a shape, text frame, paragraph, run or font
+    is accessed, so `slide.shapes[0] is slide.shapes[0]` is False and whatever a proxy computes
+    and caches for itself, such as a shape's `.fill`, is computed again for each new proxy. Within
+    this block, accessing the same shape, text frame, paragraph, run or font the same way again
+    returns the proxy object created the first time, which saves creating it again when the same
+    objects are visited more than once::
+
+        with proxy_identity_map():
+            for shape in slide.shapes:
+                ...
+
+    The proxies created are held until the block exits, so memory use grows with the number of
+    objects visited. A nested block uses the map of the outermost one. Each thread (and each
+    asyncio task) has its own map.
+    """
+    if _proxy_identity_map.get() is not None:
+        yield
+        return
+    token = _proxy_identity_map.set({})
+    try:
+        yield
+    finally:
+        _proxy_identity_map.reset(token)
+
+
+def identity_mapped(element: Any, owner: Any, new_proxy: Callable[[], _T]) -> _T:
+    """Return `new_proxy()`, or within a |proxy_identity_map| block the proxy it returned before.
+
+    The proxy is remembered by `element`, the lxml element it wraps, and `owner`, the object
+    providing it, such as the shape collection or shape, which must provide at most one kind of
+    proxy for any one element.
+    """
+    proxies = _proxy_identity_map.get()
+    if proxies is None:
+        return new_proxy()
+    key = (element, id(owner))
+    entry = proxies.get(key)
+    if entry is None:
+        # -- `owner` is held with the proxy so its id cannot be reused while the entry exists --
+        entry = proxies[key] = (owner, new_proxy())
+    return entry[1]
@@ -83,7 +83,7 @@ class Describe_BaseWorkbookWriter(object):
 
     @pytest.fixture
     def Workbook_(self, request, workbook_):
-        return class_mock(request, "pptx.chart.xlsx.Workbook", return_value=workbook_)
+        return class_mock(request, "xlsxwriter.Workbook", return_value=workbook_)
 
     @pytest.fixture
     def workbook_(self, request):
@@ -6,6 +6,7 @@ import pytest
 
 from pptx.enum.action import PP_ACTION, PP_ACTION_TYPE
 from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.enum.lang import MSO_LANGUAGE_ID
 
 
 class DescribeBaseEnum:
@@ -58,6 +59,9 @@ class DescribeBaseXmlEnum:
         with pytest.raises(ValueError, match="MSO_LINE_DASH_STYLE has no XML mapping for ''"):
             MSO_LINE_DASH_STYLE.from_xml("")
 
+    def and_it_maps_an_XML_value_shared_by_several_members_to_the_first_one(self):
+        assert MSO_LANGUAGE_ID.from_xml("en-US") == MSO_LANGUAGE_ID.ENGLISH_US
+
     def it_knows_the_XML_attribute_value_for_each_member_that_has_one(self):
         assert MSO_LINE_DASH_STYLE.to_xml(MSO_LINE_DASH_STYLE.SOLID) == "solid"
 
@@ -71,3 +75,12 @@ class DescribeBaseXmlEnum:
     def and_it_raises_when_the_member_has_no_XML_value(self):
         with pytest.raises(ValueError, match="MSO_LINE_DASH_STYLE.DASH_STYLE_MIXED has no XML r"):
             MSO_LINE_DASH_STYLE.to_xml(-2)
+
+    def it_builds_its_XML_value_maps_only_once(self):
+        member_by_xml_value, xml_value_by_value = MSO_LINE_DASH_STYLE._xml_codec()
+
+        assert member_by_xml_value["lgDash"] is MSO_LINE_DASH_STYLE.LONG_DASH
+        assert xml_value_by_value[MSO_LINE_DASH_STYLE.LONG_DASH] == "lgDash"
+        assert "" not in member_by_xml_value
+        assert MSO_LINE_DASH_STYLE.DASH_STYLE_MIXED not in xml_value_by_value
+        assert MSO_LINE_DASH_STYLE._xml_codec()[0] is member_by_xml_value
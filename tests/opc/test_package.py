@@ -7,10 +7,14 @@ from __future__ import annotations
 import collections
 import io
 import itertools
+import os
+import shutil
+import zipfile
 from typing import Any
 
 import pytest
 
+from pptx.exc import ReadOnlyPackageError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
@@ -22,12 +26,16 @@ from pptx.opc.package import (
     XmlPart,
     _ContentTypeMap,
     _PackageLoader,
+    _PartnameIndex,
+    _PartsOnDemand,
     _RelatableMixin,
     _Relationship,
     _Relationships,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.parts.presentation import PresentationPart
 
 from ..unitutil.cxml import element
@@ -45,6 +53,8 @@ from ..unitutil.mock import (
     property_mock,
 )
 
+test_pptx_path = absjoin(test_file_dir, "test.pptx")
+
 
 class Describe_RelatableMixin:
     """Unit-test suite for `pptx.opc.package._RelatableMixin`.
@@ -63,14 +73,19 @@ class Describe_RelatableMixin:
         relationships_.part_with_reltype.assert_called_once_with(RT.CHART)
         assert related_part is part_
 
-    def it_can_establish_a_relationship_to_another_part(self, _rels_prop_, relationships_, part_):
+    def it_can_establish_a_relationship_to_another_part(
+        self, request, _rels_prop_, relationships_, part_
+    ):
         relationships_.get_or_add.return_value = "rId42"
         _rels_prop_.return_value = relationships_
+        _part_related_ = method_mock(request, _RelatableMixin, "_part_related")
+        method_mock(request, _RelatableMixin, "_raise_if_read_only")
         mixin = _RelatableMixin()
 
         rId = mixin.relate_to(part_, RT.SLIDE)
 
         relationships_.get_or_add.assert_called_once_with(RT.SLIDE, part_)
+        _part_related_.assert_called_once_with(mixin, part_)
         assert rId == "rId42"
 
     def and_it_can_establish_a_relationship_to_an_external_link(
@@ -78,6 +93,7 @@ class Describe_RelatableMixin:
     ):
         relationships_.get_or_add_ext_rel.return_value = "rId24"
         _rels_prop_.return_value = relationships_
+        method_mock(request, _RelatableMixin, "_raise_if_read_only")
         mixin = _RelatableMixin()
 
         rId = mixin.relate_to("http://url", RT.HYPERLINK, is_external=True)
@@ -140,16 +156,54 @@ class DescribeOpcPackage:
 
         package = OpcPackage.open("package.pptx")
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
+        _init_.assert_called_once_with(ANY, "package.pptx", False, False)
         _load_.assert_called_once_with(ANY)
         assert package is package_
 
+    def it_can_close_the_package_file_it_holds_open(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        package = OpcPackage(None, lazy=True)
+        package._package_reader = package_reader_
+
+        with package:
+            pass
+
+        package_reader_.close.assert_called_once_with()
+
+    def but_closing_is_a_no_op_when_the_package_was_read_in_full(self):
+        OpcPackage(None).close()
+
     def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
 
-        OpcPackage(None).drop_rel("rId42")
+        package = OpcPackage(None)
+        package._partname_index = _PartnameIndex()
+
+        package.drop_rel("rId42")
 
         relationships_.pop.assert_called_once_with("rId42")
+        assert package._partname_index is None
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda package: package.drop_rel("rId42"),
+            lambda package: package.relate_to("http://url", RT.HYPERLINK, is_external=True),
+            lambda package: package.next_partname("/ppt/slides/slide%d.xml"),
+            lambda package: package.save("prs.pptx"),
+        ],
+    )
+    def but_it_raises_on_any_change_when_opened_read_only(
+        self, _rels_prop_, relationships_, mutate
+    ):
+        _rels_prop_.return_value = relationships_
+        package = OpcPackage(None, read_only=True)
+
+        with pytest.raises(ReadOnlyPackageError):
+            mutate(package)
+
+        assert package.is_read_only is True
+        assert relationships_.mock_calls == []
 
     def it_can_iterate_over_its_parts(self, request):
         part_, part_2_ = [instance_mock(request, Part, name="part_%d" % i) for i in range(2)]
@@ -245,6 +299,72 @@ class DescribeOpcPackage:
         PackURI_.assert_called_once_with(next_partname)
         assert partname == next_partname
 
+    def it_keeps_its_partname_index_current_once_built(self, request):
+        part_1_, part_2_ = (
+            instance_mock(request, Part, partname=PackURI("/x%d.xml" % n)) for n in (1, 2)
+        )
+        iter_parts_ = method_mock(request, OpcPackage, "iter_parts", return_value=iter([part_1_]))
+        package = OpcPackage(None)
+
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+        package._part_related(part_2_)
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+        part_1_.partname = PackURI("/y1.xml")
+        package._part_renamed(part_1_, PackURI("/x1.xml"))
+        assert package.next_partname("/x%d.xml") == "/x1.xml"
+
+        iter_parts_.assert_called_once_with(package)
+
+    def it_saves_over_its_own_source_file_by_way_of_a_temporary_file(
+        self, request, tmp_path, _rels_prop_, relationships_
+    ):
+        pkg_path = str(tmp_path / "prs.pptx")
+        with open(pkg_path, "wb") as f:
+            f.write(b"old")
+        _rels_prop_.return_value = relationships_
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(()))
+
+        def write(pkg_file, pkg_rels, parts, workers, compression):
+            assert pkg_file != pkg_path
+            with open(pkg_file, "wb") as f:
+                f.write(b"new")
+
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        PackageWriter_.write.side_effect = write
+        package = OpcPackage(pkg_path, lazy=True)
+        package._package_reader = instance_mock(request, PackageReader)
+
+        package.save(pkg_path)
+
+        with open(pkg_path, "rb") as f:
+            assert f.read() == b"new"
+        assert os.listdir(str(tmp_path)) == ["prs.pptx"]
+
+    def and_it_saves_over_its_source_through_a_file_object_open_on_it(self, tmp_path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        shutil.copyfile(test_pptx_path, pkg_path)
+        package = OpcPackage.open(pkg_path, lazy=True)
+
+        with open(pkg_path, "r+b") as f:
+            package.save(f)
+        package.close()
+
+        assert os.listdir(str(tmp_path)) == ["prs.pptx"]
+        assert zipfile.ZipFile(pkg_path).testzip() is None
+        OpcPackage.open(pkg_path)
+
+    def but_it_raises_when_a_file_object_open_on_its_source_truncated_it(self, tmp_path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        shutil.copyfile(test_pptx_path, pkg_path)
+        package = OpcPackage.open(pkg_path, lazy=True)
+
+        with pytest.raises(zipfile.BadZipFile):
+            with open(pkg_path, "wb") as f:
+                package.save(f)
+        package.close()
+
+        assert os.listdir(str(tmp_path)) == ["prs.pptx"]
+
     def it_can_save_to_a_pkg_file(self, request, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
         parts_ = tuple(instance_mock(request, Part) for _ in range(3))
@@ -254,20 +374,27 @@ class DescribeOpcPackage:
 
         package.save("prs.pptx")
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_, None, None)
 
-    def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
+    @pytest.mark.parametrize("lazy", [False, True])
+    def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_, lazy):
+        package_reader_ = instance_mock(request, PackageReader, is_lazy=lazy)
+        PackageReader_ = class_mock(
+            request, "pptx.opc.package.PackageReader", return_value=package_reader_
+        )
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
         _PackageLoader_.load.return_value = "pkg-rels-xml", {"partname": "part"}
         _rels_prop_.return_value = relationships_
-        package = OpcPackage("prs.pptx")
+        package = OpcPackage("prs.pptx", lazy)
 
         return_value = package._load()
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        PackageReader_.assert_called_once_with("prs.pptx", lazy)
+        _PackageLoader_.load.assert_called_once_with(package_reader_, package)
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
+        assert package._package_reader is (package_reader_ if lazy else None)
         assert return_value is package
 
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
@@ -295,7 +422,7 @@ class DescribeOpcPackage:
 class Describe_PackageLoader:
     """Unit-test suite for `pptx.opc.package._PackageLoader` objects."""
 
-    def it_provides_a_load_interface_classmethod(self, request, package_):
+    def it_provides_a_load_interface_classmethod(self, request, package_, package_reader_):
         _init_ = initializer_mock(request, _PackageLoader)
         pkg_xml_rels_ = element("r:Relationships")
         _load_ = method_mock(
@@ -305,9 +432,9 @@ class Describe_PackageLoader:
             return_value=(pkg_xml_rels_, {"partname": "part"}),
         )
 
-        pkg_xml_rels, parts = _PackageLoader.load("prs.pptx", package_)
+        pkg_xml_rels, parts = _PackageLoader.load(package_reader_, package_)
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", package_)
+        _init_.assert_called_once_with(ANY, package_reader_, package_)
         _load_.assert_called_once_with(ANY)
         assert pkg_xml_rels is pkg_xml_rels_
         assert parts == {"partname": "part"}
@@ -325,7 +452,8 @@ class Describe_PackageLoader:
             )
         )
         _xml_rels_prop_.return_value = rels_
-        package_loader = _PackageLoader(None, None)
+        package_reader_ = instance_mock(request, PackageReader, is_lazy=False)
+        package_loader = _PackageLoader(package_reader_, None)
 
         pkg_xml_rels, parts = package_loader._load()
 
@@ -334,6 +462,32 @@ class Describe_PackageLoader:
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
 
+    def but_it_loads_only_the_package_relationships_when_lazy(
+        self, request, package_, _xml_rels_prop_
+    ):
+        package_reader_ = instance_mock(request, PackageReader, is_lazy=True)
+        content_types_ = instance_mock(request, _ContentTypeMap)
+        property_mock(request, _PackageLoader, "_content_types", return_value=content_types_)
+        pkg_xml_rels_ = element("r:Relationships")
+        _xml_rels_for_ = method_mock(
+            request, _PackageLoader, "_xml_rels_for", return_value=pkg_xml_rels_
+        )
+        parts_ = instance_mock(request, _PartsOnDemand)
+        _PartsOnDemand_ = class_mock(
+            request, "pptx.opc.package._PartsOnDemand", return_value=parts_
+        )
+        package_loader = _PackageLoader(package_reader_, package_)
+
+        pkg_xml_rels, parts = package_loader._load()
+
+        _xml_rels_for_.assert_called_once_with(package_loader, PACKAGE_URI)
+        _PartsOnDemand_.assert_called_once_with(
+            package_reader_, package_, content_types_, package_loader._xml_rels_for
+        )
+        _xml_rels_prop_.assert_not_called()
+        assert pkg_xml_rels is pkg_xml_rels_
+        assert parts is parts_
+
     def it_loads_the_xml_relationships_from_the_package_to_help(self, request):
         pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
         prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
@@ -380,11 +534,90 @@ class Describe_PackageLoader:
     def package_(self, request):
         return instance_mock(request, OpcPackage)
 
+    @pytest.fixture
+    def package_reader_(self, request):
+        return instance_mock(request, PackageReader)
+
     @pytest.fixture
     def _xml_rels_prop_(self, request):
         return property_mock(request, _PackageLoader, "_xml_rels")
 
 
+class Describe_PartsOnDemand:
+    """Unit-test suite for `pptx.opc.package._PartsOnDemand` objects."""
+
+    def it_loads_a_part_on_first_lookup(self, request, package_, package_reader_, part_):
+        partname = PackURI("/ppt/slides/slide1.xml")
+        package_reader_.__contains__.return_value = True
+        PartFactory_ = class_mock(request, "pptx.opc.package.PartFactory", return_value=part_)
+        xml_rels = element("r:Relationships")
+        xml_rels_for_ = Mock(name="xml_rels_for", return_value=xml_rels)
+        parts = _PartsOnDemand(package_reader_, package_, {partname: CT.PML_SLIDE}, xml_rels_for_)
+
+        part = parts[partname]
+
+        PartFactory_.assert_called_once_with(
+            partname, CT.PML_SLIDE, package_, package_reader=package_reader_
+        )
+        load_xml_rels, parts_arg = part_.load_rels_on_demand.call_args.args
+        assert parts_arg is parts
+        xml_rels_for_.assert_not_called()
+        assert load_xml_rels() is xml_rels
+        xml_rels_for_.assert_called_once_with(partname)
+        assert parts[partname] is part is part_
+        assert PartFactory_.call_count == 1
+        assert list(parts) == [partname]
+        assert len(parts) == 1
+
+    @pytest.mark.parametrize(
+        ("partname", "in_reader", "expected_value"),
+        [("/ppt/foo.xml", True, True), ("/ppt/foo.xml", False, False), ("/", True, False)],
+    )
+    def it_knows_which_parts_are_in_the_package(
+        self, package_reader_, partname, in_reader, expected_value
+    ):
+        package_reader_.__contains__.return_value = in_reader
+        parts = _PartsOnDemand(package_reader_, None, {}, None)
+
+        assert (PackURI(partname) in parts) is expected_value
+
+    def but_it_raises_KeyError_for_a_part_not_in_the_package(self, package_reader_):
+        package_reader_.__contains__.return_value = False
+        parts = _PartsOnDemand(package_reader_, None, {}, None)
+
+        with pytest.raises(KeyError):
+            parts[PackURI("/ppt/slides/NULL")]
+
+    def it_loads_only_the_parts_reached_from_a_lazy_package(self, request):
+        path = absjoin(test_file_dir, "test.pptx")
+        eager_partnames = {p.partname for p in OpcPackage.open(path).iter_parts()}
+        PartFactory_ = function_mock(
+            request, "pptx.opc.package.PartFactory", autospec=False, side_effect=PartFactory
+        )
+
+        with OpcPackage.open(path, lazy=True) as package:
+            n_loaded = PartFactory_.call_count
+            partnames = {p.partname for p in package.iter_parts()}
+
+        assert n_loaded < len(eager_partnames)
+        assert partnames == eager_partnames
+        assert PartFactory_.call_count == len(partnames)
+
+    # -- fixtures ----------------------------------------------------
+
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, OpcPackage)
+
+    @pytest.fixture
+    def package_reader_(self, request):
+        return instance_mock(request, PackageReader)
+
+    @pytest.fixture
+    def part_(self, request):
+        return instance_mock(request, Part)
+
+
 class DescribePart:
     """Unit-test suite for `pptx.opc.package.Part` objects."""
 
@@ -400,6 +633,28 @@ class DescribePart:
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
 
+    def it_can_be_loaded_to_read_its_blob_on_demand(self, request, package_):
+        partname = PackURI("/ppt/media/image1.png")
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__getitem__.return_value = b"blob"
+
+        part = Part.load_on_demand(partname, CT.PNG, package_, package_reader_)
+
+        package_reader_.__getitem__.assert_not_called()
+        assert part.unmodified_source == (package_reader_, partname)
+        assert part.blob == b"blob"
+        package_reader_.__getitem__.assert_called_once_with(partname)
+
+    def and_it_stops_reading_on_demand_once_its_blob_is_changed(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        part = Part.load_on_demand(PackURI("/x.bin"), None, None, package_reader_)
+
+        part.blob = b"new-blob"
+
+        assert part.blob == b"new-blob"
+        assert part.unmodified_source is None
+        package_reader_.__getitem__.assert_not_called()
+
     def it_can_change_its_blob(self):
         part = Part(None, None, None, b"old-blob")
         part.blob = b"new-blob"
@@ -419,6 +674,32 @@ class DescribePart:
         part.partname = PackURI("/new/part/name")
         assert part.partname == PackURI("/new/part/name")
 
+    def and_it_tells_its_package_when_it_does(self, package_):
+        part = Part(PackURI("/old/part/name"), None, package_)
+
+        part.partname = PackURI("/new/part/name")
+
+        package_._part_renamed.assert_called_once_with(part, "/old/part/name")
+
+    def but_it_raises_when_its_package_is_read_only(self, package_):
+        package_._raise_if_read_only.side_effect = ReadOnlyPackageError
+        part = Part(PackURI("/old/part/name"), None, package_)
+
+        with pytest.raises(ReadOnlyPackageError):
+            part.partname = PackURI("/new/part/name")
+        with pytest.raises(ReadOnlyPackageError):
+            part.blob = b"foobar"
+
+        assert part.partname == PackURI("/old/part/name")
+        package_._part_renamed.assert_not_called()
+
+    def it_tells_its_package_when_it_is_related_to_another_part(self, request, package_):
+        part_ = instance_mock(request, Part)
+
+        Part(None, None, package_)._part_related(part_)
+
+        package_._part_related.assert_called_once_with(part_)
+
     def it_provides_access_to_its_relationships_for_traversal(self, request, relationships_):
         property_mock(request, Part, "_rels", return_value=relationships_)
         assert Part(None, None, None).rels is relationships_
@@ -462,17 +743,54 @@ class DescribeXmlPart:
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
-        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
         _init_ = initializer_mock(request, XmlPart)
 
         part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
 
-        parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
+        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element=None)
+        parse_xml_.assert_not_called()
         assert isinstance(part, XmlPart)
 
+    def it_parses_its_XML_on_first_access(self, request):
+        element_ = element("p:sld")
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml", return_value=element_)
+        part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"blob")
+
+        assert part._element is element_
+        assert part._element is element_
+        parse_xml_.assert_called_once_with(b"blob")
+
+    def but_it_leaves_its_blob_alone_once_its_XML_is_parsed(self, request):
+        element_ = element("p:sld")
+        part = XmlPart(None, None, None, element_)
+        _blob_ = property_mock(request, XmlPart, "_blob")
+
+        assert part._element is element_
+        assert part._element is element_
+        _blob_.assert_not_called()
+
+    def it_provides_its_XML_as_loaded_until_it_is_parsed(self, request):
+        serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
+        part = XmlPart.load(PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"<p:sld/>")
+
+        assert part.blob == b"<p:sld/>"
+        serialize_part_xml_.assert_not_called()
+
+    def and_it_parses_its_XML_on_first_access_when_loaded_on_demand(self, request):
+        partname = PackURI("/ppt/slides/slide1.xml")
+        blob = b"<p:sld %s/>" % nsdecls("p").encode()
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__getitem__.return_value = blob
+
+        part = XmlPart.load_on_demand(partname, CT.PML_SLIDE, None, package_reader_)
+
+        package_reader_.__getitem__.assert_not_called()
+        assert part.blob == blob
+        assert part._element.tag == qn("p:sld")
+        assert part.unmodified_source is None
+
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
         serialize_part_xml_ = function_mock(request, "pptx.opc.package.serialize_part_xml")
@@ -489,12 +807,24 @@ class DescribeXmlPart:
     ):
         _rel_ref_count_ = method_mock(request, XmlPart, "_rel_ref_count", return_value=ref_count)
         property_mock(request, XmlPart, "_rels", return_value=relationships_)
-        part = XmlPart(None, None, None, None)
+        package_ = instance_mock(request, OpcPackage)
+        part = XmlPart(None, None, package_, None)
 
         part.drop_rel("rId42")
 
         _rel_ref_count_.assert_called_once_with(part, "rId42")
         assert relationships_.pop.call_args_list == calls
+        assert package_._parts_dropped.call_count == len(calls)
+
+    def it_knows_its_unmodified_source_until_its_XML_is_handed_out(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__getitem__.return_value = b"<p:sld %s/>" % nsdecls("p").encode()
+        partname = PackURI("/ppt/slides/slide1.xml")
+        xml_part = XmlPart.load_on_demand(partname, CT.PML_SLIDE, None, package_reader_)
+
+        assert xml_part.unmodified_source == (package_reader_, partname)
+        xml_part._element
+        assert xml_part.unmodified_source is None
 
     def it_knows_it_is_the_part_for_its_child_objects(self):
         xml_part = XmlPart(None, None, None, None)
@@ -510,11 +840,13 @@ class DescribeXmlPart:
 class DescribePartFactory:
     """Unit-test suite for `pptx.opc.package.PartFactory` objects."""
 
-    def it_constructs_custom_part_type_for_registered_content_types(self, request, package_, part_):
+    def it_constructs_custom_part_type_for_registered_content_types(
+        self, request, package_, part_, monkeypatch
+    ):
         SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
         SlidePart_.load.return_value = part_
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
+        monkeypatch.setitem(PartFactory.part_type_for, CT.PML_SLIDE, SlidePart_)
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -533,6 +865,22 @@ class DescribePartFactory:
         Part_.load.assert_called_once_with(partname, CT.OFC_VML_DRAWING, package_, b"blob")
         assert part is part_
 
+    def it_constructs_a_part_that_reads_on_demand_when_given_a_package_reader(
+        self, request, package_, part_
+    ):
+        Part_ = class_mock(request, "pptx.opc.package.Part")
+        Part_.load_on_demand.return_value = part_
+        package_reader_ = instance_mock(request, PackageReader)
+        partname = PackURI("/ppt/drawings/vmlDrawing1.vml")
+
+        part = PartFactory(partname, CT.OFC_VML_DRAWING, package_, package_reader=package_reader_)
+
+        Part_.load_on_demand.assert_called_once_with(
+            partname, CT.OFC_VML_DRAWING, package_, package_reader_
+        )
+        Part_.load.assert_not_called()
+        assert part is part_
+
     # fixtures components ----------------------------------
 
     @pytest.fixture
@@ -614,6 +962,60 @@ class Describe_ContentTypeMap:
         return _ContentTypeMap.from_xml(testfile_bytes("expanded_pptx", "[Content_Types].xml"))
 
 
+class Describe_PartnameIndex:
+    """Unit-test suite for `pptx.opc.package._PartnameIndex` objects."""
+
+    def it_groups_partnames_by_stem(self, request):
+        index = _PartnameIndex(
+            instance_mock(request, Part, partname=PackURI(partname))
+            for partname in ("/ppt/slides/slide1.xml", "/ppt/slides/slide12.xml", "/ppt/pres.xml")
+        )
+
+        assert index.partnames_with_stem("/ppt/slides/slide") == {
+            "/ppt/slides/slide1.xml",
+            "/ppt/slides/slide12.xml",
+        }
+        assert index.partnames_with_stem("/ppt/pres") == {"/ppt/pres.xml"}
+        assert index.partnames_with_stem("/ppt/notesSlides/notesSlide") == set()
+
+    @pytest.mark.parametrize(
+        ("partnames", "expected_value"),
+        [
+            ((), 1),
+            (("/ppt/media/image1.png",), 2),
+            (("/ppt/media/image1.png", "/ppt/media/image2.jpeg"), 3),
+            (("/ppt/media/image1.png", "/ppt/media/image3.png"), 2),
+            (("/ppt/media/image2.png", "/ppt/media/media1.mp4"), 1),
+        ],
+    )
+    def it_finds_the_first_available_idx_for_a_stem(
+        self, request, partnames: tuple[str, ...], expected_value: int
+    ):
+        index = _PartnameIndex(
+            instance_mock(request, Part, partname=PackURI(partname)) for partname in partnames
+        )
+        assert index.first_available_idx("/ppt/media/image") == expected_value
+
+    def it_can_re_index_a_renamed_part(self, request):
+        part_ = instance_mock(request, Part, partname=PackURI("/ppt/media/image1.png"))
+        index = _PartnameIndex([part_])
+        assert index.first_available_idx("/ppt/media/image") == 2
+
+        part_.partname = PackURI("/ppt/media/image7.png")
+        index.rename(part_, PackURI("/ppt/media/image1.png"))
+
+        assert index.partnames_with_stem("/ppt/media/image") == {"/ppt/media/image7.png"}
+        assert index.first_available_idx("/ppt/media/image") == 1
+
+    def but_it_ignores_a_part_it_does_not_index(self, request):
+        part_ = instance_mock(request, Part, partname=PackURI("/ppt/media/image7.png"))
+        index = _PartnameIndex()
+
+        index.rename(part_, PackURI("/ppt/media/image1.png"))
+
+        assert index.partnames_with_stem("/ppt/media/image") == set()
+
+
 class Describe_Relationships:
     """Unit-test suite for `pptx.opc.package._Relationships` objects."""
 
@@ -711,6 +1113,33 @@ class Describe_Relationships:
         ]
         assert relationships._rels == {"rId1": rels_[0], "rId2": rels_[1]}
 
+    def it_can_load_from_xml_on_demand(self, part_):
+        parts = {"/ppt/slideLayouts/slideLayout1.xml": part_}
+        xml_rels = parse_xml(snippet_bytes("rels-load-from-xml"))
+        load_xml_rels_ = Mock(name="load_xml_rels", return_value=xml_rels)
+        relationships = _Relationships("/ppt/slides")
+        relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://foo")
+
+        relationships.load_from_xml_on_demand("/ppt/slides", load_xml_rels_, parts)
+
+        load_xml_rels_.assert_not_called()
+        assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_
+        assert relationships._get_matching(RT.HYPERLINK, "http://foo", is_external=True) is None
+        assert list(relationships) == ["rId1", "rId2"]
+        load_xml_rels_.assert_called_once_with()
+
+    def and_it_rebuilds_its_indexes_from_the_loaded_relationships(self, request, part_):
+        relationships = _Relationships("/ppt/slides")
+        relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://foo")
+        parts = {"/ppt/slideLayouts/slideLayout1.xml": part_}
+        xml_rels = parse_xml(snippet_bytes("rels-load-from-xml"))
+
+        relationships.load_from_xml("/ppt/slides", xml_rels, parts)
+
+        assert relationships._get_matching(RT.HYPERLINK, "http://foo", is_external=True) is None
+        assert relationships._get_matching(RT.HYPERLINK, "http://url", is_external=True) == "rId2"
+        assert relationships._get_matching(RT.SLIDE_LAYOUT, part_) == "rId1"
+
     def it_can_find_a_part_with_reltype(self, _rels_by_reltype_prop_, relationship_, part_):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
@@ -757,6 +1186,36 @@ class Describe_Relationships:
 
         assert relationships._rels == {}
 
+    def it_keeps_its_indexes_current_as_relationships_come_and_go(self, request):
+        part_ = instance_mock(request, Part)
+        relationships = _Relationships("/ppt/slides")
+        assert relationships.get_or_add(RT.SLIDE_LAYOUT, part_) == "rId1"
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == "rId2"
+
+        assert relationships.get_or_add(RT.SLIDE_LAYOUT, part_) == "rId1"
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == "rId2"
+        assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_
+
+        relationships.pop("rId2")
+
+        assert relationships._get_matching(RT.HYPERLINK, "http://url", is_external=True) is None
+        assert relationships._rels_by_reltype[RT.HYPERLINK] == []
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == "rId2"
+
+    def and_it_falls_back_to_a_duplicate_relationship_when_the_first_is_removed(self, request):
+        part_ = instance_mock(request, Part)
+        rels = {
+            rId: _Relationship("/ppt/slides", rId, RT.IMAGE, RTM.INTERNAL, part_)
+            for rId in ("rId1", "rId2")
+        }
+        relationships = _Relationships("/ppt/slides")
+        relationships._rels.update(rels)
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId1"
+
+        relationships.pop("rId1")
+
+        assert relationships._get_matching(RT.IMAGE, part_) == "rId2"
+
     def it_can_serialize_itself_to_XML(self, request, _rels_prop_):
         _rels_prop_.return_value = {
             "rId11": instance_mock(
@@ -837,26 +1296,25 @@ class Describe_Relationships:
         ),
     )
     def it_can_get_a_matching_relationship_to_help(
-        self, request, _rels_by_reltype_prop_, target_ref, is_external, expected_value
+        self, request, _rels_prop_, target_ref, is_external, expected_value
     ):
         part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
-        _rels_by_reltype_prop_.return_value = {
-            RT.SLIDE: [
-                instance_mock(
-                    request,
-                    _Relationship,
-                    rId=rId,
-                    target_part=target_part,
-                    target_ref=ref,
-                    is_external=external,
-                )
-                for rId, target_part, ref, external in (
-                    ("rId1", None, "http://url", True),
-                    ("rId2", part_1, "/ppt/foo.bar", False),
-                    ("rId3", None, "http://foo", True),
-                    ("rId4", part_2, "/ppt/bar.foo", False),
-                )
-            ]
+        _rels_prop_.return_value = {
+            rId: instance_mock(
+                request,
+                _Relationship,
+                rId=rId,
+                reltype=RT.SLIDE,
+                target_part=target_part,
+                target_ref=ref,
+                is_external=external,
+            )
+            for rId, target_part, ref, external in (
+                ("rId1", None, "http://url", True),
+                ("rId2", part_1, "/ppt/foo.bar", False),
+                ("rId3", None, "http://foo", True),
+                ("rId4", part_2, "/ppt/bar.foo", False),
+            )
         }
         target = target_ref if is_external else part_1 if target_ref == "part_1" else part_2
         relationships = _Relationships(None)
@@ -865,8 +1323,8 @@ class Describe_Relationships:
 
         assert matching == expected_value
 
-    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+    def but_it_returns_None_when_there_is_no_matching_relationship(self, _rels_prop_):
+        _rels_prop_.return_value = {}
         relationships = _Relationships(None)
 
         assert relationships._get_matching(RT.HYPERLINK, "http://url", True) is None
@@ -6,7 +6,12 @@ from __future__ import annotations
 
 import hashlib
 import io
+import mmap
+import os
+import pathlib
+import shutil
 import zipfile
+import zlib
 
 import pytest
 
@@ -15,10 +20,15 @@ from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import Part, _Relationships
 from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
+    _ZIPFILE_WRITE_INTERNALS,
+    CompressionPolicy,
     PackageReader,
     PackageWriter,
+    _BufferStream,
     _ContentTypesItem,
     _DirPkgReader,
+    _DirPkgWriter,
+    _LazyZipPkgReader,
     _PhysPkgReader,
     _PhysPkgWriter,
     _ZipPkgReader,
@@ -44,6 +54,61 @@ dir_pkg_path = absjoin(test_file_dir, "expanded_pptx")
 zip_pkg_path = test_pptx_path
 
 
+class DescribeCompressionPolicy:
+    """Unit-test suite for `pptx.opc.serialized.CompressionPolicy` objects."""
+
+    @pytest.mark.parametrize(
+        ("levels", "content_type", "expected_value"),
+        [
+            (None, CT.PNG, (zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION)),
+            (None, None, (zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION)),
+            ({CT.PNG: None}, CT.PNG, (zipfile.ZIP_STORED, None)),
+            ({CT.PML_SLIDE: 9}, CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, 9)),
+            ({"video/*": None}, "video/mp4", (zipfile.ZIP_STORED, None)),
+            ({"video/*": None, "video/x-ms-wmv": 1}, "video/x-ms-wmv", (zipfile.ZIP_DEFLATED, 1)),
+            ({"video/*": None}, "audio/mpeg", (zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION)),
+        ],
+    )
+    def it_determines_the_compression_for_a_content_type(
+        self,
+        levels: dict[str, int | None] | None,
+        content_type: str | None,
+        expected_value: tuple[int, int | None],
+    ):
+        assert CompressionPolicy(levels).compression_for(content_type) == expected_value
+
+    def it_stores_everything_when_store_only(self):
+        policy = CompressionPolicy({CT.PML_SLIDE: 9}, store_only=True)
+
+        assert policy.compression_for(CT.PML_SLIDE) == (zipfile.ZIP_STORED, None)
+        assert policy.compression_for(None) == (zipfile.ZIP_STORED, None)
+
+    def it_can_construct_a_policy_that_stores_compressed_media(self):
+        policy = CompressionPolicy.store_compressed_media({CT.PNG: 6}, default_level=1)
+
+        assert policy.compression_for(CT.JPEG) == (zipfile.ZIP_STORED, None)
+        assert policy.compression_for("video/mp4") == (zipfile.ZIP_STORED, None)
+        assert policy.compression_for(CT.PNG) == (zipfile.ZIP_DEFLATED, 6)
+        assert policy.compression_for(CT.PML_SLIDE) == (zipfile.ZIP_DEFLATED, 1)
+
+    @pytest.mark.parametrize(
+        ("store_only", "compress_type", "expected_value"),
+        [
+            (False, zipfile.ZIP_DEFLATED, True),
+            (False, zipfile.ZIP_STORED, True),
+            (True, zipfile.ZIP_STORED, True),
+            (True, zipfile.ZIP_DEFLATED, False),
+        ],
+    )
+    def it_knows_whether_a_compressed_member_can_be_copied_as_is(
+        self, store_only: bool, compress_type: int, expected_value: bool
+    ):
+        info = zipfile.ZipInfo("ppt/media/image1.png")
+        info.compress_type = compress_type
+
+        assert CompressionPolicy(store_only=store_only).keeps(info) is expected_value
+
+
 class DescribePackageReader:
     """Unit-test suite for `pptx.opc.serialized.PackageReader` objects."""
 
@@ -80,9 +145,23 @@ class DescribePackageReader:
 
         blob_reader = package_reader._blob_reader
 
-        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgReader_.factory.assert_called_once_with("prs.pptx", False)
         assert blob_reader is phys_pkg_reader_
 
+    def it_can_close_its_blob_reader(self, request: FixtureRequest, _blob_reader_prop_: Mock):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        _blob_reader_prop_.return_value = phys_pkg_reader_
+        package_reader = PackageReader("prs.pptx", lazy=True)
+        package_reader.__dict__["_blob_reader"] = phys_pkg_reader_
+
+        package_reader.close()
+
+        phys_pkg_reader_.close.assert_called_once_with()
+
+    def but_it_does_not_open_the_package_just_to_close_it(self, _blob_reader_prop_: Mock):
+        PackageReader("prs.pptx", lazy=True).close()
+        _blob_reader_prop_.assert_not_called()
+
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -101,7 +180,7 @@ class DescribePackageWriter:
 
         PackageWriter.write("prs.pptx", relationships_, (part_, part_))
 
-        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_))
+        _init_.assert_called_once_with(ANY, "prs.pptx", relationships_, (part_, part_), None, None)
         _write_.assert_called_once_with(ANY)
 
     def it_can_write_a_package(
@@ -119,7 +198,7 @@ class DescribePackageWriter:
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", None)
         _write_content_types_stream_.assert_called_once_with(package_writer, phys_writer_)
         _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
         _write_parts_.assert_called_once_with(package_writer, phys_writer_)
@@ -149,7 +228,9 @@ class DescribePackageWriter:
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
                 blob="blob_%s" % x,
+                content_type="ct_%s" % x,
                 rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
+                unmodified_source=None,
             )
             for x in ("a", "b", "c")
         ]
@@ -158,14 +239,96 @@ class DescribePackageWriter:
         package_writer._write_parts(phys_writer_)
 
         assert phys_writer_.write.call_args_list == [
-            call("/ppt/a.xml", "blob_a"),
+            call("/ppt/a.xml", "blob_a", "ct_a"),
             call("/ppt/_rels/a.xml.rels", "rels_xml_a"),
-            call("/ppt/b.xml", "blob_b"),
+            call("/ppt/b.xml", "blob_b", "ct_b"),
             call("/ppt/_rels/b.xml.rels", "rels_xml_b"),
-            call("/ppt/c.xml", "blob_c"),
+            call("/ppt/c.xml", "blob_c", "ct_c"),
             call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
         ]
 
+    def but_it_copies_an_unchanged_part_from_its_source_package_still_compressed(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.compressed_member.return_value = ("zip-info", b"compressed")
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/image2.png"),
+            unmodified_source=(package_reader_, PackURI("/ppt/media/image1.png")),
+        )
+        part_._rels = {}
+        package_writer = PackageWriter("", relationships_, [part_])
+
+        package_writer._write_parts(phys_writer_)
+
+        package_reader_.compressed_member.assert_called_once_with("/ppt/media/image1.png")
+        phys_writer_.write_compressed.assert_called_once_with(
+            "/ppt/media/image2.png", "zip-info", b"compressed"
+        )
+        phys_writer_.write.assert_not_called()
+
+    def but_not_when_the_compression_policy_calls_for_it_to_be_stored(
+        self, request: FixtureRequest, relationships_: Mock, phys_writer_: Mock
+    ):
+        info = zipfile.ZipInfo("ppt/media/image1.png")
+        info.compress_type = zipfile.ZIP_DEFLATED
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.compressed_member.return_value = (info, b"compressed")
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/image1.png"),
+            content_type=CT.PNG,
+            blob=b"png-bytes",
+            unmodified_source=(package_reader_, PackURI("/ppt/media/image1.png")),
+        )
+        part_._rels = {}
+        policy = CompressionPolicy(store_only=True)
+        package_writer = PackageWriter("", relationships_, [part_], compression=policy)
+
+        package_writer._write_parts(phys_writer_)
+
+        phys_writer_.write.assert_called_once_with("/ppt/media/image1.png", b"png-bytes", CT.PNG)
+        phys_writer_.write_compressed.assert_not_called()
+
+    def it_can_write_parts_using_a_pool_of_worker_threads(
+        self, request: FixtureRequest, relationships_: Mock
+    ):
+        parts_ = [
+            instance_mock(
+                request,
+                Part,
+                partname=PackURI("/ppt/slides/slide%d.xml" % n),
+                blob=b"<p:sld>%d</p:sld>" % n,
+                rels=instance_mock(request, _Relationships, xml=b"rels-xml-%d" % n),
+                unmodified_source=None,
+            )
+            for n in range(1, 21)
+        ]
+        for n, part_ in enumerate(parts_):
+            part_._rels = {"rId1": None} if n % 2 else {}
+        stream = io.BytesIO()
+        package_writer = PackageWriter(stream, relationships_, parts_, workers=4)
+
+        with _ZipPkgWriter(stream) as phys_writer:
+            package_writer._write_parts(phys_writer)
+
+        with zipfile.ZipFile(stream) as z:
+            assert z.testzip() is None
+            expected_names = [
+                name
+                for n in range(1, 21)
+                for name in (
+                    ["ppt/slides/slide%d.xml" % n]
+                    + (["ppt/slides/_rels/slide%d.xml.rels" % n] if (n - 1) % 2 else [])
+                )
+            ]
+            assert z.namelist() == expected_names
+            assert z.read("ppt/slides/slide7.xml") == b"<p:sld>7</p:sld>"
+            assert z.read("ppt/slides/_rels/slide8.xml.rels") == b"rels-xml-8"
+
     def it_can_write_a_pkg_rels_item(self, phys_writer_: Mock, relationships_: Mock):
         relationships_.xml = b"pkg-rels-xml"
         package_writer = PackageWriter("", relationships_, [])
@@ -225,6 +388,41 @@ class Describe_PhysPkgReader:
         _ZipPkgReader_.assert_called_once_with(pkg_file_path)
         assert phys_reader is zip_pkg_reader_
 
+    @pytest.mark.parametrize("pkg_file", [test_pptx_path, io.BytesIO(b"pkg-bytes")])
+    def and_it_constructs_LazyZipPkgReader_when_lazy_is_requested(
+        self, request: FixtureRequest, pkg_file: str | io.BytesIO
+    ):
+        lazy_zip_pkg_reader_ = instance_mock(request, _LazyZipPkgReader)
+        _LazyZipPkgReader_ = class_mock(
+            request, "pptx.opc.serialized._LazyZipPkgReader", return_value=lazy_zip_pkg_reader_
+        )
+
+        phys_reader = _PhysPkgReader.factory(pkg_file, lazy=True)
+
+        _LazyZipPkgReader_.assert_called_once_with(pkg_file)
+        assert phys_reader is lazy_zip_pkg_reader_
+
+    @pytest.mark.parametrize("pkg_type", [bytes, bytearray, memoryview])
+    def and_it_reads_package_bytes_in_place(self, pkg_type: type):
+        with open(test_pptx_path, "rb") as f:
+            pkg_file = pkg_type(f.read())
+
+        phys_reader = _PhysPkgReader.factory(pkg_file)
+
+        assert isinstance(phys_reader, _ZipPkgReader)
+        assert PackURI("/ppt/presentation.xml") in phys_reader
+
+    def and_it_reads_a_memory_mapped_package_in_place_when_lazy(self):
+        with open(test_pptx_path, "rb") as f:
+            pkg_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        phys_reader = _PhysPkgReader.factory(pkg_file, lazy=True)
+
+        assert isinstance(phys_reader, _LazyZipPkgReader)
+        assert PackURI("/ppt/presentation.xml") in phys_reader
+        phys_reader.close()
+        pkg_file.close()
+
     def but_it_raises_when_pkg_path_is_not_a_package(self):
         with pytest.raises(PackageNotFoundError) as e:
             _PhysPkgReader.factory("foobar")
@@ -297,10 +495,157 @@ class Describe_ZipPkgReader:
         return _ZipPkgReader(zip_pkg_path)
 
 
+class Describe_LazyZipPkgReader:
+    """Unit-test suite for `pptx.opc.serialized._LazyZipPkgReader` objects."""
+
+    def it_knows_whether_it_contains_a_partname(self, zip_pkg_reader: _LazyZipPkgReader):
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        assert PackURI("/ppt/foobar.xml") not in zip_pkg_reader
+
+    def it_can_get_a_blob_by_partname(self, zip_pkg_reader: _LazyZipPkgReader):
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        assert hashlib.sha1(blob).hexdigest() == ("efa7bee0ac72464903a67a6744c1169035d52a54")
+
+    def but_it_raises_KeyError_when_requested_member_is_not_present(
+        self, zip_pkg_reader: _LazyZipPkgReader
+    ):
+        with pytest.raises(KeyError) as e:
+            zip_pkg_reader[PackURI("/ppt/foobar.xml")]
+        assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
+
+    def it_only_inflates_a_member_when_it_is_requested(
+        self, request: FixtureRequest, zip_pkg_reader: _LazyZipPkgReader
+    ):
+        _read_member_ = method_mock(
+            request, _LazyZipPkgReader, "_read_member", return_value=b"blob"
+        )
+
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        _read_member_.assert_not_called()
+        assert zip_pkg_reader[PackURI("/ppt/presentation.xml")] == b"blob"
+        assert zip_pkg_reader[PackURI("/ppt/presentation.xml")] == b"blob"
+        assert _read_member_.call_count == 1
+
+    @pytest.mark.parametrize("source", ["bytes", "stream"])
+    def it_reads_the_same_blobs_from_bytes_or_a_stream(self, source: str):
+        with open(zip_pkg_path, "rb") as f:
+            pkg_bytes = f.read()
+        pkg_file = memoryview(pkg_bytes) if source == "bytes" else io.BytesIO(pkg_bytes)
+        zip_pkg_reader = _LazyZipPkgReader(pkg_file)
+
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        assert hashlib.sha1(blob).hexdigest() == ("efa7bee0ac72464903a67a6744c1169035d52a54")
+        zip_pkg_reader.close()
+
+    def it_reads_a_package_at_a_path_through_a_file_handle(self, tmp_path):
+        pkg_path = str(tmp_path / "prs.pptx")
+        shutil.copyfile(zip_pkg_path, pkg_path)
+        zip_pkg_reader = _LazyZipPkgReader(pkg_path)
+        assert zip_pkg_reader._buffer is None
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+
+        # -- truncating the file while it is open must not crash the interpreter --
+        with open(pkg_path, "wb"):
+            pass
+
+        with pytest.raises(zipfile.BadZipFile):
+            zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        with pytest.raises(zipfile.BadZipFile):
+            zip_pkg_reader.compressed_member(PackURI("/ppt/presentation.xml"))
+        zip_pkg_reader.close()
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def it_slices_a_member_straight_from_the_package_bytes(self, compression: int):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w", compression=compression) as z:
+            z.writestr("ppt/media/image1.png", b"0123456789" * 100)
+        zip_pkg_reader = _LazyZipPkgReader(memoryview(stream.getvalue()))
+        info = zip_pkg_reader._members[PackURI("/ppt/media/image1.png")]
+
+        assert zip_pkg_reader._read_member(info) == b"0123456789" * 100
+
+    def but_it_raises_on_a_corrupted_member(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as z:
+            z.writestr("ppt/media/image1.png", b"0123456789")
+        pkg_bytes = stream.getvalue().replace(b"0123456789", b"0123456780")
+        zip_pkg_reader = _LazyZipPkgReader(memoryview(pkg_bytes))
+
+        with pytest.raises(zipfile.BadZipFile):
+            zip_pkg_reader[PackURI("/ppt/media/image1.png")]
+
+    def it_evicts_least_recently_read_blobs_to_stay_within_its_cache_size(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, "w") as z:
+            for name, size in (("a", 6), ("b", 6), ("c", 6), ("d", 20)):
+                z.writestr(name, b"x" * size)
+        zip_pkg_reader = _LazyZipPkgReader(stream, cache_size=12)
+
+        for name in ("a", "b", "a", "c", "d"):
+            zip_pkg_reader[PackURI("/%s" % name)]
+
+        assert list(zip_pkg_reader._cache) == ["/a", "/c"]
+        assert zip_pkg_reader._cached_bytes == 12
+
+    @pytest.mark.parametrize("source", ["path", "stream"])
+    def it_provides_the_compressed_bytes_of_a_member(self, source: str):
+        with open(zip_pkg_path, "rb") as f:
+            pkg_stream = io.BytesIO(f.read())
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path if source == "path" else pkg_stream)
+
+        info, data = zip_pkg_reader.compressed_member(PackURI("/ppt/presentation.xml"))
+
+        assert info.filename == "ppt/presentation.xml"
+        assert len(data) == info.compress_size
+        assert zlib.decompress(data, -15) == zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        zip_pkg_reader.close()
+
+    def it_closes_the_zip_archive_on_close(self, zip_pkg_reader: _LazyZipPkgReader):
+        zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+        zipf = zip_pkg_reader._zipf
+
+        zip_pkg_reader.close()
+
+        assert zipf.fp is None
+        assert len(zip_pkg_reader._cache) == 0
+
+    # --- fixture components -------------------------------
+
+    @pytest.fixture
+    def zip_pkg_reader(self):
+        zip_pkg_reader = _LazyZipPkgReader(zip_pkg_path)
+        yield zip_pkg_reader
+        zip_pkg_reader.close()
+
+
+class Describe_BufferStream:
+    """Unit-test suite for `pptx.opc.serialized._BufferStream` objects."""
+
+    def it_reads_from_the_buffer_it_wraps(self):
+        stream = _BufferStream(memoryview(b"0123456789"))
+
+        assert stream.read(4) == b"0123"
+        assert stream.tell() == 4
+        assert stream.read() == b"456789"
+        assert stream.read(4) == b""
+
+    @pytest.mark.parametrize(
+        ("offset", "whence", "expected_pos"),
+        [(3, io.SEEK_SET, 3), (2, io.SEEK_CUR, 7), (-4, io.SEEK_END, 6), (-20, io.SEEK_END, 0)],
+    )
+    def it_can_seek(self, offset: int, whence: int, expected_pos: int):
+        stream = _BufferStream(memoryview(b"0123456789"))
+        stream.seek(5)
+
+        assert stream.seek(offset, whence) == expected_pos
+        assert stream.tell() == expected_pos
+
+
 class Describe_PhysPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
-    def it_constructs_ZipPkgWriter_unconditionally(self, request: FixtureRequest):
+    def it_constructs_ZipPkgWriter_for_a_zip_file(self, request: FixtureRequest):
         zip_pkg_writer_ = instance_mock(request, _ZipPkgWriter)
         _ZipPkgWriter_ = class_mock(
             request, "pptx.opc.serialized._ZipPkgWriter", return_value=zip_pkg_writer_
@@ -308,9 +653,56 @@ class Describe_PhysPkgWriter:
 
         phys_writer = _PhysPkgWriter.factory("prs.pptx")
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        _ZipPkgWriter_.assert_called_once_with("prs.pptx", None)
         assert phys_writer is zip_pkg_writer_
 
+    def but_it_constructs_a_DirPkgWriter_for_a_directory(self, tmp_path: pathlib.Path):
+        phys_writer = _PhysPkgWriter.factory(str(tmp_path))
+
+        assert isinstance(phys_writer, _DirPkgWriter)
+        assert phys_writer._path == str(tmp_path)
+
+
+class Describe_DirPkgWriter:
+    """Unit-test suite for `pptx.opc.serialized._DirPkgWriter` objects."""
+
+    def it_writes_a_blob_to_a_file_below_its_directory(self, tmp_path: pathlib.Path):
+        with _DirPkgWriter(str(tmp_path)) as pkg_writer:
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>")
+
+        assert (tmp_path / "ppt" / "slides" / "slide1.xml").read_bytes() == b"<p:sld/>"
+
+    def but_it_leaves_a_file_alone_when_it_already_holds_the_blob(self, tmp_path: pathlib.Path):
+        path = tmp_path / "ppt" / "slides" / "slide1.xml"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"<p:sld/>")
+        os.utime(path, (0, 0))
+        pkg_writer = _DirPkgWriter(str(tmp_path))
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>")
+        assert path.stat().st_mtime == 0
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sldX/>")
+        assert path.read_bytes() == b"<p:sldX/>"
+
+    @pytest.mark.parametrize("compress_type", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def it_inflates_an_already_compressed_member_to_write_it(
+        self, tmp_path: pathlib.Path, compress_type: int
+    ):
+        blob = b"0123456789" * 100
+        info = zipfile.ZipInfo("ppt/media/image1.png")
+        info.compress_type = compress_type
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        data = (
+            blob
+            if compress_type == zipfile.ZIP_STORED
+            else compressor.compress(blob) + compressor.flush()
+        )
+
+        _DirPkgWriter(str(tmp_path)).write_compressed(PackURI("/ppt/media/image1.png"), info, data)
+
+        assert (tmp_path / "ppt" / "media" / "image1.png").read_bytes() == blob
+
 
 class Describe_ZipPkgWriter:
     """Unit-test suite for `pptx.opc.serialized._ZipPkgWriter` objects."""
@@ -335,6 +727,88 @@ class Describe_ZipPkgWriter:
         assert len(members) == 1
         assert members[pack_uri] == b"blob"
 
+    def it_compresses_each_blob_as_its_compression_policy_determines(self, _zipf_prop_: Mock):
+        _zipf_prop_.return_value = zipf = zipfile.ZipFile(io.BytesIO(), "w")
+        pkg_writer = _ZipPkgWriter("", CompressionPolicy({CT.PNG: None}))
+
+        pkg_writer.write(PackURI("/ppt/media/image1.png"), b"png" * 100, CT.PNG)
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>" * 100, CT.PML_SLIDE)
+
+        assert zipf.getinfo("ppt/media/image1.png").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("ppt/slides/slide1.xml").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.read("ppt/media/image1.png") == b"png" * 100
+
+    @pytest.mark.parametrize("seekable", [True, False])
+    def it_can_write_an_already_compressed_member(self, seekable: bool):
+        src = io.BytesIO()
+        with zipfile.ZipFile(src, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("ppt/media/image1.png", b"0123456789" * 100)
+        src_reader = _LazyZipPkgReader(memoryview(src.getvalue()))
+        info, data = src_reader.compressed_member(PackURI("/ppt/media/image1.png"))
+        stream = io.BytesIO()
+        target = stream if seekable else _UnseekableStream(stream)
+        pkg_writer = _ZipPkgWriter(target)  # pyright: ignore[reportArgumentType]
+
+        with pkg_writer:
+            pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"<p:sld/>")
+            pkg_writer.write_compressed(PackURI("/ppt/media/image3.png"), info, data)
+
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as z:
+            assert z.testzip() is None
+            assert z.namelist() == ["ppt/slides/slide1.xml", "ppt/media/image3.png"]
+            assert z.read("ppt/media/image3.png") == b"0123456789" * 100
+            assert z.getinfo("ppt/media/image3.png").compress_type == zipfile.ZIP_DEFLATED
+
+    def and_it_inflates_and_rewrites_the_member_when_zipfile_lacks_what_that_needs(
+        self, request: FixtureRequest
+    ):
+        blob = b"0123456789" * 100
+        info, data = _ZipPkgWriter("").compress(PackURI("/ppt/media/image1.png"), blob)
+        property_mock(request, _ZipPkgWriter, "_copies_compressed", return_value=False)
+        stream = io.BytesIO()
+        pkg_writer = _ZipPkgWriter(stream)
+
+        with pkg_writer:
+            pkg_writer.write_compressed(PackURI("/ppt/media/image1.png"), info, data)
+
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as z:
+            assert z.testzip() is None
+            assert z.read("ppt/media/image1.png") == blob
+            assert z.getinfo("ppt/media/image1.png").compress_type == zipfile.ZIP_DEFLATED
+
+    def it_finds_the_zipfile_internals_it_copies_compressed_members_with(self):
+        """Fails when a Python upgrade changes the private `zipfile` members relied on."""
+        zipf = zipfile.ZipFile(io.BytesIO(), "w")
+
+        missing = [name for name in _ZIPFILE_WRITE_INTERNALS if not hasattr(zipf, name)]
+
+        assert missing == []
+        assert hasattr(zipfile.ZipInfo, "FileHeader")
+        assert _ZipPkgWriter(io.BytesIO())._copies_compressed is True
+
+    def it_can_compress_a_blob_ahead_of_writing_it(self):
+        blob = b"0123456789" * 100
+
+        info, data = _ZipPkgWriter("").compress(PackURI("/ppt/slides/slide1.xml"), blob)
+
+        assert info.filename == "ppt/slides/slide1.xml"
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.file_size == len(blob)
+        assert info.compress_size == len(data)
+        assert zlib.crc32(blob) == info.CRC
+        assert zlib.decompress(data, -15) == blob
+
+    def and_it_leaves_the_blob_uncompressed_when_the_policy_stores_it(self):
+        blob = b"0123456789" * 100
+        pkg_writer = _ZipPkgWriter("", CompressionPolicy(store_only=True))
+
+        info, data = pkg_writer.compress(PackURI("/ppt/media/image1.png"), blob, CT.PNG)
+
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert info.file_size == info.compress_size == len(blob)
+        assert zlib.crc32(blob) == info.CRC
+        assert data == blob
+
     def it_provides_access_to_the_open_zip_file_to_help(self, request: FixtureRequest):
         ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
         pkg_writer = _ZipPkgWriter("prs.pptx")
@@ -408,3 +882,16 @@ class Describe_ContentTypesItem:
     @pytest.fixture
     def part_(self, request: FixtureRequest):
         return instance_mock(request, Part)
+
+
+class _UnseekableStream(io.RawIOBase):
+    """Write-only stream that cannot seek, like a socket or HTTP response body."""
+
+    def __init__(self, stream: io.BytesIO):
+        self._stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes) -> int:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._stream.write(b)
@@ -10,7 +10,14 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 
 from ...unitutil.cxml import element, xml
-from ...unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
+from ...unitutil.mock import (
+    call,
+    class_mock,
+    function_mock,
+    instance_mock,
+    method_mock,
+    property_mock,
+)
 
 
 class DescribeCT_GroupShape(object):
@@ -27,6 +34,69 @@ class DescribeCT_GroupShape(object):
         insert_element_before_.assert_called_once_with(spTree, graphicFrame_, "p:extLst")
         assert graphicFrame is graphicFrame_
 
+    def it_can_append_many_shape_elements_at_once(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:sp,p:extLst)")
+        shape_elms = [element("p:pic"), element("p:cxnSp")]
+
+        spTree.append_shape_elms(shape_elms)
+
+        assert spTree.xml == xml("p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:sp,p:pic,p:cxnSp,p:extLst)")
+
+    def and_it_appends_them_at_the_end_when_there_is_no_extLst(self):
+        spTree = element("p:spTree/(p:nvGrpSpPr,p:grpSpPr)")
+
+        spTree.append_shape_elms([element("p:sp"), element("p:grpSp")])
+
+        assert spTree.xml == xml("p:spTree/(p:nvGrpSpPr,p:grpSpPr,p:sp,p:grpSp)")
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda spTree, sp: spTree.append(element("p:pic")),
+            lambda spTree, sp: spTree.extend([element("p:pic")]),
+            lambda spTree, sp: spTree.insert(0, element("p:pic")),
+            lambda spTree, sp: spTree.insert_element_before(element("p:pic"), "p:extLst"),
+            lambda spTree, sp: spTree.remove(sp),
+            lambda spTree, sp: spTree.replace(sp, element("p:pic")),
+            lambda spTree, sp: spTree.clear(),
+            lambda spTree, sp: spTree.__setitem__(slice(1, 1), [element("p:pic")]),
+            lambda spTree, sp: spTree.__delitem__(0),
+            lambda spTree, sp: sp.addprevious(element("p:pic")),
+            lambda spTree, sp: sp.addnext(element("p:pic")),
+            lambda spTree, sp: setattr(sp, "shape_name", "Foo 42"),
+        ],
+    )
+    def it_counts_the_changes_to_the_shapes_it_contains(self, change):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Bar},p:extLst)")
+        sp = spTree[0]
+        version = spTree.shape_tree_version
+
+        change(spTree, sp)
+
+        assert spTree.shape_tree_version > version
+
+    def and_it_counts_a_shape_moved_out_as_a_change(self):
+        spTree, grpSp = element("p:spTree/p:sp"), element("p:grpSp")
+        version = spTree.shape_tree_version
+
+        grpSp.append(spTree[0])
+
+        assert spTree.shape_tree_version > version
+
+    def it_tells_its_watchers_when_a_shape_under_it_moves(self):
+        spTree = element("p:spTree/p:grpSp/(p:grpSpPr,p:sp/p:spPr)")
+        grpSp = spTree[0]
+        sp = grpSp[1]
+        tree_watcher, group_watcher = _ShapeMoveWatcher(), _ShapeMoveWatcher()
+        spTree.watch_shape_moves(tree_watcher)
+        grpSp.watch_shape_moves(group_watcher)
+
+        sp.x = 42
+        grpSp.cy = 24
+
+        assert tree_watcher.moved_elms == [sp, grpSp]
+        assert group_watcher.moved_elms == [sp]
+
     def it_can_add_a_grpSp_element(self, add_grpSp_fixture):
         spTree, expected_grpSp_xml, expected_xml = add_grpSp_fixture
 
@@ -234,6 +304,8 @@ class DescribeCT_GroupShape(object):
     def recalc_fixture(self, request, _child_extents_prop_, getparent_, grpSp_):
         xSp_cxml, extents, calls, expected_cxml = request.param
         xSp = element(xSp_cxml)
+        # -- moving the group tells the watchers of the mocked parent, not of interest here --
+        function_mock(request, "pptx.oxml.shapes.shared.note_shape_moved")
 
         _child_extents_prop_.return_value = extents
         expected_xml = xml(expected_cxml)
@@ -295,3 +367,13 @@ class DescribeCT_GroupShape(object):
     @pytest.fixture
     def spTree(self):
         return element("p:spTree")
+
+
+class _ShapeMoveWatcher:
+    """Records the shape elements it is told have moved."""
+
+    def __init__(self):
+        self.moved_elms = []
+
+    def note_shape_moved(self, shape_elm):
+        self.moved_elms.append(shape_elm)
@@ -5,8 +5,8 @@ from __future__ import annotations
 import pytest
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
-from pptx.oxml.ns import qn
+from pptx.oxml import oxml_parser, parse_prototype, parse_xml, register_element_cls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.mock import function_mock, loose_mock, var_mock
@@ -44,6 +44,33 @@ class DescribeParseXml(object):
             parse_xml(xml_text)
 
 
+class DescribeParsePrototype(object):
+    def it_returns_a_new_copy_of_the_parsed_xml_on_each_call(self, xml_bytes):
+        foo = parse_prototype(xml_bytes)
+        foo.set("baz", "1")
+
+        foo_2 = parse_prototype(xml_bytes)
+
+        assert foo_2 is not foo
+        assert foo_2.get("baz") is None
+        assert etree.tostring(foo_2) == etree.tostring(parse_xml(xml_bytes))
+
+    def it_parses_the_xml_only_once(self, request, xml_bytes):
+        parse_prototype(xml_bytes)
+        parse_xml_ = function_mock(request, "pptx.oxml.parse_xml")
+
+        parse_prototype(xml_bytes)
+
+        parse_xml_.assert_not_called()
+
+    def it_constructs_the_registered_custom_element_classes(self):
+        register_element_cls("a:foo", CustElmCls)
+
+        foo = parse_prototype("<a:foo %s/>" % nsdecls("a"))
+
+        assert type(foo) is CustElmCls
+
+
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
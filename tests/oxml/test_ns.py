@@ -6,6 +6,8 @@ import pytest
 
 from pptx.oxml.ns import NamespacePrefixedTag, namespaces, nsdecls, nsuri, qn
 
+from ..unitutil.mock import class_mock
+
 
 class DescribeNamespacePrefixedTag(object):
     def it_behaves_like_a_string_when_you_want_it_to(self, nsptag):
@@ -48,6 +50,13 @@ class DescribeQn(object):
     def it_calculates_the_clark_name_for_an_ns_prefixed_tag_string(self, nsptag_str, clark_name):
         assert qn(nsptag_str) == clark_name
 
+    def it_computes_each_clark_name_only_once(self, request, nsptag_str):
+        clark_name = qn(nsptag_str)
+        NamespacePrefixedTag_ = class_mock(request, "pptx.oxml.ns.NamespacePrefixedTag")
+
+        assert qn(nsptag_str) is clark_name
+        NamespacePrefixedTag_.assert_not_called()
+
 
 # ===========================================================================
 # fixtures
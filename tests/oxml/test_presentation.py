@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Callable, cast
 
 import pytest
 
@@ -25,6 +25,51 @@ class DescribeCT_SlideIdList(object):
             "p:sldIdLst/(p:sldId{r:id=rId4,id=256},p:sldId{r:id=rId1,id=257})"
         )
 
+    def it_does_not_count_a_new_slide_id_appended_as_a_change_in_slide_order(self):
+        sldIdLst = cast(CT_SlideIdList, element("p:sldIdLst/p:sldId{r:id=rId4,id=256}"))
+
+        sldIdLst.add_sldId("rId1")
+        sldIdLst.append(element("p:sldId{r:id=rId2,id=258}"))
+        sldIdLst.extend([element("p:sldId{r:id=rId3,id=259}")])
+
+        assert len(sldIdLst) == 4
+        assert sldIdLst.slide_order_version == 0
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda sldIdLst, sldId, _: sldIdLst.remove(sldId),
+            lambda sldIdLst, sldId, _: sldIdLst.insert(1, sldId),
+            lambda sldIdLst, sldId, _: sldIdLst.append(sldId),
+            lambda sldIdLst, sldId, _: sldIdLst.extend([sldId]),
+            lambda sldIdLst, sldId, new: sldIdLst.replace(sldId, new),
+            lambda sldIdLst, sldId, new: sldIdLst.__setitem__(0, new),
+            lambda sldIdLst, sldId, _: sldIdLst.__delitem__(0),
+            lambda sldIdLst, sldId, _: sldIdLst.clear(),
+            lambda sldIdLst, sldId, new: sldId.addprevious(new),
+            lambda sldIdLst, sldId, _: sldIdLst[1].addnext(sldId),
+        ],
+    )
+    def but_it_counts_a_slide_id_removed_or_moved(self, change: Callable[..., None]):
+        sldIdLst = cast(
+            CT_SlideIdList,
+            element("p:sldIdLst/(p:sldId{r:id=rId1,id=256},p:sldId{r:id=rId2,id=257})"),
+        )
+        sldId = sldIdLst.sldId_lst[0]
+
+        change(sldIdLst, sldId, element("p:sldId{r:id=rId3,id=258}"))
+
+        assert sldIdLst.slide_order_version > 0
+
+    def and_it_counts_a_slide_id_moved_out_to_another_list(self):
+        sldIdLst = cast(CT_SlideIdList, element("p:sldIdLst/p:sldId{r:id=rId1,id=256}"))
+        other_sldIdLst = cast(CT_SlideIdList, element("p:sldIdLst"))
+
+        other_sldIdLst.append(sldIdLst.sldId_lst[0])
+
+        assert sldIdLst.slide_order_version == 1
+        assert other_sldIdLst.slide_order_version == 0
+
     @pytest.mark.parametrize(
         ("sldIdLst_cxml", "expected_value"),
         [
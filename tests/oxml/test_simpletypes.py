@@ -39,6 +39,14 @@ class DescribeBaseSimpleType(object):
         ST_SimpleType.convert_from_xml.assert_called_once_with(str_value_)
         assert py_value is py_value_
 
+    def and_it_converts_each_distinct_XML_attribute_value_only_once(
+        self, str_value_, py_value_, convert_from_xml_
+    ):
+        py_values = [ST_SimpleType.from_xml(str_value_) for _ in range(3)]
+
+        ST_SimpleType.convert_from_xml.assert_called_once_with(str_value_)
+        assert py_values == [py_value_, py_value_, py_value_]
+
     def it_can_convert_python_value_to_string(self, to_xml_fixture):
         SimpleType, py_value_, str_value_ = to_xml_fixture
         str_value = SimpleType.to_xml(py_value_)
@@ -22,9 +22,11 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    xpath_cache_info,
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
 
 
 class DescribeCustomElementClass(object):
@@ -32,6 +34,31 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeBaseOxmlElement(object):
+    """Unit-test suite for `pptx.oxml.xmlchemy.BaseOxmlElement` objects."""
+
+    def it_evaluates_an_xpath_expression_using_the_standard_namespaces(self):
+        sp = element("p:sp/(p:nvSpPr/p:cNvPr{id=2,name=foo},p:spPr)")
+
+        assert sp.xpath("p:nvSpPr/p:cNvPr/@name") == ["foo"]
+
+    def and_it_accepts_xpath_variables(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2},p:sp/p:nvSpPr/p:cNvPr{id=3})")
+
+        matches = spTree.xpath("p:sp[p:nvSpPr/p:cNvPr/@id=$id]", id="3")
+
+        assert matches == [spTree[1]]
+
+    def it_compiles_each_xpath_expression_only_once(self):
+        sp = element("p:sp/p:nvSpPr/p:cNvPr{id=2,name=foo}")
+        sp.xpath("p:nvSpPr/p:cNvPr[@id=$id]/@name", id="2")
+        hits, misses = xpath_cache_info()[:2]
+
+        assert sp.xpath("p:nvSpPr/p:cNvPr[@id=$id]/@name", id="3") == []
+
+        assert xpath_cache_info()[:2] == (hits + 1, misses)
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
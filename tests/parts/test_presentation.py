@@ -119,9 +119,33 @@ class DescribePresentationPart(object):
             PackURI("/ppt/slides/slide%d.xml" % (i + 1)) for i in range(len(rIds))
         ]
 
+    def it_can_retain_only_some_of_its_slides(self, request, package_):
+        prs_elm = element(
+            "p:presentation/(p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257},p:sldId"
+            "{r:id=c,id=258},p:sldId{r:id=d,id=259}),p:custShowLst/p:custShow/p:sldLst/p:sld"
+            "{r:id=d})"
+        )
+        relationships_ = property_mock(request, PresentationPart, "_rels").return_value
+        prs_part = PresentationPart(None, None, package_, prs_elm)
+
+        prs_part.retain_slides((2, -4, 2))
+
+        assert prs_elm.xpath("p:sldIdLst/p:sldId/@r:id") == ["a", "c"]
+        relationships_.pop.assert_called_once_with("b")
+        package_._parts_dropped.assert_called_once_with()
+
+    def but_it_raises_on_a_slide_position_out_of_range(self):
+        prs_elm = element("p:presentation/p:sldIdLst/p:sldId{r:id=a,id=256}")
+        prs_part = PresentationPart(None, None, None, prs_elm)
+
+        with pytest.raises(IndexError):
+            prs_part.retain_slides((1,))
+
+        assert prs_elm.xpath("p:sldIdLst/p:sldId/@r:id") == ["a"]
+
     def it_can_save_the_package_to_a_file(self, package_):
-        PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        PresentationPart(None, None, package_, None).save("prs.pptx", workers=4)
+        package_.save.assert_called_once_with("prs.pptx", 4, None)
 
     def it_can_add_a_new_slide(self, request, package_, slide_part_, slide_, relate_to_):
         slide_layout_ = instance_mock(request, SlideLayout)
@@ -141,20 +165,17 @@ class DescribePresentationPart(object):
         assert rId == "rId42"
         assert slide is slide_
 
-    def it_finds_the_slide_id_of_a_slide_part(self, slide_part_, related_part_):
+    def it_finds_the_slide_id_of_a_slide_part(self, request, slide_part_, related_part_):
         prs_elm = element(
             "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id="
             "b,id=257},p:sldId{r:id=c,id=258})"
         )
-        related_part_.side_effect = iter((None, slide_part_, None))
+        parts = {"a": None, "b": slide_part_, "c": instance_mock(request, SlidePart)}
+        related_part_.side_effect = lambda _, rId: parts[rId]
         prs_part = PresentationPart(None, None, None, prs_elm)
 
         _slide_id = prs_part.slide_id(slide_part_)
 
-        assert related_part_.call_args_list == [
-            call(prs_part, "a"),
-            call(prs_part, "b"),
-        ]
         assert _slide_id == 257
 
     def it_raises_on_slide_id_not_found(self, slide_part_, related_part_):
@@ -184,6 +205,95 @@ class DescribePresentationPart(object):
 
         assert slide == expected_value
 
+    def it_finds_the_position_of_a_slide_part(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        parts = {rId: instance_mock(request, SlidePart) for rId in "ab"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+
+        assert prs_part.slide_idx(parts["b"]) == 1
+        assert prs_part.slide_idx(parts["a"]) == 0
+        with pytest.raises(ValueError):
+            prs_part.slide_idx(instance_mock(request, SlidePart))
+
+    def it_resolves_each_slide_part_only_once(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        parts = {rId: instance_mock(request, SlidePart) for rId in "ab"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+
+        for _ in range(3):
+            for rId, slide_id in (("a", 256), ("b", 257)):
+                assert prs_part.slide_id(parts[rId]) == slide_id
+                assert prs_part.get_slide(slide_id) is parts[rId].slide
+
+        assert related_part_.call_args_list == [call(prs_part, "a"), call(prs_part, "b")]
+
+    def it_picks_up_slides_added_to_the_XML(self, request, related_part_):
+        prs_elm = element("p:presentation/p:sldIdLst/p:sldId{r:id=a,id=256}")
+        parts = {rId: instance_mock(request, SlidePart) for rId in "abc"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+        assert prs_part.slide_id(parts["a"]) == 256
+
+        prs_elm.sldIdLst.add_sldId("b")
+        prs_elm.sldIdLst.add_sldId("c")
+
+        assert prs_part.slide_idx(parts["c"]) == 2
+        assert prs_part.get_slide(257) is parts["b"].slide
+        assert related_part_.call_args_list == [
+            call(prs_part, "a"),
+            call(prs_part, "b"),
+            call(prs_part, "c"),
+        ]
+
+    def and_it_picks_up_slides_removed_or_reordered_in_the_XML(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257},"
+            "p:sldId{r:id=c,id=258})"
+        )
+        parts = {rId: instance_mock(request, SlidePart) for rId in "abc"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+        sldIdLst = prs_elm.sldIdLst
+        sldId_a, sldId_b, sldId_c = sldIdLst.sldId_lst
+        assert prs_part.slide_idx(parts["c"]) == 2
+
+        sldIdLst.remove(sldId_b)
+        assert prs_part.slide_idx(parts["c"]) == 1
+        assert prs_part.get_slide(257) is None
+        with pytest.raises(ValueError):
+            prs_part.slide_id(parts["b"])
+
+        sldIdLst.insert(0, sldId_c)
+        assert prs_part.slide_idx(parts["c"]) == 0
+        assert prs_part.slide_idx(parts["a"]) == 1
+        assert prs_part.get_slide(258) is parts["c"].slide
+
+    def and_it_picks_up_a_slide_moved_to_the_end_of_the_XML(self, request, related_part_):
+        prs_elm = element(
+            "p:presentation/p:sldIdLst/(p:sldId{r:id=a,id=256},p:sldId{r:id=b,id=257})"
+        )
+        parts = {rId: instance_mock(request, SlidePart) for rId in "ab"}
+        related_part_.side_effect = lambda _, rId: parts[rId]
+        prs_part = PresentationPart(None, None, None, prs_elm)
+        sldIdLst = prs_elm.sldIdLst
+        sldId_a, sldId_b = sldIdLst.sldId_lst
+        assert prs_part.slide_idx(parts["b"]) == 1
+
+        sldIdLst.append(sldId_a)
+        assert prs_part.slide_idx(parts["b"]) == 0
+        assert prs_part.slide_idx(parts["a"]) == 1
+
+        sldId_a.addnext(sldId_b)
+        assert prs_part.slide_idx(parts["a"]) == 0
+        assert prs_part.slide_id(parts["b"]) == 257
+        assert prs_part.slide_idx(parts["b"]) == 1
+
     def it_knows_the_next_slide_partname_to_help(self):
         prs_elm = element("p:presentation/p:sldIdLst/(p:sldId,p:sldId)")
         prs_part = PresentationPart(None, None, None, prs_elm)
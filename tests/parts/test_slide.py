@@ -28,6 +28,7 @@ from pptx.parts.slide import (
     SlideMasterPart,
     SlidePart,
 )
+from pptx.shapes.shapetree import ShapeIdAllocator, ShapeNameIndex
 from pptx.slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 
 from ..unitutil.cxml import element
@@ -48,6 +49,26 @@ class DescribeBaseSlidePart(object):
         slide_part = BaseSlidePart(None, None, None, element("p:sld/p:cSld{name=Foobar}"))
         assert slide_part.name == "Foobar"
 
+    def it_provides_the_shape_id_allocator_for_the_slide(self):
+        sld = element("p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=7}")
+        slide_part = BaseSlidePart(None, None, None, sld)
+
+        shape_id_allocator = slide_part.shape_id_allocator
+
+        assert isinstance(shape_id_allocator, ShapeIdAllocator)
+        assert shape_id_allocator.next_ids(1) == range(8, 9)
+        assert slide_part.shape_id_allocator is shape_id_allocator
+
+    def it_provides_the_shape_name_index_for_the_slide(self):
+        sld = element("p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{name=Title 1}")
+        slide_part = BaseSlidePart(None, None, None, sld)
+
+        shape_name_index = slide_part.shape_name_index
+
+        assert isinstance(shape_name_index, ShapeNameIndex)
+        assert "Title 1" in shape_name_index
+        assert slide_part.shape_name_index is shape_name_index
+
     def it_can_get_a_related_image_by_rId(self, request, image_part_):
         image_ = instance_mock(request, Image)
         image_part_.image = image_
@@ -13,12 +13,13 @@ from pptx.dml.effect import ShadowFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.text import CT_TextBody
+from pptx.parts.slide import BaseSlidePart
 from pptx.shapes import Subshape
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.base import BaseShape, _PlaceholderFormat
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.picture import Picture
-from pptx.shapes.shapetree import BaseShapeFactory, SlideShapes
+from pptx.shapes.shapetree import BaseShapeFactory, ShapeNameIndex, SlideShapes
 
 from ..oxml.unitdata.shape import (
     a_cNvPr,
@@ -62,9 +63,10 @@ class DescribeBaseShape(object):
         assert shape.name == name
 
     def it_can_change_its_name(self, name_set_fixture):
-        shape, new_value, expected_xml = name_set_fixture
+        shape, new_value, expected_xml, shape_name_index_ = name_set_fixture
         shape.name = new_value
         assert shape._element.xml == expected_xml
+        shape_name_index_.add.assert_called_once_with(new_value)
 
     @pytest.mark.parametrize(
         ("shape_cxml", "expected_x", "expected_y"),
@@ -295,11 +297,13 @@ class DescribeBaseShape(object):
             ),
         ]
     )
-    def name_set_fixture(self, request):
+    def name_set_fixture(self, request, shapes_, slide_part_, shape_name_index_):
         xSp_cxml, ShapeCls, new_value, expected_xSp_cxml = request.param
-        shape = ShapeCls(element(xSp_cxml), None)
+        shapes_.part = slide_part_
+        slide_part_.shape_name_index = shape_name_index_
+        shape = ShapeCls(element(xSp_cxml), shapes_)
         expected_xml = xml(expected_xSp_cxml)
-        return shape, new_value, expected_xml
+        return shape, new_value, expected_xml, shape_name_index_
 
     @pytest.fixture
     def part_fixture(self, shapes_):
@@ -534,10 +538,18 @@ class DescribeBaseShape(object):
     def shape_name(self):
         return "Foobar 41"
 
+    @pytest.fixture
+    def shape_name_index_(self, request):
+        return instance_mock(request, ShapeNameIndex)
+
     @pytest.fixture
     def shapes_(self, request):
         return instance_mock(request, SlideShapes)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, BaseSlidePart)
+
     @pytest.fixture
     def sp(self):
         return an_sp().with_nsdecls().with_child(an_spPr()).element
@@ -78,12 +78,13 @@ class DescribeFreeformBuilder(object):
         shape_: Mock,
     ):
         origin_x, origin_y = Mm(42), Mm(24)
-        sp, path = element("p:sp"), element("a:path")
+        sp = element("p:sp/p:nvSpPr/p:cNvPr{name=Freeform 41}")
+        path = element("a:path")
         drawing_ops = (
             _LineSegment(None, None, None),  # type: ignore
             _LineSegment(None, None, None),  # type: ignore
         )
-        shapes_._shape_factory.return_value = shape_
+        shapes_._shape_proxy.return_value = shape_
         _add_freeform_sp_.return_value = sp
         _start_path_.return_value = path
         builder = FreeformBuilder(shapes_, None, None, None, None)  # type: ignore
@@ -93,9 +94,10 @@ class DescribeFreeformBuilder(object):
         shape = builder.convert_to_shape(origin_x, origin_y)
 
         _add_freeform_sp_.assert_called_once_with(builder, origin_x, origin_y)
+        shapes_._shape_name_index.add.assert_called_once_with("Freeform 41")
         _start_path_.assert_called_once_with(builder, sp)
         assert apply_operation_to_.call_args_list == calls
-        shapes_._shape_factory.assert_called_once_with(sp)
+        shapes_._shape_proxy.assert_called_once_with(sp)
         assert shape is shape_
 
     @pytest.mark.parametrize(
@@ -471,7 +471,7 @@ class DescribePicturePlaceholder(object):
             request,
             PicturePlaceholder,
             "_get_or_add_image",
-            return_value=(42, "bar", image_size),
+            return_value=("rId42", "bar", image_size),
         )
         picture_ph = PicturePlaceholder(
             element("p:sp/(p:nvSpPr/p:cNvPr{id=2,name=foo},p:spPr/a:xfrm/a:ext{cx=99" ",cy=99})"),
@@ -484,7 +484,7 @@ class DescribePicturePlaceholder(object):
         assert pic.xml == xml(
             "p:pic/(p:nvPicPr/(p:cNvPr{id=2,name=foo,descr=bar},p:cNvPicPr/a"
             ":picLocks{noGrp=1,noChangeAspect=1},p:nvPr),p:blipFill/(a:blip{"
-            "r:embed=42},a:srcRect{%s=12500,%s=12500},a:stretch/a:fillRect),"
+            "r:embed=rId42},a:srcRect{%s=12500,%s=12500},a:stretch/a:fillRect),"
             "p:spPr)" % crop_attr_names
         )
 
@@ -32,8 +32,10 @@ from pptx.shapes.placeholder import (
     _BaseSlidePlaceholder,
 )
 from pptx.shapes.shapetree import (
+    AutoShapeSpec,
     BasePlaceholders,
     BaseShapeFactory,
+    ConnectorSpec,
     GroupShapes,
     LayoutPlaceholders,
     LayoutShapes,
@@ -41,9 +43,14 @@ from pptx.shapes.shapetree import (
     MasterShapes,
     NotesSlidePlaceholders,
     NotesSlideShapes,
+    PictureSpec,
+    ShapeIdAllocator,
+    ShapeNameIndex,
+    ShapeSpatialIndex,
     SlidePlaceholders,
     SlideShapeFactory,
     SlideShapes,
+    TextboxSpec,
     _BaseGroupShapes,
     _BaseShapes,
     _LayoutShapeFactory,
@@ -55,7 +62,7 @@ from pptx.shapes.shapetree import (
 )
 from pptx.slide import SlideLayout, SlideMaster
 from pptx.table import Table
-from pptx.util import Emu, Inches
+from pptx.util import Emu, Inches, proxy_identity_map
 
 from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
 from ..unitutil.cxml import element, xml
@@ -131,6 +138,77 @@ class Describe_BaseShapes(object):
         BaseShapeFactory_.assert_called_once_with(sp, shapes)
         assert shape is shape_
 
+    def it_provides_access_to_its_shapes_by_id_name_and_placeholder_idx(self, BaseShapeFactory_):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2,name=Title 1},p:nvPr/p:ph{type=title}),p:sp/p"
+            ":nvSpPr/(p:cNvPr{id=3,name=Foo},p:nvPr),p:sp/p:nvSpPr/(p:cNvPr{id=3,name=Title 1},p:n"
+            "vPr),p:contentPart)"
+        )
+        sps = spTree.xpath("p:sp")
+        BaseShapeFactory_.side_effect = lambda shape_elm, parent: shape_elm
+        shapes = _BaseShapes(spTree, None)
+
+        assert shapes.by_id[3] is sps[1]
+        assert shapes.by_name["Title 1"] is sps[0]
+        assert dict(shapes.by_idx) == {0: sps[0]}
+        assert sorted(shapes.by_id) == [2, 3]
+        assert "Bar" not in shapes.by_name
+        assert shapes.by_id.get(42) is None
+
+    def and_it_builds_its_lookup_tables_once_while_the_shape_tree_is_unchanged(self):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo}")
+        shapes = _BaseShapes(spTree, None)
+
+        lookup = shapes._lookup
+
+        assert shapes._lookup is lookup
+        assert lookup.elm_by_name is lookup.elm_by_name
+
+    def but_it_rebuilds_them_after_the_shape_tree_changes(self, BaseShapeFactory_):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo}")
+        BaseShapeFactory_.side_effect = lambda shape_elm, parent: shape_elm
+        shapes = _BaseShapes(spTree, None)
+        assert len(shapes) == 1
+        assert "Foo" in shapes.by_name
+        sp = element("p:sp/p:nvSpPr/p:cNvPr{id=3,name=Bar}")
+
+        spTree.append(sp)
+        spTree[0].shape_name = "Baz"
+
+        assert len(shapes) == 2
+        assert shapes[1] is sp
+        assert shapes.by_id[3] is sp
+        assert "Foo" not in shapes.by_name
+        assert shapes.by_name["Baz"] is spTree[0]
+
+    def it_reuses_each_shape_proxy_within_a_proxy_identity_map_block(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=2,name=Foo},p:cxnSp/p:nvCxnSpPr/p:cNvPr{id=3,name=Bar})"
+        )
+        shapes = _BaseShapes(spTree, None)
+
+        with proxy_identity_map():
+            shape = shapes[0]
+            assert shapes[0] is shape
+            assert list(shapes)[0] is shape
+            assert shapes.by_id[2] is shape
+            assert shapes.by_name["Foo"] is shape
+            assert shapes[1] is shapes[1]
+        assert shapes[0] is not shape
+
+    def it_provides_a_spatial_index_of_its_shapes(self):
+        spTree = element(
+            "p:spTree/p:sp/(p:nvSpPr/p:cNvPr{id=2,name=Foo},p:spPr/a:xfrm/(a:off{x=1,y=2},a:ext{"
+            "cx=3,cy=4}))"
+        )
+        shapes = _BaseShapes(spTree, None)
+
+        spatial_index = shapes.spatial_index
+
+        assert isinstance(spatial_index, ShapeSpatialIndex)
+        assert shapes.spatial_index is spatial_index
+        assert [s.name for s in spatial_index.shapes_at(Emu(2), Emu(3))] == ["Foo"]
+
     def it_raises_on_shape_index_out_of_range(self, getitem_raises_fixture):
         shapes = getitem_raises_fixture
         with pytest.raises(IndexError):
@@ -140,6 +218,7 @@ class Describe_BaseShapes(object):
         shapes, placeholder_, expected_xml = clone_ph_fixture
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
+        assert "Vertical Chart Placeholder 0" in shapes._shape_name_index
 
     def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
         shapes, expected_value = turbo_fixture
@@ -155,6 +234,21 @@ class Describe_BaseShapes(object):
         shapes, expected_value = next_id_fixture
         assert shapes._next_shape_id == expected_value
 
+    def and_it_draws_shape_ids_from_the_slide_allocator_without_searching_in_turbo_mode(
+        self, request
+    ):
+        spTree = element("p:spTree/p:nvSpPr/p:cNvPr{id=5}")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        shapes, other_shapes = _BaseShapes(spTree, None), _BaseShapes(spTree, None)
+        shapes.turbo_add_enabled = True
+        spTree.append(element("p:cNvPr{id=9}"))
+
+        assert shapes._next_shape_id == 6
+        assert other_shapes._next_shape_id == 10
+        assert shapes._next_shape_id == 11
+
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
         assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
@@ -162,8 +256,15 @@ class Describe_BaseShapes(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def clone_ph_fixture(self, placeholder_):
-        shapes = SlideShapes(element("p:spTree{a:b=c}"), None)
+    def clone_ph_fixture(self, request, placeholder_):
+        spTree = element("p:spTree{a:b=c}")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = SlideShapes(spTree, None)
         expected_xml = xml(
             "p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char"
             "t Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type="
@@ -228,7 +329,11 @@ class Describe_BaseShapes(object):
     )
     def next_id_fixture(self, request):
         spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
+        spTree = element(spTree_cxml)
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        shapes = _BaseShapes(spTree, None)
         return shapes, expected_value
 
     @pytest.fixture(
@@ -247,15 +352,17 @@ class Describe_BaseShapes(object):
     def ph_name_fixture(self, request):
         ph_type, sp_id, orient, expected_name = request.param
         spTree = element("p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder " "3})")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
         shapes = SlideShapes(spTree, None)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[(None, False), (42, True)])
+    @pytest.fixture(params=[False, True])
     def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
+        expected_value = request.param
         shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
+        shapes._turbo_add_enabled = expected_value
         return shapes, expected_value
 
     @pytest.fixture(
@@ -271,7 +378,11 @@ class Describe_BaseShapes(object):
     )
     def turbo_set_fixture(self, request):
         spTree_cxml, value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
+        spTree = element(spTree_cxml)
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        shapes = _BaseShapes(spTree, None)
         expected_value = value
         return shapes, value, expected_value
 
@@ -353,6 +464,7 @@ class Describe_BaseGroupShapes(object):
         group_shape = shapes.add_group_shape()
 
         spTree.add_grpSp.assert_called_once_with(spTree)
+        assert "Group 1" in shapes._shape_name_index
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
@@ -360,7 +472,11 @@ class Describe_BaseGroupShapes(object):
         self, request, _next_shape_id_prop_, _recalculate_extents_, _shape_factory_
     ):
         _next_shape_id_prop_.return_value = 42
-        graphicFrame = element("p:graphicFrame")
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        graphicFrame = element("p:graphicFrame/p:nvGraphicFramePr/p:cNvPr{id=42,name=Object 41}")
         _OleObjectElementCreator_ = class_mock(
             request, "pptx.shapes.shapetree._OleObjectElementCreator"
         )
@@ -368,7 +484,7 @@ class Describe_BaseGroupShapes(object):
         ole_object_shape_ = instance_mock(request, GraphicFrame)
         _shape_factory_.return_value = ole_object_shape_
         x, y, cx, cy = 1, 2, 3, 4
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+        shapes = _BaseGroupShapes(spTree, None)
 
         shape = shapes.add_ole_object(
             "worksheet.xlsx",
@@ -396,6 +512,7 @@ class Describe_BaseGroupShapes(object):
             Inches(0.75),
         )
         assert shapes._spTree[-1] is graphicFrame
+        assert "Object 41" in shapes._shape_name_index
         _recalculate_extents_.assert_called_once_with(shapes)
         _shape_factory_.assert_called_once_with(shapes, graphicFrame)
         assert shape is ole_object_shape_
@@ -426,6 +543,84 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, sp)
         assert shape is shape_
 
+    def it_can_add_many_shapes_at_once(
+        self,
+        request,
+        part_prop_,
+        slide_part_,
+        image_part_,
+        _recalculate_extents_,
+        _shape_factory_,
+    ):
+        spTree = element(
+            "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=3},p:extLst)"
+        )
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        part_prop_.return_value = slide_part_
+        slide_part_.get_or_add_image_part.return_value = image_part_, "rId42"
+        image_part_.scale.return_value = 30, 40
+        image_part_.desc = "foo.png"
+        _shape_factory_.side_effect = lambda shapes, shape_elm: shape_elm
+        shapes = _BaseGroupShapes(spTree, None)
+
+        shape_elms = shapes.add_shapes(
+            [
+                AutoShapeSpec(MSO_AUTO_SHAPE_TYPE.OVAL, 1, 2, 3, 4),
+                TextboxSpec(5, 6, 7, 8),
+                PictureSpec("foo.png", 9, 10),
+                PictureSpec("foo.png", 11, 12, 13, 14),
+                ConnectorSpec(MSO_CONNECTOR.STRAIGHT, 20, 30, 10, 40),
+            ]
+        )
+
+        assert [(e.shape_id, e.shape_name) for e in shape_elms] == [
+            (4, "Oval 3"),
+            (5, "TextBox 4"),
+            (6, "Picture 5"),
+            (7, "Picture 6"),
+            (8, "Connector 7"),
+        ]
+        assert list(spTree)[2:-1] == shape_elms
+        assert shape_elms[0].prst == MSO_AUTO_SHAPE_TYPE.OVAL
+        assert shape_elms[1].xpath("p:nvSpPr/p:cNvSpPr/@txBox") == ["1"]
+        assert shape_elms[2].xpath("p:blipFill/a:blip/@r:embed") == ["rId42"]
+        assert (shape_elms[3].x, shape_elms[3].y, shape_elms[3].cx, shape_elms[3].cy) == (
+            11,
+            12,
+            30,
+            40,
+        )
+        assert shape_elms[4].xml == xml(
+            "p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=8,name=Connector 7},p:cNvCxnSpPr,p:nvPr),p:spPr/(a"
+            ":xfrm{flipH=1}/(a:off{x=10,y=30},a:ext{cx=10,cy=10}),a:prstGeom{prst=line}/a:avLst)"
+            ",p:style/(a:lnRef{idx=2}/a:schemeClr{val=accent1},a:fillRef{idx=0}/a:schemeClr{val="
+            "accent1},a:effectRef{idx=1}/a:schemeClr{val=accent1},a:fontRef{idx=minor}/a:schemeCl"
+            "r{val=tx1}))"
+        )
+        assert slide_part_.shape_name_index.add.call_args_list == [
+            call("Oval 3"),
+            call("TextBox 4"),
+            call("Picture 5"),
+            call("Picture 6"),
+            call("Connector 7"),
+        ]
+        slide_part_.get_or_add_image_part.assert_called_once_with("foo.png")
+        assert image_part_.scale.call_args_list == [call(None, None), call(13, 14)]
+        _recalculate_extents_.assert_called_once_with(shapes)
+
+    def but_it_raises_on_a_shape_spec_it_does_not_recognize(self, request):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
+
+        with pytest.raises(TypeError, match=r"add_shapes\(\) got unsupported shape spec \(1, 2"):
+            shapes.add_shapes([TextboxSpec(1, 2, 3, 4), (1, 2, 3, 4)])
+        assert len(spTree) == 0
+
     def it_can_add_a_textbox(self, textbox_fixture):
         shapes, x, y, cx, cy, sp, shape_ = textbox_fixture
 
@@ -452,6 +647,7 @@ class Describe_BaseGroupShapes(object):
 
         assert shapes._element.xml == expected_xml
         assert graphicFrame is shapes._element.xpath("p:graphicFrame")[0]
+        assert "Chart 0" in shapes._shape_name_index
 
     def it_adds_a_cxnSp_to_help(self, add_cxnSp_fixture):
         shapes, connector_type, begin_x, begin_y = add_cxnSp_fixture[:4]
@@ -461,6 +657,7 @@ class Describe_BaseGroupShapes(object):
 
         assert cxnSp is shapes._element.xpath("p:cxnSp")[0]
         assert cxnSp.xml == expected_xml
+        assert "Connector 0" in shapes._shape_name_index
 
     def it_adds_a_pic_element_to_help(self, add_pic_fixture):
         shapes, image_part_, rId, x, y, cx, cy = add_pic_fixture[:7]
@@ -471,6 +668,7 @@ class Describe_BaseGroupShapes(object):
         image_part_.scale.assert_called_once_with(cx, cy)
         assert shapes._element.xml == expected_xml
         assert pic is shapes._element.xpath("p:pic")[0]
+        assert "Picture 41" in shapes._shape_name_index
 
     def it_adds_an_sp_element_to_help(self, add_sp_fixture):
         shapes, autoshape_type_, x, y, cx, cy, expected_xml = add_sp_fixture
@@ -479,6 +677,7 @@ class Describe_BaseGroupShapes(object):
 
         assert shapes._element.xml == expected_xml
         assert sp is shapes._element.xpath("p:sp")[0]
+        assert "Rounded Rectangle 6" in shapes._shape_name_index
 
     def it_adds_a_textbox_sp_element_to_help(self, add_textbox_sp_fixture):
         shapes, x, y, cx, cy, expected_xml = add_textbox_sp_fixture
@@ -487,12 +686,20 @@ class Describe_BaseGroupShapes(object):
 
         assert shapes._element.xml == expected_xml
         assert sp is shapes._element.xpath("p:sp")[0]
+        assert "TextBox 5" in shapes._shape_name_index
 
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+    def add_cht_gr_frm_fixture(self, request):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
         rId, x, y, cx, cy = "rId42", 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -527,7 +734,14 @@ class Describe_BaseGroupShapes(object):
     )
     def add_cxnSp_fixture(self, request):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             "p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp"
@@ -540,8 +754,12 @@ class Describe_BaseGroupShapes(object):
         return (shapes, connector_type, begin_x, begin_y, end_x, end_y, expected_xml)
 
     @pytest.fixture
-    def add_pic_fixture(self, image_part_, _next_shape_id_prop_):
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+    def add_pic_fixture(self, request, image_part_, _next_shape_id_prop_):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
         rId, x, y, cx, cy = "rId24", 10, 11, 12, 13
 
         _next_shape_id_prop_.return_value = 42
@@ -565,8 +783,12 @@ class Describe_BaseGroupShapes(object):
         return shapes, image_part_, rId, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_sp_fixture(self, autoshape_type_, _next_shape_id_prop_):
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+    def add_sp_fixture(self, request, autoshape_type_, _next_shape_id_prop_):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
         x, y, cx, cy = 8, 7, 6, 5
 
         _next_shape_id_prop_.return_value = 7
@@ -595,8 +817,12 @@ class Describe_BaseGroupShapes(object):
         return shapes, autoshape_type_, x, y, cx, cy, expected_xml
 
     @pytest.fixture
-    def add_textbox_sp_fixture(self, _next_shape_id_prop_):
-        shapes = _BaseGroupShapes(element("p:spTree"), None)
+    def add_textbox_sp_fixture(self, request, _next_shape_id_prop_):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = _BaseGroupShapes(spTree, None)
         x, y, cx, cy = 1, 2, 3, 4
 
         _next_shape_id_prop_.return_value = 6
@@ -660,9 +886,12 @@ class Describe_BaseGroupShapes(object):
         )
 
     @pytest.fixture
-    def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_, group_shape_):
+    def group_fixture(self, request, CT_GroupShape_add_grpSp_, _shape_factory_, group_shape_):
         spTree = element("p:spTree{id=2e838acdc755e83113ed03904d2fe081f}")
-        grpSp = element("p:grpSp{id=052874e154b48f9bec4266f80913cae38f}")
+        grpSp = element("p:grpSp/p:nvGrpSpPr/p:cNvPr{id=2,name=Group 1}")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
         shapes = _BaseGroupShapes(spTree, None)
 
         CT_GroupShape_add_grpSp_.return_value = grpSp
@@ -992,6 +1221,20 @@ class DescribeSlidePlaceholders(object):
         assert SlideShapeFactory_.call_args_list == expected_calls
         assert ps == expected_values
 
+    def it_provides_access_to_its_placeholders_by_id_and_name(self, SlideShapeFactory_):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2,name=Foo},p:nvPr),p:sp/p:nvSpPr/(p:cNvPr{id=3,na"
+            "me=Title 1},p:nvPr/p:ph{type=title}))"
+        )
+        ph_elm = spTree[1]
+        SlideShapeFactory_.side_effect = lambda shape_elm, parent: shape_elm
+        placeholders = SlidePlaceholders(spTree, None)
+
+        assert placeholders.by_id[3] is ph_elm
+        assert placeholders.by_name["Title 1"] is ph_elm
+        assert 2 not in placeholders.by_id
+        assert "Foo" not in placeholders.by_name
+
     def it_knows_how_many_placeholders_it_contains(self, len_fixture):
         placeholders, expected_value = len_fixture
         assert len(placeholders) == expected_value
@@ -1251,6 +1494,7 @@ class DescribeSlideShapes(object):
             shapes, shape_id_, movie_file, x, y, cx, cy, poster_frame_image, mime_type
         )
         assert shapes._spTree[-1] is movie_pic
+        assert "foobar.mp4" in shapes._shape_name_index
         _add_video_timing_.assert_called_once_with(shapes, movie_pic)
         _shape_factory_.assert_called_once_with(shapes, movie_pic)
         assert movie is movie_
@@ -1264,6 +1508,7 @@ class DescribeSlideShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, graphicFrame)
         assert table is table_
         assert shapes._element.xml == expected_xml
+        assert "Table 0" in shapes._shape_name_index
 
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, calls = clone_fixture
@@ -1310,16 +1555,21 @@ class DescribeSlideShapes(object):
     @pytest.fixture
     def movie_fixture(
         self,
+        request,
         _MoviePicElementCreator_,
         _add_video_timing_,
         _shape_factory_,
         movie_,
         _next_shape_id_prop_,
     ):
-        shapes = SlideShapes(element("p:spTree"), None)
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = SlideShapes(spTree, None)
         movie_file, x, y, cx, cy = "foobar.mp4", 1, 2, 3, 4
         poster_frame_image, mime_type = "foobar.png", "video/mp4"
-        movie_pic = element("p:pic")
+        movie_pic = element("p:pic/p:nvPicPr/p:cNvPr{id=42,name=foobar.mp4}")
         _MoviePicElementCreator_.new_movie_pic.return_value = movie_pic
         _shape_factory_.return_value = movie_
         shape_id_ = _next_shape_id_prop_.return_value
@@ -1341,8 +1591,15 @@ class DescribeSlideShapes(object):
         )
 
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
-        shapes = SlideShapes(element("p:spTree"), None)
+    def table_fixture(self, request, table_, _shape_factory_):
+        spTree = element("p:spTree")
+        property_mock(
+            request, _BaseShapes, "_shape_id_allocator", return_value=ShapeIdAllocator(spTree)
+        )
+        property_mock(
+            request, _BaseShapes, "_shape_name_index", return_value=ShapeNameIndex(spTree)
+        )
+        shapes = SlideShapes(spTree, None)
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1544,8 +1801,12 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, ph_elm, _LayoutShapeFactory_, placeholder_ = get_fixture
+
+        placeholder = placeholders.get(idx)
+
+        _LayoutShapeFactory_.assert_called_once_with(ph_elm, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1554,8 +1815,8 @@ class DescribeLayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self):
+        placeholders = LayoutPlaceholders(element("p:spTree/p:sp"), None)
         default = "barfoo"
         return placeholders, default
 
@@ -1566,24 +1827,18 @@ class DescribeLayoutPlaceholders(object):
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(self, request, _LayoutShapeFactory_, placeholder_):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/(p:cNvPr{id=2},p:nvPr/p:ph{type=title}),p:sp/p:nvSpPr/(p:cNv"
+            "Pr{id=3},p:nvPr/p:ph{idx=1}),p:sp/p:nvSpPr/(p:cNvPr{id=4},p:nvPr/p:ph{idx=1}))"
+        )
+        layout_placeholders = LayoutPlaceholders(spTree, None)
+        ph_elm = spTree.xpath("p:sp")[idx]
+        return layout_placeholders, idx, ph_elm, _LayoutShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            LayoutPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1597,10 +1852,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
     def it_constructs_a_master_placeholder_for_a_shape_element(self, factory_fixture):
@@ -2060,6 +2311,174 @@ class Describe_MoviePicElementCreator(object):
         return property_mock(request, _MoviePicElementCreator, "_video_part_rIds")
 
 
+class DescribeShapeIdAllocator:
+    """Unit-test suite for `pptx.shapes.shapetree.ShapeIdAllocator` objects."""
+
+    def it_issues_ids_following_the_maximum_id_in_the_slide(self):
+        allocator = ShapeIdAllocator(element("p:spTree/(p:cNvPr{id=1},p:cNvPr{id=7})"))
+
+        assert allocator.next_ids(3) == range(8, 11)
+
+    def and_it_continues_from_the_last_id_issued_without_searching_again(self):
+        spTree = element("p:spTree/p:cNvPr{id=1}")
+        allocator = ShapeIdAllocator(spTree)
+        allocator.next_ids(1)
+        spTree.append(element("p:cNvPr{id=42}"))
+
+        assert allocator.next_ids(2) == range(3, 5)
+
+    def but_it_picks_up_ids_assigned_outside_it_when_synced(self):
+        spTree = element("p:spTree/p:cNvPr{id=1}")
+        allocator = ShapeIdAllocator(spTree)
+        allocator.next_ids(1)
+        spTree.append(element("p:cNvPr{id=42}"))
+
+        allocator.sync()
+
+        assert allocator.next_ids(1) == range(43, 44)
+
+
+class DescribeShapeNameIndex:
+    """Unit-test suite for `pptx.shapes.shapetree.ShapeNameIndex` objects."""
+
+    def it_knows_the_names_used_in_the_slide(self):
+        name_index = ShapeNameIndex(element("p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=foo})"))
+
+        assert "Title 1" in name_index
+        assert "foo" in name_index
+        assert "Title 2" not in name_index
+
+    def it_finds_the_first_unused_name_from_a_starting_number(self):
+        name_index = ShapeNameIndex(
+            element("p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Title 2})")
+        )
+
+        assert name_index.unique_name("Title", 0) == "Title 0"
+        assert name_index.unique_name("Title", 1) == "Title 3"
+        assert name_index.unique_name("Subtitle", 1) == "Subtitle 1"
+
+    def and_it_remembers_names_added_without_searching_the_slide_again(self):
+        spTree = element("p:spTree/p:cNvPr{name=Title 1}")
+        name_index = ShapeNameIndex(spTree)
+        name_index.add("Title 2")
+        spTree.append(element("p:cNvPr{name=Title 3}"))
+
+        assert name_index.unique_name("Title", 1) == "Title 3"
+
+    def but_it_picks_up_names_assigned_outside_it_when_synced(self):
+        spTree = element("p:spTree/p:cNvPr{name=Title 1}")
+        name_index = ShapeNameIndex(spTree)
+        assert "Title 2" not in name_index
+        spTree.append(element("p:cNvPr{name=Title 2}"))
+
+        name_index.sync()
+
+        assert name_index.unique_name("Title", 1) == "Title 3"
+
+
+class DescribeShapeSpatialIndex:
+    """Unit-test suite for `pptx.shapes.shapetree.ShapeSpatialIndex` objects."""
+
+    def it_finds_the_shapes_at_a_point(self, shapes):
+        spatial_index = ShapeSpatialIndex(shapes)
+
+        assert [s.name for s in spatial_index.shapes_at(Emu(60), Emu(60))] == ["E", "A", "B"]
+        assert [s.name for s in spatial_index.shapes_at(Emu(100), Emu(40))] == ["E", "A"]
+        assert [s.name for s in spatial_index.shapes_at(Emu(-1), Emu(0))] == []
+
+    def it_finds_the_shapes_in_a_region(self, shapes):
+        spatial_index = ShapeSpatialIndex(shapes)
+
+        shapes_in = spatial_index.shapes_in(Emu(0), Emu(0), Emu(200), Emu(200))
+        partly_in = spatial_index.shapes_in(Emu(0), Emu(0), Emu(200), Emu(200), partly=True)
+
+        assert [s.name for s in shapes_in] == ["A", "B"]
+        assert [s.name for s in partly_in] == ["E", "A", "B"]
+
+    def it_finds_the_pairs_of_overlapping_shapes(self, shapes):
+        spatial_index = ShapeSpatialIndex(shapes, cell_size=40)
+
+        pairs = spatial_index.overlapping_pairs()
+
+        assert [(a.name, b.name) for a, b in pairs] == [
+            ("E", "A"),
+            ("E", "B"),
+            ("E", "C"),
+            ("E", "D"),
+            ("A", "B"),
+        ]
+        assert pairs[0][0] is pairs[3][0]
+
+    def it_applies_the_offset_and_scaling_of_a_group_to_its_members(self, shapes):
+        spatial_index = ShapeSpatialIndex(shapes)
+
+        assert [s.name for s in spatial_index.shapes_at(Emu(1099), Emu(1099))] == ["E", "D"]
+        assert [s.name for s in spatial_index.shapes_at(Emu(1150), Emu(1150))] == ["E"]
+        assert spatial_index.shapes_at(Emu(25), Emu(25))[-1].name == "A"
+
+    def it_re_records_only_the_shapes_moved_since_the_last_query(self, request, shapes):
+        spatial_index = ShapeSpatialIndex(shapes)
+        assert len(spatial_index.overlapping_pairs()) == 5
+        _rebuild_ = method_mock(request, ShapeSpatialIndex, "_rebuild")
+
+        shapes[2].left = Emu(5000)
+        shapes[4].top = Emu(3000)
+
+        assert [(a.name, b.name) for a, b in spatial_index.overlapping_pairs()] == [
+            ("E", "A"),
+            ("E", "B"),
+            ("E", "C"),
+            ("E", "D"),
+        ]
+        assert [s.name for s in spatial_index.shapes_at(Emu(5050), Emu(60))] == ["E", "B"]
+        assert [s.name for s in spatial_index.shapes_at(Emu(1050), Emu(3050))] == ["E", "D"]
+        _rebuild_.assert_not_called()
+
+    def but_it_rebuilds_itself_after_a_shape_is_added_or_removed(self, shapes):
+        spatial_index = ShapeSpatialIndex(shapes)
+        assert [s.name for s in spatial_index.shapes_at(Emu(350), Emu(50))] == ["E", "C"]
+        spTree = shapes._element
+
+        spTree.remove(spTree[0])
+        spTree[3].append(
+            element(
+                "p:sp/(p:nvSpPr/p:cNvPr{id=8,name=F},p:spPr/a:xfrm/(a:off{x=150,y=0},a:ext{cx=1"
+                "0,cy=10}))"
+            )
+        )
+
+        assert [s.name for s in spatial_index.shapes_at(Emu(350), Emu(50))] == ["C"]
+        assert [s.name for s in spatial_index.shapes_at(Emu(1305), Emu(1005))] == ["F"]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def shapes(self):
+        def sp(id_, name, x, y, cx, cy):
+            return (
+                "p:sp/(p:nvSpPr/p:cNvPr{id=%d,name=%s},p:spPr/a:xfrm/(a:off{x=%d,y=%d},a:ext{cx=%d"
+                ",cy=%d}))" % (id_, name, x, y, cx, cy)
+            )
+
+        # -- the group doubles the size of its members and moves them to (1000, 1000) --
+        grpSp = (
+            "p:grpSp/(p:nvGrpSpPr/p:cNvPr{id=6,name=Group},p:grpSpPr/a:xfrm/(a:off{x=1000,y=1000}"
+            ",a:ext{cx=200,cy=200},a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),%s)"
+            % sp(7, "D", 0, 0, 50, 50)
+        )
+        spTree = element(
+            "p:spTree/(%s,%s,%s,%s,%s)"
+            % (
+                sp(2, "E", 0, 0, 10000, 10000),
+                sp(3, "A", 0, 0, 100, 100),
+                sp(4, "B", 50, 50, 100, 100),
+                sp(5, "C", 300, 0, 100, 100),
+                grpSp,
+            )
+        )
+        return _BaseShapes(spTree, None)
+
+
 class Describe_OleObjectElementCreator(object):
     """Unit-test suite for `pptx.shapes.shapetree._OleObjectElementCreator` objects."""
 
@@ -0,0 +1,53 @@
+"""Unit-test suite for `pptx` package initialization, particularly what `import pptx` costs."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pptx
+
+# -- a backstop against gross startup regressions, generous enough for a slow CI machine. The
+# -- check that heavy dependencies are not imported catches the specific regressions. --
+IMPORT_TIME_BUDGET_SECONDS = 0.6
+
+
+def _import_pptx_in_fresh_interpreter() -> dict[str, object]:
+    """Import `pptx` in a new Python process and report how long it took and what it loaded."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import pptx\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    src_dir = os.path.dirname(os.path.dirname(pptx.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([src_dir, os.environ.get("PYTHONPATH", "")]))
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+class DescribeImportPptx:
+    """Unit-test suite for the cost of `import pptx`."""
+
+    def it_does_not_import_heavy_dependencies_until_they_are_needed(self):
+        modules = _import_pptx_in_fresh_interpreter()["modules"]
+
+        for module_name in (
+            "PIL",
+            "xlsxwriter",
+            "concurrent.futures",
+            "xml.sax.saxutils",
+            "pptx.oxml.chart.plot",
+            "pptx.oxml.chart.series",
+        ):
+            assert module_name not in modules
+
+    def it_imports_within_its_time_budget(self):
+        elapsed = min(_import_pptx_in_fresh_interpreter()["elapsed"] for _ in range(3))
+
+        assert elapsed < IMPORT_TIME_BUDGET_SECONDS
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 import pptx
-from pptx.api import Presentation
+from pptx.api import Presentation, peek
+from pptx.exc import ReadOnlyPackageError
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.serialized import PackageReader
 from pptx.parts.presentation import PresentationPart
+from pptx.summary import PresentationSummary
 
-from .unitutil.mock import class_mock, instance_mock
+from .unitutil.mock import class_mock, function_mock, instance_mock
 
 
 class DescribePresentation(object):
@@ -21,6 +26,99 @@ class DescribePresentation(object):
         Package_.open.assert_called_once_with(path)
         assert prs is prs_
 
+    def it_can_open_a_presentation_that_reads_parts_on_demand(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(path, lazy=True)
+        Package_.open.assert_called_once_with(path, lazy=True)
+        assert prs is prs_
+
+    def it_can_open_a_presentation_from_bytes_in_memory(self):
+        path = os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+        with open(path, "rb") as f:
+            pkg_bytes = f.read()
+
+        prs = pptx.Presentation(memoryview(pkg_bytes))
+
+        assert len(prs.slide_layouts) == 11
+
+    def it_can_round_trip_a_presentation_through_a_directory(self, tmp_path):
+        prs = pptx.Presentation()
+        prs.slides.add_slide(prs.slide_layouts[0])
+        prs.save(str(tmp_path))
+        slide_path = tmp_path / "ppt" / "slides" / "slide1.xml"
+        layout_path = tmp_path / "ppt" / "slideLayouts" / "slideLayout1.xml"
+        os.utime(layout_path, (0, 0))
+
+        prs = pptx.Presentation(str(tmp_path))
+        prs.slides[0].shapes.title.text = "Foobar"
+        prs.save(str(tmp_path))
+
+        assert b"Foobar" in slide_path.read_bytes()
+        assert layout_path.stat().st_mtime == 0
+        assert pptx.Presentation(str(tmp_path)).slides[0].shapes.title.text == "Foobar"
+
+    def it_can_open_a_presentation_read_only(self, tmp_path):
+        path = os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+
+        with pptx.Presentation(path, read_only=True) as prs:
+            assert prs.is_read_only is True
+            assert len(prs.slide_layouts) == 11
+            assert len(prs.slides) == 0
+            with pytest.raises(ReadOnlyPackageError):
+                prs.slides.add_slide(prs.slide_layouts[0])
+            with pytest.raises(ReadOnlyPackageError):
+                prs.save(str(tmp_path / "prs.pptx"))
+
+        assert not (tmp_path / "prs.pptx").exists()
+
+    def and_it_can_be_read_from_more_than_one_thread(self):
+        path = os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+
+        with pptx.Presentation(path, read_only=True) as prs:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                layout_names = list(
+                    executor.map(
+                        lambda idx: (
+                            prs.slide_layouts[idx % 11].slide_master.slide_layouts[idx % 11].name
+                        ),
+                        range(64),
+                    )
+                )
+            masters = {id(layout.slide_master) for layout in prs.slide_layouts}
+
+        assert layout_names[:11] == [layout.name for layout in prs.slide_layouts]
+        assert len(masters) == 1
+
+    @pytest.mark.parametrize("read_only", [False, True])
+    def it_can_open_only_some_of_the_slides(self, read_only):
+        prs = pptx.Presentation()
+        for idx in range(6):
+            prs.slides.add_slide(prs.slide_layouts[idx % 2]).shapes.title.text = "S%d" % idx
+        pkg_file = io.BytesIO()
+        prs.save(pkg_file)
+
+        prs = pptx.Presentation(pkg_file.getvalue(), slides=range(2, 4), read_only=read_only)
+
+        assert [slide.shapes.title.text for slide in prs.slides] == ["S2", "S3"]
+        assert prs.slide_layouts[0].name == "Title Slide"
+
+    def and_it_can_save_those_slides_as_a_smaller_presentation(self):
+        path = os.path.join(os.path.split(pptx.__file__)[0], "templates", "default.pptx")
+        prs = pptx.Presentation(path)
+        for idx in range(6):
+            prs.slides.add_slide(prs.slide_layouts[0]).shapes.title.text = "S%d" % idx
+        pkg_file = io.BytesIO()
+        prs.save(pkg_file)
+
+        prs = pptx.Presentation(pkg_file.getvalue(), slides=(5, 1))
+        subset_file = io.BytesIO()
+        prs.save(subset_file)
+
+        prs = pptx.Presentation(subset_file)
+        assert [slide.shapes.title.text for slide in prs.slides] == ["S1", "S5"]
+        assert len(list(prs.part.package.iter_parts())) == 23
+        assert len(subset_file.getvalue()) < len(pkg_file.getvalue())
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -46,3 +144,20 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribePeek:
+    """Unit-test suite for `pptx.api.peek()`."""
+
+    def it_reads_a_summary_of_the_presentation(self, request):
+        summary_ = instance_mock(request, PresentationSummary)
+        package_reader_ = instance_mock(request, PackageReader)
+        PackageReader_ = class_mock(request, "pptx.api.PackageReader", return_value=package_reader_)
+        read_summary_ = function_mock(request, "pptx.api.read_summary", return_value=summary_)
+
+        summary = peek("foobar.pptx")
+
+        PackageReader_.assert_called_once_with("foobar.pptx", lazy=True)
+        read_summary_.assert_called_once_with(package_reader_)
+        package_reader_.close.assert_called_once_with()
+        assert summary is summary_
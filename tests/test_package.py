@@ -53,6 +53,19 @@ class DescribePackage(object):
         partname = package.next_media_partname(ext)
         assert partname == expected_value
 
+    def it_discards_its_sha1_indexes_when_a_relationship_is_dropped(self, request):
+        image_parts_ = instance_mock(request, _ImageParts)
+        media_parts_ = instance_mock(request, _MediaParts)
+        property_mock(request, Package, "_image_parts", return_value=image_parts_)
+        property_mock(request, Package, "_media_parts", return_value=media_parts_)
+        package = Package(None)
+
+        package._parts_dropped()
+
+        image_parts_.discard_index.assert_called_once_with()
+        media_parts_.discard_index.assert_called_once_with()
+        assert package._partname_index is None
+
     def it_provides_access_to_its_MediaParts_object(self, m_parts_fixture):
         package, _MediaParts_, media_parts_ = m_parts_fixture
         media_parts = package._media_parts
@@ -203,6 +216,37 @@ class Describe_ImageParts(object):
 
         assert result == png_part_
 
+    def it_indexes_the_image_parts_by_sha1_only_once(self, request, _iter_):
+        image_part_ = instance_mock(request, ImagePart, sha1="f00beed")
+        _iter_.return_value = iter((image_part_,))
+        image_parts = _ImageParts(None)
+
+        assert image_parts._find_by_sha1("f00beed") is image_part_
+        assert image_parts._find_by_sha1("deadbeef") is None
+        _iter_.assert_called_once_with(image_parts)
+
+        image_parts.discard_index()
+        _iter_.return_value = iter(())
+
+        assert image_parts._find_by_sha1("f00beed") is None
+        assert _iter_.call_count == 2
+
+    def and_it_adds_a_new_image_part_to_the_index(
+        self, package_, Image_, image_, ImagePart_, image_part_, _iter_
+    ):
+        Image_.from_file.return_value = image_
+        image_.sha1 = "f00beed"
+        ImagePart_.new.return_value = image_part_
+        _iter_.return_value = iter(())
+        image_parts = _ImageParts(package_)
+
+        image_parts.get_or_add_image_part("image.png")
+        image_part = image_parts.get_or_add_image_part("image.png")
+
+        ImagePart_.new.assert_called_once_with(package_, image_)
+        _iter_.assert_called_once_with(image_parts)
+        assert image_part is image_part_
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -291,6 +335,21 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def it_indexes_the_media_parts_by_sha1_until_told_to_discard_it(
+        self, request, _iter_, media_part_
+    ):
+        media_part_.sha1 = "f00beed"
+        _iter_.return_value = iter((media_part_,))
+        media_parts = _MediaParts(None)
+
+        assert media_parts._find_by_sha1("f00beed") is media_part_
+        assert media_parts._find_by_sha1("f00beed") is media_part_
+        media_parts.discard_index()
+        _iter_.return_value = iter(())
+
+        assert media_parts._find_by_sha1("f00beed") is None
+        assert _iter_.call_count == 2
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.package import Package
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
@@ -74,7 +75,17 @@ class DescribePresentation(object):
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, None, None)
+
+    def it_closes_its_package_on_exit_from_a_with_block(self, request, prs_part_):
+        package_ = instance_mock(request, Package)
+        prs_part_.package = package_
+
+        with Presentation(None, prs_part_) as prs:
+            assert isinstance(prs, Presentation)
+            package_.close.assert_not_called()
+
+        package_.close.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -180,6 +191,7 @@ class DescribePresentation(object):
     def slides_fixture(self, request, part_prop_, Slides_, slides_):
         prs_cxml, rIds, expected_cxml = request.param
         prs = Presentation(element(prs_cxml), None)
+        part_prop_.return_value.package.is_read_only = False
         rename_slide_parts_ = part_prop_.return_value.rename_slide_parts
         expected_xml = xml(expected_cxml)
         return prs, rename_slide_parts_, rIds, Slides_, slides_, expected_xml
@@ -458,8 +458,9 @@ class DescribeSlides(object):
             slides[2]
 
     def it_knows_the_index_of_a_slide_it_contains(self, index_fixture):
-        slides, slide, expected_value = index_fixture
+        slides, slide, prs_part_, expected_value = index_fixture
         index = slides.index(slide)
+        prs_part_.slide_idx.assert_called_once_with(slide.part)
         assert index == expected_value
 
     def it_raises_on_slide_not_in_collection(self, raises_fixture):
@@ -535,13 +536,13 @@ class DescribeSlides(object):
         return slides
 
     @pytest.fixture(params=[0, 1])
-    def index_fixture(self, request, part_prop_):
+    def index_fixture(self, request, part_prop_, prs_part_, slide_part_):
         idx = request.param
         sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
         slides = Slides(sldIdLst, None)
-        _slides = [Slide(element("p:sld"), None), Slide(element("p:sld"), None)]
-        part_prop_.return_value.related_slide.side_effect = _slides
-        return slides, _slides[idx], idx
+        slide = Slide(element("p:sld"), slide_part_)
+        prs_part_.slide_idx.return_value = idx
+        return slides, slide, prs_part_, idx
 
     @pytest.fixture
     def iter_fixture(self, part_prop_, slide_):
@@ -566,9 +567,10 @@ class DescribeSlides(object):
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, part_prop_, prs_part_, slide_part_):
         slides = Slides(element("p:sldIdLst"), None)
-        slide = Slide(element("p:sld"), None)
+        slide = Slide(element("p:sld"), slide_part_)
+        prs_part_.slide_idx.side_effect = ValueError
         return slides, slide
 
     # fixture components ---------------------------------------------
@@ -589,6 +591,10 @@ class DescribeSlides(object):
     def slide_layout_(self, request):
         return instance_mock(request, SlideLayout)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
 
 class DescribeSlideLayout(object):
     """Unit-test suite for `pptx.slide.SlideLayout` objects."""
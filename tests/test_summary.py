@@ -0,0 +1,124 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit-test suite for `pptx.summary` module."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from pptx import Presentation
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import PackageReader
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.summary import (
+    CorePropertiesSummary,
+    PresentationSummary,
+    _SummaryReader,
+    read_summary,
+)
+
+from .unitutil.file import absjoin, test_file_dir
+from .unitutil.mock import function_mock
+
+
+class DescribeCorePropertiesSummary:
+    """Unit-test suite for `pptx.summary.CorePropertiesSummary` objects."""
+
+    def it_can_construct_from_coreProperties_xml(self):
+        coreProperties = parse_xml(
+            "<cp:coreProperties %s>\n"
+            "  <dc:title>Foo</dc:title>\n"
+            "  <dc:creator>Bar</dc:creator>\n"
+            "  <cp:revision>9</cp:revision>\n"
+            '<dcterms:modified xsi:type="dcterms:W3CDTF">2013-01-12T21:22:07Z</dcterms:modified>\n'
+            "</cp:coreProperties>" % nsdecls("cp", "dc", "dcterms", "xsi")
+        )
+
+        core_properties = CorePropertiesSummary.from_xml(coreProperties)
+
+        assert core_properties.title == "Foo"
+        assert core_properties.author == "Bar"
+        assert core_properties.revision == 9
+        assert core_properties.modified == dt.datetime(2013, 1, 12, 21, 22, 7)
+        assert core_properties.subject == ""
+        assert core_properties.created is None
+
+
+class DescribeReadSummary:
+    """Unit-test suite for `pptx.summary.read_summary()`."""
+
+    @pytest.mark.parametrize(
+        "filename", ["test.pptx", "test_slides.pptx", "no-slides.pptx", "expanded_pptx"]
+    )
+    def it_reads_the_same_values_as_a_loaded_presentation(self, filename):
+        path = absjoin(test_file_dir, filename)
+        prs = Presentation(path)
+
+        summary = read_summary(PackageReader(path))
+
+        assert isinstance(summary, PresentationSummary)
+        assert summary.core_properties.title == prs.core_properties.title
+        assert summary.core_properties.revision == prs.core_properties.revision
+        assert summary.core_properties.modified == prs.core_properties.modified
+        assert summary.slide_count == len(prs.slides)
+        assert summary.slide_titles == tuple(
+            None if slide.shapes.title is None else slide.shapes.title.text_frame.text
+            for slide in prs.slides
+        )
+
+    def it_provides_empty_core_properties_when_the_package_has_none(self):
+        summary = read_summary(PackageReader(absjoin(test_file_dir, "no-core-props.pptx")))
+
+        assert summary.core_properties.title == ""
+        assert summary.core_properties.revision == 0
+        assert summary.slide_titles == ("Minimal Deck",)
+
+    def it_does_not_construct_any_parts(self, request):
+        PartFactory_ = function_mock(request, "pptx.opc.package.PartFactory")
+
+        read_summary(PackageReader(absjoin(test_file_dir, "test.pptx")))
+
+        PartFactory_.assert_not_called()
+
+    def but_it_raises_when_the_package_is_not_a_presentation(self):
+        package_reader = {
+            PackURI("/_rels/.rels"): (
+                b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+                b'relationships"><Relationship Id="rId1" Target="word/document.xml" Type="http:'
+                b'//schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+                b"</Relationships>"
+            ),
+            PackURI("/word/document.xml"): (
+                b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/'
+                b'main"/>'
+            ),
+        }
+
+        with pytest.raises(ValueError, match="not a PowerPoint presentation"):
+            read_summary(package_reader)  # pyright: ignore[reportArgumentType]
+
+
+class Describe_SummaryReader:
+    """Unit-test suite for `pptx.summary._SummaryReader` objects."""
+
+    def it_encodes_title_text_like_a_text_frame(self):
+        slide_xml = (
+            "<p:sld %s><p:cSld><p:spTree>\n"
+            "  <p:grpSp><p:sp><p:nvSpPr><p:cNvPr/><p:cNvSpPr/><p:nvPr><p:ph/></p:nvPr>"
+            "</p:nvSpPr><p:txBody><a:p><a:r><a:t>Nested</a:t></a:r></a:p></p:txBody></p:sp>"
+            "</p:grpSp>\n"
+            '  <p:sp><p:nvSpPr><p:cNvPr/><p:cNvSpPr/><p:nvPr><p:ph idx="1"/></p:nvPr></p:nvSpPr>'
+            "<p:txBody><a:p><a:r><a:t>Body</a:t></a:r></a:p></p:txBody></p:sp>\n"
+            '  <p:sp><p:nvSpPr><p:cNvPr/><p:cNvSpPr/><p:nvPr><p:ph type="title"/></p:nvPr>'
+            "</p:nvSpPr><p:txBody><a:bodyPr/><a:p><a:r><a:t>Foo</a:t></a:r><a:br/>"
+            "<a:fld><a:t>Bar</a:t></a:fld></a:p><a:p/><a:p><a:r><a:t/></a:r></a:p>"
+            "</p:txBody></p:sp>\n"
+            "</p:spTree></p:cSld></p:sld>" % nsdecls("a", "p")
+        ).encode("utf-8")
+        partname = PackURI("/ppt/slides/slide1.xml")
+        summary_reader = _SummaryReader({partname: slide_xml})  # pyright: ignore
+
+        assert summary_reader._slide_title(partname) == "Foo\vBar\n\n"
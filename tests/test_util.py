@@ -4,7 +4,19 @@ from __future__ import annotations
 
 import pytest
 
-from pptx.util import Centipoints, Cm, Emu, Inches, Length, Mm, Pt
+from pptx.util import (
+    Centipoints,
+    Cm,
+    Emu,
+    Inches,
+    Length,
+    Mm,
+    Pt,
+    identity_mapped,
+    proxy_identity_map,
+)
+
+from .unitutil.cxml import element
 
 
 class DescribeLength(object):
@@ -51,3 +63,31 @@ class DescribeLength(object):
     def units_fixture(self, request):
         emu, units_prop_name, expected_length_in_units = request.param
         return emu, units_prop_name, expected_length_in_units
+
+
+class DescribeProxyIdentityMap(object):
+    """Unit-test suite for `pptx.util.proxy_identity_map()` and `identity_mapped()`."""
+
+    def it_creates_a_new_proxy_each_time_outside_a_proxy_identity_map_block(self):
+        sp, owner = element("p:sp"), object()
+        assert identity_mapped(sp, owner, object) is not identity_mapped(sp, owner, object)
+
+    def it_reuses_the_proxy_for_the_same_element_and_owner_within_the_block(self):
+        sp, owner = element("p:sp"), object()
+
+        with proxy_identity_map():
+            proxy = identity_mapped(sp, owner, object)
+            assert identity_mapped(sp, owner, object) is proxy
+            assert identity_mapped(sp, object(), object) is not proxy
+            assert identity_mapped(element("p:sp"), owner, object) is not proxy
+
+        assert identity_mapped(sp, owner, object) is not proxy
+
+    def and_a_nested_block_uses_the_map_of_the_outer_one(self):
+        sp, owner = element("p:sp"), object()
+
+        with proxy_identity_map():
+            proxy = identity_mapped(sp, owner, object)
+            with proxy_identity_map():
+                assert identity_mapped(sp, owner, object) is proxy
+            assert identity_mapped(sp, owner, object) is proxy
@@ -16,7 +16,7 @@ from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import XmlPart
 from pptx.shapes.autoshape import Shape
 from pptx.text.text import Font, TextFrame, _Hyperlink, _Paragraph, _Run
-from pptx.util import Inches, Pt
+from pptx.util import Inches, Pt, proxy_identity_map
 
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
 from ..unitutil.cxml import element, xml
@@ -145,6 +145,19 @@ class DescribeTextFrame(object):
             assert isinstance(paragraph, _Paragraph)
             assert paragraph._element is ps[idx]
 
+    def it_reuses_its_paragraph_run_and_font_proxies_within_a_proxy_identity_map_block(self):
+        text_frame = TextFrame(element('p:txBody/(a:bodyPr,a:lstStyle,a:p/a:r/a:t"foo")'), None)
+
+        with proxy_identity_map():
+            paragraph = text_frame.paragraphs[0]
+            run = paragraph.runs[0]
+            assert text_frame.paragraphs[0] is paragraph
+            assert paragraph.runs[0] is run
+            assert run.font is run.font
+            assert paragraph.font is paragraph.font
+            assert text_frame.font is text_frame.font
+        assert text_frame.paragraphs[0] is not paragraph
+
     def it_raises_on_attempt_to_set_margin_to_non_int(self):
         text_frame = TextFrame(element("p:txBody/a:bodyPr"), None)
         with pytest.raises(TypeError):